@@ -9,13 +9,23 @@ clickable widget representation with which users can interact.
 __author__ = 'Oscar Nuki'
 
 from .utils.backend import (getmain, envtodict, envtopandas, envtohtmltable, 
-                           getattrsafe, maineval, EnvObj, EnvDict, EnvDf)
+                           envnamespace, envitems, envgetters, envchunks, 
+                           envdiff, envslow, envinfer, envconcat, envpatch, 
+                           envrefresh, estimatesize, getattrsafe, safecall, 
+                           safeattr, maineval, EnvPath,
+                           attrkind, LazyAttr, Quarantine, TypeInfo, 
+                           TypeCache, typecache, EnvObj, EnvDict, EnvDf)
 
-from .utils.frontend import (usename, hboxes, vboxes, arrange, ishtml,
-                            showobj, runperiodic, runperiodicfactory, 
-                            Printed, HTMLCode, LoadingButton, ClearButton,
+from .utils.frontend import (usename, uselabel, LabelRepr, LabelCache, 
+                            labelcache, hboxes, vboxes, arrange, ishtml,
+                            showobj, showcell, MessageCounter, WidgetPool, 
+                            closewidgets, inthread, CoalescingExecutor, runperiodic, 
+                            runperiodicfactory, PeriodicScheduler, Debouncer,
+                            Printed, HTMLCode, LoadingButton, ClearButton, 
                             PausePlayButton)
 
-from .processing import EnvHandler
+from .processing import (EnvHandler, SnapshotHub, SubenvCache, EnvPrefetcher, 
+                         EnvTree, EnvNode)
 
-from .interface import (WidgetCell, WidgetDf, WidgetEnv, AutoWidgetEnv)
\ No newline at end of file
+from .interface import (WidgetCell, WidgetDf, WidgetEnv, AutoWidgetEnv, 
+                        WidgetTree)
\ No newline at end of file
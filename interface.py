@@ -1,30 +1,40 @@
 import re
+import html
 import inspect
 import time
+import asyncio
+import warnings
+import weakref
 import pandas as pd
 import numpy as np
 import ipywidgets as ipw
 import traitlets as tra
 from multiprocessing import Process
 from datetime import datetime
-from IPython import display
+from IPython import display, get_ipython
 from collections.abc import Iterator
+from concurrent.futures import Future
 
 try:
     from utils import frontend as utils
-    from processing import EnvHandeler
+    from processing import EnvHandeler, SnapshotHub, EnvTree, EnvNode, EnvPrefetcher
 except ImportError:
     from .utils import frontend as utils
-    from .processing import EnvHandeler
+    from .processing import EnvHandeler, SnapshotHub, EnvTree, EnvNode, EnvPrefetcher
 
 class WidgetCell(ipw.Button):
     '''
     WidgetCell(use_iloc: bool=False, index: Any, column: Any,
-        owner: pd.DataFrame, out: ipw.Output=ipw.Output())
+        owner: pd.DataFrame, out: ipw.Output=ipw.Output(), 
+        position: tuple=None, values: np.ndarray=None)
     
     Child of ipywidgets' Button class for representing a cell of
     a data frame by the WidgetDf class.
     
+    If given values, the cell is bound to its (row, column) position in 
+    them and its value is read by plain array indexing instead of ``loc``
+    or ``iloc``.  The 'index' and 'column' traits are then only labels.
+    
     See ``ipywidgets.Button`` and ``WidgetDf`` for more infomation.
     
     Parameters:
@@ -39,36 +49,42 @@ class WidgetCell(ipw.Button):
         out (ipw.Output): Ipywidgets' Output widget in which the cell's
             value will be displayed upon being clicked (default is 
             ``ipw.Output()``).
+        position (tuple): Integer (row, column) position of the cell in
+            ``values`` (default is None).
+        values (np.ndarray): 2 dimentional object array of the values of
+            ``owner``, e.g. ``WidgetDf.values_``.  If None, ``owner`` is
+            indexed by label instead (default is None).
     '''
     
+    value = tra.Any()
+    index = tra.Any()
+    column = tra.Any()
+    
     def __init__(self,
                  use_iloc: bool=False,
                  index: 'Any'=None,
                  column: 'Any'=None,
                  owner: pd.DataFrame=None,
                  out: ipw.Output=ipw.Output(),
+                 position: tuple=None,
+                 values: np.ndarray=None,
                  **kwargs):
         super().__init__(**kwargs)
         
         self.use_iloc = use_iloc
         self.owner = owner
         self.out = out
-        
-        self.add_traits(
-            value=tra.Any(), 
-            index=tra.Any(),
-            column=tra.Any(),
-        )
-        
+        self.position = position
+        self.values = values
         self.index = index
         self.column = column
         
-        self.observe(self.update, names=[
+        self.observe(self.relocate, names=[
             'column', 'index',
         ])
         
         self.on_click(self.click)
-        self.update(self.getvalue())
+        self.update()
         
     @property
     def fromowner_(self) -> bool:
@@ -85,16 +101,22 @@ class WidgetCell(ipw.Button):
         '''
         self.getvalue(value: Any=None) -> Any
         
-        If the value passed is None, the value of the cell in ``self.owner``
-        with the index ``self.index`` and column ``self.column``.  Otherwise 
-        the given value is returned.
+        If the value passed is None, the value of the cell at 
+        ``self.position`` in ``self.values``, or if there are no values, 
+        in ``self.owner`` with the index ``self.index`` and column 
+        ``self.column``.  Otherwise the given value is returned.
         
         Parameters:
         -----------
             value (Any): Either None or the value to be returned (default is
                 None).
         '''
-        value = self.value if value is None else value
+        if value is not None:
+            return value
+        
+        if self.values is not None:
+            return self.values[self.position]
+        
         return self.loc_[self.index, self.column]
         
     def setvalue(self, *args, **kwargs) -> None:
@@ -116,7 +138,8 @@ class WidgetCell(ipw.Button):
         '''
         self.update(value: Any=None) -> Any
         
-        Updates the 'value', 'description' and 'tooltip' traits.
+        Updates the 'value', 'description' and 'tooltip' traits.  The
+        changes are sent to the front-end together, in a single message.
         
         See ``self.setvalue`` and ``self.setdesc`` for more infomation.
         
@@ -125,18 +148,135 @@ class WidgetCell(ipw.Button):
             value (Any): value argument passed to ``self.setvalue`` (default is
                 None).
         '''
-        self.setvalue(value)
-        self.setdesc()
+        with self.hold_sync():
+            self.setvalue(value)
+            self.setdesc()
+        
+    def relocate(self, change: tra.Bunch) -> None:
+        '''
+        self.relocate(change: tra.Bunch) -> None
+        
+        Observer of the 'index' and 'column' traits which updates the cell
+        from ``self.owner``.
+        
+        See ``self.update`` for more infomation.
+        
+        Parameters:
+        -----------
+            change (tra.Bunch): Widget event.
+        '''
+        self.update()
+        
+    def refresh(self, 
+                owner: pd.DataFrame=None, 
+                values: np.ndarray=None, 
+                position: tuple=None) -> bool:
+        '''
+        self.refresh(owner: pd.DataFrame=None, values: np.ndarray=None, 
+            position: tuple=None) -> bool
+        
+        Inplace method for re-reading the cell from ``self.owner`` (or
+        ``self.values``), after replacing the attributes with any of the
+        given arguments which are not None.  The traits are only updated if
+        the value is a different object or its label changed (e.g. it was
+        mutated inplace).  Returns weather the cell changed.
+        
+        See ``self.update`` for more infomation.
+        
+        Parameters:
+        -----------
+            owner (pd.DataFrame): New 'owner' attribute (default is None).
+            values (np.ndarray): New 'values' attribute (default is None).
+            position (tuple): New 'position' attribute (default is None).
+        '''
+        self.owner = self.owner if owner is None else owner
+        self.values = self.values if values is None else values
+        self.position = self.position if position is None else position
+        value = self.getvalue()
+        
+        if value is self.value:
+            label = utils.uselabel(value)
+            
+            if label == self.description:
+                return False
+            
+            with self.hold_sync():
+                self.description = self.tooltip = label
+                
+            return True
+        
+        self.update(value)
+        
+        return True
+    
+    def rebind(self, 
+               owner: pd.DataFrame, 
+               index: 'Any', 
+               column: 'Any', 
+               out: ipw.Output=None,
+               position: tuple=None,
+               values: np.ndarray=None) -> None:
+        '''
+        self.rebind(owner: pd.DataFrame, index: Any, column: Any, 
+            out: ipw.Output=None, position: tuple=None, 
+            values: np.ndarray=None) -> None
         
+        Inplace method for pointing a (e.g. pooled) cell at a new position,
+        and possibly a new DataFrame and Output widget, and updating it.
+        Both traits are set before 'relocate' is notified, so the cell is
+        never read from a mix of its old and new positions.
+        
+        See ``self.update`` and ``utils.WidgetPool`` for more infomation.
+        
+        Parameters:
+        -----------
+            owner (pd.DataFrame): New 'owner' attribute.
+            index (Any): New 'index' trait.
+            column (Any): New 'column' trait.
+            out (ipw.Output): New 'out' attribute.  If None, the 'out' 
+                attribute is left as is (default is None).
+            position (tuple): New 'position' attribute (default is None).
+            values (np.ndarray): New 'values' attribute (default is None).
+        '''
+        try:
+            moved = not bool(index == self.index and column == self.column)
+        except Exception:
+            moved = True
+            
+        self.owner = owner
+        self.out = self.out if out is None else out
+        self.position = position
+        self.values = values
+        
+        with self.hold_sync():
+            with self.hold_trait_notifications():
+                self.index = index
+                self.column = column
+                
+            self.update() if not moved else None
+        
+    def unbind(self) -> None:
+        '''
+        self.unbind() -> None
+        
+        Inplace method for dropping the references of a detached cell to its
+        DataFrame, values, value and Output widget, so a pooled cell does 
+        not keep them alive.
+        '''
+        self.owner = None
+        self.values = None
+        self.value = None
+        self.out = None
+    
     def getdesc(self) -> str:
         '''
         self.getdesc() -> str
         
         Returns the appropriate description and tooltip.
         
-        See ``utils.usename`` for more infomation.
+        See ``utils.uselabel`` for more infomation.
         '''
-        return utils.usename(self.value)
+        return utils.uselabel(self.value)
     
     def setdesc(self) -> None:
         '''
@@ -153,31 +293,30 @@ class WidgetCell(ipw.Button):
         self.click(button: WidgetCell) -> None
         
         For adding to the buttons on_click functions.  It displays the value of 
-        the cell using ``utils.showobj`` in the 'out' attribute.
+        the cell using ``utils.showcell`` in the 'out' attribute.
         
-        See ``utils.showobj`` for more infomation.
+        See ``utils.showcell`` for more infomation.
         
         Parameters:
         -----------
             button (WidgetCell): Should generally be self.
         '''
-        head = f'{button.index} - {button.column}'
-        
-        with self.out:
-            print('\n'+inspect.cleandoc(f'''
-            {head}
-            {"="*len(head)}
-            '''))
-            utils.showobj(button.value)
+        utils.showcell(button.value, f'{button.index} - {button.column}', self.out)
 
 class WidgetDf(ipw.VBox):
     '''
-    WidgetDf(data: pd.DataFrame, out: ipw.Output, **kwargs)
+    WidgetDf(data: pd.DataFrame, out: ipw.Output, page_size: int=None, 
+        renderer: str='cells', **kwargs)
     
     Widget for representing pandas Data Frames.  It inherits from 
     ipywidgets' VBox class.  Each cell is represented by a WidgetCell
     object.
     
+    If a page size is given, only the rows of the current page ('page' 
+    trait) are represented and controls for changing the page are added
+    to the 'button_box' attribute, so the number of widgets does not grow
+    with the size of the DataFrame.
+    
     See ``ipywidgets.VBox`` and ``WidgetCell`` for more infomation.
     
     Parameters:
@@ -186,25 +325,59 @@ class WidgetDf(ipw.VBox):
             attribute of each cell.
         out (ipw.Output): Any ipw.Output object, used as the 'out' 
             attribute of each cell (default is ``ipw.Output()``).
+        page_size (int): Maximum number of rows shown at once.  If None, 
+            all rows are shown (default is None).
+        renderer (str): How the table is represented. One of:
+                - 'cells': A WidgetCell per cell and a Label per index 
+                  item, in an HBox per row.
+                - 'table': A single ToggleButtons widget (the 'table'
+                  attribute) with a button per cell and index item, 
+                  wrapped into rows, under a single HTML header, so the
+                  number of widgets does not depend on the size of the
+                  table (see ``self.rendertable``).
+            (default is 'cells').
         **kwargs: Key word arguments used to initalise the parent
             (ipw.VBox).
     '''
     cell_layout = ipw.Layout(width='150px')
     index_layout = ipw.Layout(width='100px')
     column_layout = ipw.Layout(width=cell_layout.width)
+    row_layout = ipw.Layout()
+    table_cell_width = 150
+    table_cell_margin = 2
+    pool = utils.WidgetPool()
+    cell_style = ipw.ButtonStyle()
+    label_style = getattr(ipw.widgets.widget_string, 'LabelStyle',
+                          ipw.widgets.widget_description.DescriptionStyle)()
+    page_button_layout = ipw.Layout(width='40px')
+    page_text_layout = ipw.Layout(width='80px')
     
     def __init__(self, 
                  data: pd.DataFrame, 
                  out: ipw.Output=ipw.Output(),
+                 page_size: int=None,
+                 renderer: str='cells',
                  **kwargs):
         super().__init__(**kwargs)
-        self.add_traits(data=tra.Any())
+        self.add_traits(data=tra.Any(), page=tra.Int(0))
         self.data = data
         self.out = out
+        self.page_size = page_size
+        self.owns_out = False
+        self.displayed = False
+        self.values_source = (None, None)
+        self.renderer = renderer
+        self.table = None
+        self.header = None
+        self.header_key = None
+        self.messages = utils.MessageCounter()
+        self.rows = {}
+        self.keyed = True
         self.clear_button = utils.ClearButton(self.out)
         self.setbuttonbox()
+        self.setpagebox() if page_size else None
         self.setchildren()
-        self.observe(self.setchildren, names='data')
+        self.observe(self.setchildren, names=['data', 'page'])
         
     @property
     def loc_(self) -> pd.core.indexing._LocIndexer:
@@ -220,7 +393,57 @@ class WidgetDf(ipw.VBox):
         '''
         return self.data.iloc
     
+    @property
+    def pages_(self) -> int:
+        '''
+        Number of pages, at least 1.
+        '''
+        if not self.page_size:
+            return 1
+        
+        return max(1, -(-len(self.data.index) // self.page_size))
+    
+    @property
+    def page_(self) -> int:
+        '''
+        The 'page' trait limited to the pages available.
+        '''
+        return max(0, min(self.page, self.pages_ - 1))
+    
+    @property
+    def index_(self) -> pd.Index:
+        '''
+        Items of ``self.data.index`` on the current page.
+        '''
+        if not self.page_size:
+            return self.data.index
+        
+        return self.data.index[self.start_:self.start_ + self.page_size]
+    
+    @property
+    def start_(self) -> int:
+        '''
+        Position in ``self.data`` of the first row of the current page.
+        '''
+        return self.page_ * self.page_size if self.page_size else 0
+    
+    @property
+    def values_(self) -> np.ndarray:
+        '''
+        2 dimentional object array of the values of ``self.data``, to which
+        the cells are bound by position.  It is created once per DataFrame
+        assigned to the 'data' trait.
+        '''
+        data, values = self.values_source
+        
+        if data is not self.data:
+            values = self.data.to_numpy(dtype=object)
+            self.values_source = (self.data, values)
+            
+        return values
+    
     def _ipython_display_(self) -> None:
+        self.displayed = True
         display.display(super(), self.button_box, self.out)
         
     def getbuttonbox(self) -> ipw.HBox:
@@ -242,12 +465,78 @@ class WidgetDf(ipw.VBox):
         '''
         self.button_box = self.getbuttonbox()
         
-    def getcell(self, index: 'Any', column: 'Any') -> WidgetCell:
+    def setpage(self, page: int) -> None:
+        '''
+        self.setpage(page: int) -> None
+        
+        Inplace method for setting the 'page' trait, limited to the pages
+        available.
+        
+        Parameters:
+        -----------
+            page (int): Index of the page, starting at 0.
+        '''
+        self.page = max(0, min(page, self.pages_ - 1))
+    
+    def getpagebox(self) -> ipw.HBox:
+        '''
+        self.getpagebox() -> ipw.HBox
+        
+        Returns an ipywidgets HBox containing the previous and next page
+        buttons, a text box for jumping to a page and a label of the number
+        of pages.
+        '''
+        cls = self.__class__
+        prev_button = ipw.Button(icon='chevron-left', layout=cls.page_button_layout)
+        next_button = ipw.Button(icon='chevron-right', layout=cls.page_button_layout)
+        self.page_text = ipw.BoundedIntText(value=1, min=1, max=self.pages_,
+                                            layout=cls.page_text_layout)
+        self.page_label = ipw.Label()
+        
+        prev_button.on_click(lambda button: self.setpage(self.page_ - 1))
+        next_button.on_click(lambda button: self.setpage(self.page_ + 1))
+        self.page_text.observe(
+            lambda change: self.setpage(change.new - 1), names='value'
+        )
+        
+        return ipw.HBox((prev_button, self.page_text, self.page_label, next_button))
+    
+    def setpagebox(self) -> None:
+        '''
+        self.setpagebox() -> None
+        
+        Inplace method for creating the 'page_box' attribute and adding it
+        to the children of the 'button_box' attribute.
+        
+        See ``self.getpagebox`` for more infomation.
         '''
-        self.getcell(index: Any, column: Any) -> WidgetCell
+        self.page_box = self.getpagebox()
+        self.button_box.children += (self.page_box,)
+        
+    def updatepagebox(self) -> None:
+        '''
+        self.updatepagebox() -> None
+        
+        Inplace method for updating the page controls to match the current
+        page and number of pages.  Does nothing if there is no page size.
+        '''
+        if not self.page_size:
+            return
+        
+        with self.page_text.hold_sync():
+            self.page_text.max = self.pages_
+            self.page_text.value = self.page_ + 1
+            
+        self.page_label.value = f'of {self.pages_} ({len(self.data.index)} rows)'
+    
+    def getcell(self, index: 'Any', column: 'Any', position: tuple=None) -> WidgetCell:
+        '''
+        self.getcell(index: Any, column: Any, position: tuple=None) 
+            -> WidgetCell
         
         Returns a WidgetCell object representing the cell in ``self.data`` at
-        the given column and index.
+        the given column and index.  If a position is given, the cell is 
+        bound to it in ``self.values_``.
         
         See ``WidgetCell`` for more infomation.
         
@@ -255,6 +544,8 @@ class WidgetDf(ipw.VBox):
         -----------
             index (Any): Index of the cell in self.data.
             column (Any): Column of the cell in self.data.
+            position (tuple): Integer (row, column) position of the cell in
+                self.data (default is None).
         '''
         return WidgetCell(
             use_iloc=False,
@@ -262,7 +553,10 @@ class WidgetDf(ipw.VBox):
             index=index,
             column=column,
             out=self.out,
-            layout=self.__class__.cell_layout
+            position=position,
+            values=None if position is None else self.values_,
+            layout=self.__class__.cell_layout,
+            style=self.__class__.cell_style,
         )
     
     def getindex(self, index: 'Any') -> ipw.Label:
@@ -277,7 +571,8 @@ class WidgetDf(ipw.VBox):
         -----------
             index (Any): Item of an index.
         '''
-        return ipw.Label(str(index), layout=self.__class__.index_layout)
+        return ipw.Label(str(index), layout=self.__class__.index_layout, 
+                         style=self.__class__.label_style)
     
     def getcolumn(self, column: 'Any') -> ipw.Label:
         '''
@@ -291,37 +586,40 @@ class WidgetDf(ipw.VBox):
         -----------
             column (Any): Column name.
         '''
-        return ipw.Label(str(column), layout=self.__class__.column_layout)
+        return ipw.Label(str(column), layout=self.__class__.column_layout, 
+                         style=self.__class__.label_style)
     
-    def getrow(self, index: 'Any') -> tuple:
+    def getrow(self, index: 'Any', row: int=None) -> tuple:
         '''
-        self.getrow(index: Any) -> tuple
+        self.getrow(index: Any, row: int=None) -> tuple
         
         Returns the appropriate tuple of widgets to represent the row in
-        ``self.data`` at the given index.
+        ``self.data`` at the given index.  If the position of the row is 
+        given, its cells are bound by position.
         
         See ``self.getindex`` and ``self.getcell`` for more infomation.
         
         Parameters:
         ----------
             index (Any): Item in ``self.data.index``.
+            row (int): Position of the row in ``self.data`` (default is 
+                None).
         '''
-        return (self.getindex(index), *tuple(pd.Series(self.data.columns).apply(
-            lambda col: self.getcell(index, col)
-        ).values))
+        return (self.getindex(index), *(
+            self.getcell(index, column, None if row is None else (row, col)) 
+            for col, column in enumerate(self.data.columns)
+        ))
     
     def getrows(self) -> tuple:
         '''
         self.getrows() -> tuple
         
         Returns a tuple of tuples, with each inner tuple being generated by
-        ``self.getrow`` for a given index.
+        ``self.getrow`` for a given index on the current page.
         
-        See ``self.getrow`` for more infomation.
+        See ``self.getrow`` and ``self.index_`` for more infomation.
         '''
-        return tuple(pd.Series(self.data.index).apply(
-            lambda i: self.getrow(i)
-        ).values)
+        return tuple(self.getrow(index, row) for row, index in enumerate(self.index_, self.start_))
     
     def getchildren(self) -> tuple:
         '''
@@ -333,6 +631,169 @@ class WidgetDf(ipw.VBox):
         '''
         return (self.getcolumns(), *utils.hboxes(self.getrows()))
     
+    def getheaderkey(self) -> tuple:
+        '''
+        self.getheaderkey() -> tuple
+        
+        Returns a tuple of the index name and columns of ``self.data``, 
+        i.e. everything the header row depends on.
+        '''
+        return (self.data.index.name, *self.data.columns)
+    
+    def reconcile(self) -> tuple:
+        '''
+        self.reconcile() -> tuple
+        
+        Returns a tuple appropriate for use as the 'child' trait, reusing 
+        the widgets of the current children where possible.  Rows are keyed
+        by index label and cells by column: rows still shown are kept and
+        only their changed cells are updated (see ``WidgetCell.refresh``),
+        new rows are created and rows no longer shown are closed.  Cells 
+        are bound to their positions in ``self.values_``, so they are read
+        without any pandas indexing.
+        
+        If the header changed or the index of ``self.data`` is not unique,
+        every row is replaced (rows are then keyed by position).
+        
+        Rows no longer shown are released to the 'pool' attribute, which is
+        shared by all WidgetDfs, and new rows are taken from it where 
+        possible, so widgets are reused across pages, updates and WidgetDfs
+        rather than created and left open.
+        
+        See ``self.getrowbox``, ``self.releaserows`` and 
+        ``utils.WidgetPool`` for more infomation.
+        '''
+        key = self.getheaderkey()
+        keyed = self.data.index.is_unique
+        
+        if self.header is None or self.header_key != key or not (keyed and self.keyed):
+            self.releaserows(self.rows.values())
+            self.closerows((self.header,) if self.header is not None else ())
+            self.rows = {}
+            self.header = self.getcolumns()
+            self.header_key = key
+            
+        values = self.values_
+        children = []
+        
+        for position, index in enumerate(self.index_, self.start_):
+            row = self.rows.pop(index, None)
+            
+            if row is None:
+                row = self.getrowbox(index, position)
+            else:
+                for col, cell in enumerate(row.children[1:]):
+                    cell.refresh(self.data, values, (position, col))
+                    
+            children.append(row)
+            
+        self.releaserows(self.rows.values())
+        self.rows = dict(zip(self.index_ if keyed else range(len(children)), children))
+        self.keyed = keyed
+        
+        return (self.header, *children)
+    
+    def getrowbox(self, index: 'Any', position: int) -> ipw.HBox:
+        '''
+        self.getrowbox(index: Any, position: int) -> ipw.HBox
+        
+        Returns an HBox representing the row in ``self.data`` at the given 
+        index and position, rebinding a row of the same shape from the 
+        'pool' attribute if there is one, and otherwise creating it using
+        ``self.getrow``.
+        
+        See ``self.getrow`` and ``WidgetCell.rebind`` for more infomation.
+        
+        Parameters:
+        -----------
+            index (Any): Item in ``self.data.index``.
+            position (int): Position of the row in ``self.data``.
+        '''
+        cls = self.__class__
+        row = cls.pool.acquire(('row', len(self.data.columns) + 1))
+        
+        if row is None:
+            return ipw.HBox(self.getrow(index, position), layout=cls.row_layout)
+        
+        label, *cells = row.children
+        label.value = str(index)
+        values = self.values_
+        
+        for col, (cell, column) in enumerate(zip(cells, self.data.columns)):
+            cell.rebind(self.data, index, column, self.out, (position, col), values)
+            
+        return row
+    
+    def releaserows(self, rows: 'Iterable[ipw.HBox]') -> None:
+        '''
+        self.releaserows(rows: Iterable[ipw.HBox]) -> None
+        
+        Unbinds the cells of the given row widgets, which must no longer be
+        shown, and releases the rows to the 'pool' attribute, which closes
+        them if it is full.  The pool is shared by every WidgetDf, so the 
+        function it is given to close them does not refer to self.
+        
+        See ``utils.WidgetPool`` and ``WidgetCell.unbind`` for more 
+        infomation.
+        
+        Parameters:
+        -----------
+            rows (Iterable[ipw.HBox]): Row widgets to release.
+        '''
+        shared = self.getsharedwidgets()
+        closer = lambda row: utils.closewidgets((*row.children, row), shared)
+        
+        for row in tuple(rows):
+            for cell in row.children[1:]:
+                cell.unbind()
+                
+            self.__class__.pool.release(('row', len(row.children)), row, closer)
+    
+    def closerows(self, rows: 'Iterable[ipw.HBox]') -> None:
+        '''
+        self.closerows(rows: Iterable[ipw.HBox]) -> None
+        
+        Closes the given row widgets and all of their children (if they 
+        have any).  None is ignored.
+        
+        See ``self.closewidgets`` for more infomation.
+        
+        Parameters:
+        -----------
+            rows (Iterable[ipw.HBox]): Row widgets to close.
+        '''
+        for row in tuple(rows):
+            if row is not None:
+                self.closewidgets((*getattr(row, 'children', ()), row))
+    
+    def closewidgets(self, widgets: 'Iterable[ipw.Widget]') -> None:
+        '''
+        self.closewidgets(widgets: Iterable[ipw.Widget]) -> None
+        
+        Closes the given widgets together with their own 'layout' and 
+        'style' widgets, which ipywidgets leaves open, except for the 
+        layouts and styles shared through class attributes (e.g. 
+        'cell_layout').
+        
+        Parameters:
+        -----------
+            widgets (Iterable[ipw.Widget]): Widgets to close.
+        '''
+        utils.closewidgets(widgets, self.getsharedwidgets())
+        
+    def getsharedwidgets(self) -> tuple:
+        '''
+        self.getsharedwidgets() -> tuple
+        
+        Returns the layouts and styles shared through class attributes (e.g.
+        'cell_layout'), which must not be closed with the widgets using 
+        them.
+        '''
+        return tuple(
+            value for cls in type(self).__mro__ for value in vars(cls).values()
+            if isinstance(value, ipw.Widget)
+        )
+    
     def getcolumns(self) -> ipw.HBox:
         '''
         self.getcolumns() -> ipw.HBox
@@ -346,32 +807,159 @@ class WidgetDf(ipw.VBox):
         inam = self.data.index.name
         return ipw.HBox(
             [self.getcolumn('') if inam is None else self.getcolumn(inam)] +
-            [self.getcolumn(col) for col in self.data.columns]
+            [self.getcolumn(col) for col in self.data.columns],
+            layout=self.__class__.row_layout,
         )
     
+    def gettableheader(self) -> ipw.HTML:
+        '''
+        self.gettableheader() -> ipw.HTML
+        
+        Returns an ipywidgets HTML widget of the index name and column names
+        of ``self.data``, aligned with the buttons of the 'table' attribute.
+        
+        See ``self.rendertable`` for more infomation.
+        '''
+        cls = self.__class__
+        style = f'width: {cls.table_cell_width}px; margin: 0 {cls.table_cell_margin}px;'
+        inam = self.data.index.name
+        names = ['' if inam is None else inam, *self.data.columns]
+        
+        return ipw.HTML(
+            '<div style="display: flex;">' + 
+            ''.join(f'<div style="{style}"><b>{html.escape(str(name))}</b></div>' 
+                    for name in names) + 
+            '</div>'
+        )
+    
+    def gettable(self) -> ipw.ToggleButtons:
+        '''
+        self.gettable() -> ipw.ToggleButtons
+        
+        Returns an empty ipywidgets ToggleButtons widget, whose value is 
+        observed by ``self.clicktable``, for use as the 'table' attribute.
+        
+        See ``self.rendertable`` for more infomation.
+        '''
+        table = ipw.ToggleButtons(
+            options=[], 
+            value=None, 
+            style={'button_width': f'{self.__class__.table_cell_width}px'},
+        )
+        table.observe(self.clicktable, names='value')
+        
+        return table
+    
+    def rendertable(self) -> tuple:
+        '''
+        self.rendertable() -> tuple
+        
+        Returns a tuple appropriate for use as the 'child' trait when the
+        renderer is 'table', i.e. a header and the 'table' attribute.  The
+        table is a single ToggleButtons widget with a button per index item
+        and cell of the current page, by row then column, and just wide 
+        enough for the buttons to wrap into rows.  The value of each button
+        is its (row, column) position in ``self.data``, where the column of
+        index items is None.
+        
+        The header is only recreated if the index name or columns changed,
+        and the table is reused, so the number of widgets stays constant.
+        
+        See ``self.gettableheader``, ``self.gettable`` and 
+        ``self.clicktable`` for more infomation.
+        '''
+        cls = self.__class__
+        key = self.getheaderkey()
+        
+        if self.header is None or self.header_key != key:
+            self.header.close() if self.header is not None else None
+            self.header = self.gettableheader()
+            self.header_key = key
+            
+        self.table = self.gettable() if self.table is None else self.table
+        
+        index = self.index_
+        start = self.start_
+        rows = self.values_[start:start + len(index)]
+        options = []
+        
+        for row, (item, values) in enumerate(zip(index, rows), start):
+            options.append((str(item), (row, None)))
+            options.extend(
+                (utils.uselabel(value), (row, col)) for col, value in enumerate(values)
+            )
+        
+        width = (len(self.data.columns) + 1) * (cls.table_cell_width + 2 * cls.table_cell_margin)
+        
+        with self.table.hold_sync(), self.table.hold_trait_notifications():
+            self.table.options = options
+            self.table.tooltips = [label for label, _ in options]
+            self.table.layout.width = f'{width}px'
+        
+        return (self.header, self.table)
+    
+    def clicktable(self, change: tra.Bunch) -> None:
+        '''
+        self.clicktable(change: tra.Bunch) -> None
+        
+        Observer of the value of the 'table' attribute.  Displays the value
+        of the clicked cell, or the whole row if an index item was clicked,
+        in the 'out' attribute, as ``WidgetCell.click`` does, and then 
+        unselects the button.
+        
+        See ``utils.showcell`` and ``self.rendertable`` for more infomation.
+        
+        Parameters:
+        -----------
+            change (tra.Bunch): Widget event.
+        '''
+        if change.new is None:
+            return
+        
+        row, col = change.new
+        index = self.data.index[row]
+        
+        if col is None:
+            utils.showcell(self.data.iloc[row], f'{index}', self.out)
+        else:
+            utils.showcell(self.values_[row, col], f'{index} - {self.data.columns[col]}', self.out)
+            
+        self.table.value = None
+    
     def setchildren(self, *args) -> None:
         '''
         self.setchildren() -> None
         
-        Inplace method for setting the 'child' trait.
+        Inplace method for setting the 'child' trait.  Trait changes are 
+        held and sent to the front-end in as few messages as possible, and
+        the messages sent are counted in the 'messages' attribute.
         
-        See self.getchildren for more infomation.s
+        See ``self.reconcile``, ``self.rendertable`` and 
+        ``utils.MessageCounter`` for more infomation.
         '''
-        self.children = self.getchildren()
+        with utils.MessageCounter() as counter, self.hold_sync():
+            self.updatepagebox()
+            self.children = self.reconcile() if self.renderer == 'cells' else self.rendertable()
+            
+        self.messages = counter
         
     def itercells(self) -> Iterator:
         '''
         itercells(self) -> Iterator
         
-        Yields each cell by row then column.
+        Yields each cell by row then column.  Nothing is yielded if the
+        renderer is not 'cells'.
         '''
+        if self.renderer != 'cells':
+            return
+        
         for row in self.children[1:]:
             for cell in row.children[1:]:
                 yield cell
                 
-    def changeout(self, out: ipw.Output) -> None:
+    def changeout(self, out: ipw.Output, owned: bool=False) -> None:
         '''
-        self.changeout(out: ipw.Ouput) -> None
+        self.changeout(out: ipw.Ouput, owned: bool=False) -> None
         
         Inplace method for safly changing the 'out' attribute.
         
@@ -379,60 +967,467 @@ class WidgetDf(ipw.VBox):
         -----------
             out (ipw.Output): New Output widget in which to display cell values
                 when clicked.
+            owned (bool): Weather the Output widget was created for the 
+                WidgetDf, and should be closed with it (default is False).
         '''
+        self.owns_out = owned
         self.out = out
         self.clear_button.out = out
         for cell in self.itercells():
             cell.out = self.out 
+            
+    def close(self) -> None:
+        '''
+        self.close() -> None
+        
+        Wrapper around the 'close' method of the parent which first releases
+        the rows to the 'pool' attribute and closes every other widget the
+        WidgetDf created, including its Output widget if it owns it (see
+        ``self.changeout``).
+        
+        See ``self.releaserows`` for more infomation.
+        '''
+        self.releaserows(getattr(self, 'rows', {}).values())
+        self.rows = {}
+        names = ('header', 'table', 'page_box', 'button_box')
+        self.closerows(getattr(self, name, None) for name in names)
+        self.header = self.table = None
+        self.closewidgets((self.out,)) if getattr(self, 'owns_out', False) else None
+        self.layout.close()
+        super().close()
 
 class WidgetEnv(WidgetDf, EnvHandeler):
     '''
-    WidgetEnv(*args, **kwargs)
+    WidgetEnv(*args, page_size: int=None, renderer: str='cells',
+        chunk_size: int=None, time_slice: float=None, prefetch: bool=False,
+        **kwargs)
     
     Widget for representing the EnvHandeler objects. It inherits from
     the WidgetDf and EnvHandeler classes.
     
-    See ``WidgetDf`` and ``EnvHandeler`` for more infomation.
+    If a chunk size is given, loading a target (the first update, or an 
+    update given a new name) extracts the variables in chunks and 
+    publishes them to the widget as they are extracted, so the first rows
+    appear quickly and the kernel can handle clicks and other messages 
+    between chunks.  Refreshes of the same target are not chunked, so the
+    rows already shown are kept until the new frame is complete.
+    
+    If prefetch is True, snapshots of the variables of the visible rows 
+    are taken whilst the kernel is idle, by an ``EnvPrefetcher`` (the 
+    'prefetcher' attribute), so ``self.subenv`` can show them without 
+    extracting them (see ``self.prefetchidle``).  Prefetching is driven by
+    the running event loop (e.g. the kernel's), so a WidgetEnv created 
+    outside of one warns and does not prefetch.
+    
+    See ``WidgetDf``, ``EnvHandeler`` and ``self.publish`` for more 
+    infomation.
     
     Parameters:
     -----------
         *args: Positional arguments used to initialise the EnvHandeler
             parent.
+        page_size (int): Page size used to initialise the WidgetDf parent
+            (default is None).
+        renderer (str): Renderer used to initialise the WidgetDf parent
+            (default is 'cells').
+        chunk_size (int): Maximum number of variables extracted per chunk.
+            If None, loads are not chunked (default is None).
+        time_slice (float): Maximum number of seconds per chunk.  If None,
+            chunks are only limited by ``chunk_size`` (default is None).
+        prefetch (bool): Weather the variables of the visible rows should
+            be prefetched whilst the kernel is idle (default is False).
         **kwargs: Key word arguments used to initialise the EnvHandeler
             parent.
     '''
+    prefetch_delay = 0.1
     
-    def __init__(self, *args, **kwargs):
+    def __init__(self, 
+                 *args, 
+                 page_size: int=None, 
+                 renderer: str='cells',
+                 chunk_size: int=None, 
+                 time_slice: float=None, 
+                 prefetch: bool=False,
+                 **kwargs):
+        self.update_executor = utils.CoalescingExecutor(self.mergeupdates)
+        self.chunk_size = chunk_size
+        self.time_slice = time_slice
+        self.prefetch_handle = None
+        self.prefetch_future = None
+        
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop = None
+            
+        if prefetch and self.loop is None:
+            warnings.warn('WidgetEnv created outside of a running event loop, prefetching is disabled')
+            prefetch = False
+            
         EnvHandeler.__init__(self, *args, **kwargs)
-        WidgetDf.__init__(self, self.df)
+        self.prefetcher = EnvPrefetcher(self) if prefetch else None
+        prefetched = kwargs.get('snapshot') is not None and not self.isstale('df')
+        chunks = self.iterchunks() if chunk_size and not prefetched else None
+        next(chunks) if chunks is not None else None
+        WidgetDf.__init__(self, self.df, page_size=page_size, renderer=renderer)
         self.add_traits(last_updated=tra.Any())
         self.last_updated = None
         self.setupdatebutton()
+        self.observe(self.prefetchvisible, names=['data', 'page']) if prefetch else None
+        self.prefetchvisible()
+        self.update_executor.submit(self.publish, chunks) if chunks is not None else None
+    
+    def update(self, *args, **kwargs) -> Future:
+        '''
+        self.update(self, *args, **kwargs) -> Future
+        
+        Schedules ``self.updatenow`` on the 'update_executor' attribute and
+        returns a future for its result.  Updates run one at a time in a 
+        single background thread, and an update requested whilst another is
+        running is merged with any update still waiting (see 
+        ``self.mergeupdates``).
+        
+        Passing ``names=[...]`` only updates the rows, and hence the cells,
+        of the given variables (see ``EnvHandeler.update``).
+        
+        See ``self.updatenow`` and ``utils.CoalescingExecutor`` for more 
+        infomation.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments passed to ``self.updatenow``.
+            **kwargs: Key word arguments passed to ``self.updatenow``.
+        '''
+        return self.update_executor.submit(self.updatenow, *args, **kwargs)
     
-    @utils.inthread
-    def update(self, *args, **kwargs) -> None:
+    def getupdatenames(self, call: tuple) -> 'list|None':
         '''
-        self.update(self, *args, **kwargs) -> None
+        self.getupdatenames(call: tuple) -> list|None
+        
+        Returns the list of names updated by the given (func, args, kwargs)
+        call of the 'update_executor' attribute, or None if it is not a 
+        partial update, i.e. a call of ``self.updatenow`` (or 
+        ``self.extractupdate``) with names.
+        
+        Parameters:
+        -----------
+            call (tuple): A (func, args, kwargs) tuple.
+        '''
+        (func, args, kwargs) = call
+        names = kwargs.get('names')
+        
+        if func not in (self.updatenow, self.extractupdate) or names is None:
+            return None
+        
+        return [names] if isinstance(names, str) else list(names)
+    
+    def mergeupdates(self, pending: tuple, call: tuple) -> tuple:
+        '''
+        self.mergeupdates(pending: tuple, call: tuple) -> tuple
+        
+        Merges a call submitted to the 'update_executor' attribute with the
+        call still pending, each a (func, args, kwargs) tuple, so no update 
+        is lost:
+        
+            - A full update (or any other call) replaces the pending call.
+            - A partial update does not replace a pending full update, 
+              which also updates its names.
+            - Two partial updates are merged into one, of the names of 
+              both.
+              
+        See ``self.getupdatenames`` and ``utils.CoalescingExecutor`` for 
+        more infomation.
+        
+        Parameters:
+        -----------
+            pending (tuple): The pending call.
+            call (tuple): The submitted call.
+        '''
+        (old, new) = (self.getupdatenames(pending), self.getupdatenames(call))
+        
+        if new is None:
+            return call
+        
+        if old is None:
+            return pending
+        
+        return call[0], call[1], {**call[2], 'names': list(dict.fromkeys(old + new))}
+    
+    def updatenow(self, *args, **kwargs) -> 'WidgetEnv':
+        '''
+        self.updatenow(self, *args, **kwargs) -> WidgetEnv
         
         Wrapper around the 'update' method of the EnvHandeler parent in which
         ``self.data`` is ``set.df`` after the parent's update method is called.
         Finally, it updates the 'last_updated' attribute using ``datetime.now``.
         
-        Note, this function is decorated with ``utils.inthread``, hence will
-        run in its own thread. 
+        If the update loads a new target, and the 'chunk_size' attribute 
+        is set, it is chunked instead (see ``self.getchunks`` and 
+        ``self.publish``).
         
-        See ``EnvHandeler.update``, ``utils.inthread`` and ``datetime.now`` for 
-        more infomation.
+        See ``EnvHandeler.update`` and ``datetime.now`` for more infomation.
         
         Parameters:
         -----------
             *args: Positional arguments passed to the parents update method.
             **kwargs: Key word arguments passed to the parents update method.
         '''
-        super().update(*args, **kwargs)
-        self.data = self.df
+        chunks = self.getchunks(*args, **kwargs)
+        
+        if chunks is not None:
+            return self.publish(chunks)
+        
+        EnvHandeler.update(self, *args, **kwargs)
+        self.setdata()
+        
+        return self
+    
+    async def aupdate(self, *args, **kwargs) -> 'WidgetEnv':
+        '''
+        await self.aupdate(*args, **kwargs) -> WidgetEnv
+        
+        Asynchronous version of ``self.updatenow`` to be awaited on the 
+        running event loop, e.g. the IPython kernel's.  The extraction is
+        submitted to the 'update_executor' attribute (see 
+        ``self.extractupdate``), so it does not block the loop and is run 
+        one at a time with, and merged like, every other update (e.g. by 
+        the update button, a ``SnapshotHub`` or IPython's events).  Its 
+        result is applied to the widget back on the loop's thread, in one
+        batch per update (or per chunk, if the update is chunked).
+        
+        See ``self.update``, ``self.updatenow`` and ``self.getchunks`` for
+        more infomation.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments passed to the 'update' method of
+                the EnvHandeler parent.
+            **kwargs: Key word arguments passed to the 'update' method of
+                the EnvHandeler parent.
+        '''
+        loop = asyncio.get_running_loop()
+        future = self.update_executor.submit(self.extractupdate, loop, *args, **kwargs)
+        df = await asyncio.wrap_future(future)
+        
+        if isinstance(df, pd.DataFrame):
+            self.setdata(df)
+        
+        return self
+    
+    def extractupdate(self, 
+                      loop: asyncio.AbstractEventLoop, 
+                      *args, 
+                      **kwargs) -> 'pd.DataFrame|None':
+        '''
+        self.extractupdate(loop: asyncio.AbstractEventLoop, *args, **kwargs)
+            -> pd.DataFrame|None
+        
+        Extraction of ``self.aupdate``, run by the 'update_executor' 
+        attribute.  Updates the EnvHandeler parent without setting 
+        ``self.data`` and returns the 'df' attribute it built, which 
+        ``self.aupdate`` applies as it is (rather than reading the 'df' 
+        attribute again, which a later update could have marked as stale).
+        If the update is chunked, ``self.setdata`` is scheduled on the 
+        given loop with the 'df' attribute of each chunk instead, and None
+        is returned.
+        
+        Parameters:
+        -----------
+            loop (asyncio.AbstractEventLoop): Loop ``self.aupdate`` is 
+                awaited on.
+            *args: Positional arguments passed to the 'update' method of
+                the EnvHandeler parent.
+            **kwargs: Key word arguments passed to the 'update' method of
+                the EnvHandeler parent.
+        '''
+        chunks = self.getchunks(*args, **kwargs)
+        
+        if chunks is None:
+            return EnvHandeler.update(self, *args, **kwargs).df
+        
+        for env in chunks:
+            loop.call_soon_threadsafe(self.setdata, env.df)
+            
+        return None
+    
+    def getchunks(self, *args, **kwargs) -> 'Iterator[WidgetEnv]|None':
+        '''
+        self.getchunks(*args, **kwargs) -> Iterator[WidgetEnv]|None
+        
+        Returns ``self.iterchunks(*args, **kwargs)`` if an update with the
+        given arguments is chunked, i.e. the 'chunk_size' attribute is set
+        and the only argument is a new name to load.  Otherwise None is 
+        returned.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments of the update.
+            **kwargs: Key word arguments of the update.
+        '''
+        name = args[0] if len(args) == 1 and not kwargs else kwargs.get('name') if not args else None
+        
+        if self.chunk_size and name is not None and set(kwargs) <= {'name'}:
+            return self.iterchunks(name)
+    
+    def iterchunks(self, name: str=None) -> 'Iterator[WidgetEnv]':
+        '''
+        self.iterchunks(name: str=None) -> Iterator[WidgetEnv]
+        
+        Returns ``self.iterupdate`` using the 'chunk_size' and 'time_slice' 
+        attributes.
+        
+        See ``EnvHandeler.iterupdate`` for more infomation.
+        
+        Parameters:
+        -----------
+            name (str): 'name' argument passed to ``self.iterupdate``
+                (default is None).
+        '''
+        return self.iterupdate(name, chunk_size=self.chunk_size, time_slice=self.time_slice)
+    
+    def publish(self, chunks: 'Iterator[WidgetEnv]') -> 'WidgetEnv':
+        '''
+        self.publish(chunks: Iterator[WidgetEnv]) -> WidgetEnv
+        
+        Advances an iterator returned by ``self.iterchunks``, calling 
+        ``self.setdata`` each time it yields so the rows extracted so far
+        are shown straight away.  Between chunks, the thread sleeps for 0 seconds so other 
+        threads, i.e. the kernel's, can run.
+        
+        Parameters:
+        -----------
+            chunks (Iterator[WidgetEnv]): Iterator returned by 
+                ``self.iterchunks``.
+        '''
+        for _ in chunks:
+            self.setdata()
+            time.sleep(0)
+            
+        return self
+    
+    def setdata(self, df: pd.DataFrame=None) -> None:
+        '''
+        self.setdata(df: pd.DataFrame=None) -> None
+        
+        Inplace method for setting ``self.data`` to the given DataFrame (or
+        ``self.df`` if None) and the 'last_updated' attribute to 
+        ``datetime.now()``.  If it is already ``self.data``, i.e. it was 
+        patched inplace (see ``EnvHandeler.updatenames``), ``self.values_``
+        is created again.  Does nothing once the WidgetEnv is closed, e.g.
+        when an update which was running when it was closed finishes.
+        
+        Parameters:
+        -----------
+            df (pd.DataFrame): 'df' attribute already built by the 
+                EnvHandeler parent (default is None).
+        '''
+        if self.update_executor.closed:
+            return
+        
+        df = self.df if df is None else df
+        self.values_source = (None, None) if df is self.data else self.values_source
+        self.data = df
         self.last_updated = datetime.now()
         
+    def updatefromsnapshot(self, *args, **kwargs) -> Future:
+        '''
+        self.updatefromsnapshot(*args, **kwargs) -> Future
+        
+        Schedules the 'updatefromsnapshot' method of the EnvHandeler parent,
+        followed by ``self.setdata``, on the 'update_executor' attribute and
+        returns a future for its result.
+        
+        See ``EnvHandeler.updatefromsnapshot`` and ``self.update`` for more
+        infomation.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments passed to 
+                ``EnvHandeler.updatefromsnapshot``.
+            **kwargs: Key word arguments passed to 
+                ``EnvHandeler.updatefromsnapshot``.
+        '''
+        def run():
+            EnvHandeler.updatefromsnapshot(self, *args, **kwargs)
+            self.setdata()
+            return self
+        
+        return self.update_executor.submit(run)
+        
+    def prefetchvisible(self, *args) -> None:
+        '''
+        self.prefetchvisible(*args) -> None
+        
+        Schedules ``self.prefetchidle`` on the 'loop' attribute, the event 
+        loop the WidgetEnv was created on, 'prefetch_delay' seconds from 
+        now, replacing any call already scheduled.  Does nothing if the 
+        'prefetcher' attribute is None or there is no loop.  Observes the
+        'data' and 'page' traits, and is safe to call from any thread.
+        
+        Parameters:
+        -----------
+            *args: Ignored, allowing it to be used as an observer.
+        '''
+        if self.prefetcher is not None and self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.scheduleprefetch)
+            
+    def scheduleprefetch(self) -> None:
+        '''
+        self.scheduleprefetch() -> None
+        
+        Schedules ``self.prefetchidle`` on the 'loop' attribute, 
+        'prefetch_delay' seconds from now, replacing any call already 
+        scheduled.  Must be called on the loop's thread.
+        '''
+        self.prefetch_handle.cancel() if self.prefetch_handle is not None else None
+        self.prefetch_handle = self.loop.call_later(self.prefetch_delay, self.prefetchidle)
+        
+    def prefetchidle(self) -> None:
+        '''
+        self.prefetchidle() -> None
+        
+        Runs one step of the 'prefetcher' attribute on the variables of the
+        visible rows in the loop's default executor (so the extraction 
+        never holds the loop), and schedules the next step, once it is 
+        done, if any are left.  As it is run by the event loop, which 
+        IPython's kernel also uses to run cells, steps are only started 
+        whilst the kernel is idle.  Whilst an update or a step is running,
+        the step is put off.
+        
+        See ``EnvPrefetcher.step`` for more infomation.
+        '''
+        self.prefetch_handle = None
+        
+        if self.prefetcher is None:
+            return
+        
+        if self.update_executor.running_ or self.prefetch_future is not None:
+            return self.scheduleprefetch()
+        
+        self.prefetcher.setnames(self.index_)
+        
+        if self.prefetcher.pending:
+            self.prefetch_future = self.loop.run_in_executor(None, self.prefetcher.step)
+            self.prefetch_future.add_done_callback(self.prefetchdone)
+            
+    def prefetchdone(self, future: asyncio.Future) -> None:
+        '''
+        self.prefetchdone(future: asyncio.Future) -> None
+        
+        Done callback of the step started by ``self.prefetchidle``, which 
+        schedules the next step if names are still pending.
+        
+        Parameters:
+        -----------
+            future (asyncio.Future): Future of the step.
+        '''
+        self.prefetch_future = None
+        
+        if self.prefetcher is None or future.cancelled() or future.exception() is not None:
+            return
+        
+        self.scheduleprefetch() if future.result() else None
+        
     def getupdatebutton(self, *args, **kwargs) -> utils.UpdateButton:
         '''
         self.getupdatebutton(*args, **kwargs) -> utils.UpdateButton
@@ -471,13 +1466,36 @@ class WidgetEnv(WidgetDf, EnvHandeler):
         self.update_button = self.getupdatebutton(*args, *kwargs)
         self.button_box.children += (self.update_button,)
     
+    def getsubparams(self) -> dict:
+        '''
+        self.getsubparams() -> dict
+        
+        Wrapper around the 'getsubparams' method of the EnvHandeler parent
+        which adds the 'page_size', 'renderer', 'chunk_size' and 
+        'time_slice' attributes, and weather the WidgetEnv prefetches.
+        
+        See ``EnvHandeler.getsubparams`` for more infomation.
+        '''
+        return {
+            **super().getsubparams(), 
+            'page_size': self.page_size,
+            'renderer': self.renderer,
+            'chunk_size': self.chunk_size,
+            'time_slice': self.time_slice,
+            'prefetch': self.prefetcher is not None,
+        }
+    
     def subenv(self, *args, new_output: bool=True, **kwargs) -> 'WidgetEnv':
         '''
         self.subenv(*args, new_output: bool=True, **kwargs) -> WidgetEnv
         
         Wrapper around the 'subenv' method of the EnvHandeler parent in which
         the resulting WidgetEnv is given a new Output widget as its 'out'
-        attribute.
+        attribute, unless it already has its own (i.e. it was cached).
+        
+        Note, the returned WidgetEnv is owned by the 'subenvs' cache, which
+        closes it when evicting it unless it has been displayed (see 
+        ``EnvHandeler.subenv``).
         
         See ``EnvHandeler.subenv``, and ``self.changeout`` for more infomation.
         
@@ -493,18 +1511,52 @@ class WidgetEnv(WidgetDf, EnvHandeler):
             **kwargs: Key word arguments passed to ``super().subenv``.
         '''
         env = super().subenv(*args, **kwargs)
-        env.changeout(ipw.Output()) if new_output else None
+        env.changeout(ipw.Output(), owned=True) if new_output and not env.owns_out else None
         
         return env
+    
+    def close(self) -> None:
+        '''
+        self.close() -> None
+        
+        Wrapper around the 'close' method of the WidgetDf parent which first
+        shuts down the 'update_executor' attribute, cancelling any pending 
+        update (see ``utils.CoalescingExecutor.shutdown``), stops 
+        prefetching, discards the prefetched snapshots, closes the cached
+        subenvs (see ``SubenvCache.clear``) and removes the WidgetEnv from 
+        the subenvs cached by its parent.
+        '''
+        executor = getattr(self, 'update_executor', None)
+        executor.shutdown() if executor is not None else None
+        subenvs, self.subenvs = getattr(self, 'subenvs', None), None
+        subenvs.clear() if subenvs is not None else None
+        parent = getattr(self, 'parent', None)
+        parent.subenvs.discard(self) if getattr(parent, 'subenvs', None) is not None else None
+        prefetcher, self.prefetcher = getattr(self, 'prefetcher', None), None
+        prefetcher.clear() if prefetcher is not None else None
+        handle, self.prefetch_handle = getattr(self, 'prefetch_handle', None), None
+        self.loop.call_soon_threadsafe(handle.cancel) if handle is not None and not self.loop.is_closed() else None
+        super().close()
 
 class AutoWidgetEnv(WidgetEnv):
     '''
-    AutoWidgetEnv(*args, interval: float=5, start: bool=True, **kwargs)
+    AutoWidgetEnv(*args, interval: float=5, start: bool=True, 
+        adaptive: bool=False, max_interval: float=None, refresh: str='poll',
+        debounce: float=0, hub: SnapshotHub=None, **kwargs)
     
     Child class of ``WidgetEnv``.  Is able to automatically update itself
-    periodically in the background.
+    periodically in the background, using a ``utils.PeriodicScheduler`` 
+    (the 'scheduler' attribute) which can be paused and stopped, and/or 
+    after each cell run by IPython, using its 'post_run_cell' event.
     
-    See ``WidgetEnv`` for more infomation.
+    The scheduler and IPython's 'post_run_cell' event only hold the 
+    AutoWidgetEnv through weak references, and both are stopped (i.e. the
+    callback is unregistered) when the AutoWidgetEnv is closed.
+    
+    Alternatively, polling can be run as a task on the running event loop,
+    e.g. the IPython kernel's, rather than in a thread (see ``self.astart``).
+    
+    See ``WidgetEnv`` and ``utils.PeriodicScheduler`` for more infomation.
     
     Parameters:
     -----------
@@ -513,6 +1565,24 @@ class AutoWidgetEnv(WidgetEnv):
         start (bool): Weather to start automatic updates on initialisation.
             ``self.start`` can be used to commence automatic updating after
              the fact (default is True).
+        adaptive (bool): Weather the interval should stretch whilst updates
+            are expensive relative to it and shrink back once they are 
+            cheap (default is False).
+        max_interval (float): Upper limit of the adaptive interval.  If 
+            None, ten times ``interval`` is used (default is None).
+        refresh (str): When to update automatically. One of:
+                - 'poll': Every ``interval`` seconds.
+                - 'event': After each cell is run, so an idle kernel does
+                  no work.  Polling is still needed to see objects 
+                  mutated by background threads.
+                - 'both': Both of the above.
+            Any other value raises a ValueError (default is 'poll').
+        debounce (float): Number of seconds to wait after a cell is run, 
+            without another cell being run, before updating (default is 0).
+        hub (SnapshotHub): If given, polling is done by subscribing to the
+            hub, which shares one snapshot per tick between all views of the
+            same target, instead of by the 'scheduler' attribute.  The 
+            hub's interval is used (default is None).
         **kwargs: Key word arguments passed to the parent's constructor.
     '''
     
@@ -520,19 +1590,57 @@ class AutoWidgetEnv(WidgetEnv):
                  *args, 
                  interval: float=5, 
                  start:bool=True, 
+                 adaptive: bool=False,
+                 max_interval: float=None,
+                 refresh: str='poll',
+                 debounce: float=0,
+                 hub: SnapshotHub=None,
                  **kwargs):
+        if refresh not in ('poll', 'event', 'both'):
+            raise ValueError(f"refresh must be 'poll', 'event' or 'both', not {refresh!r}")
+        
         super().__init__(*args, **kwargs)
         self.interval = interval
+        self.refresh = refresh
+        self.callback = None
+        self.hub = hub
+        self.debouncer = utils.Debouncer(self.tick, debounce)
+        self.update_args = ((), {})
+        self.scheduler = utils.PeriodicScheduler(
+            self.tick,
+            interval=interval,
+            adaptive=adaptive,
+            max_interval=max_interval,
+        )
+        self.task = None
+        self.resumed = asyncio.Event()
         self.paused = False
         self.setpausebutton()
         self.start() if start else None
+        
+    @property
+    def paused(self) -> bool:
+        '''
+        Weather automatic (and manual) updates are paused.  Setting it 
+        pauses or resumes the 'scheduler' attribute.
+        '''
+        return self.scheduler.paused
+    
+    @paused.setter
+    def paused(self, paused: bool) -> None:
+        self.scheduler.pause() if paused else self.scheduler.resume()
+        task = self.task
+        
+        if not paused and task is not None and not task.done():
+            task.get_loop().call_soon_threadsafe(self.resumed.set)
     
-    def update(self, *args, **kwargs) -> None:
+    def update(self, *args, **kwargs) -> 'Future|None':
         '''
-        self.update(*args, **kwargs) -> None
+        self.update(*args, **kwargs) -> Future|None
         
         Wrapper around the 'update' method of the parent which only calls the
-        method if ``self.paused`` is False.
+        method if ``self.paused`` is False, in which case its future is
+        returned.
         
         See ``WidgetEnv.update`` for more infomation.
         
@@ -542,30 +1650,219 @@ class AutoWidgetEnv(WidgetEnv):
             **kwargs: Key word arguments passed to ``super().update``.
         '''
         if not self.paused:
-            super().update(*args, **kwargs)
+            return super().update(*args, **kwargs)
+        
+    async def aupdate(self, *args, **kwargs) -> 'AutoWidgetEnv|None':
+        '''
+        await self.aupdate(*args, **kwargs) -> AutoWidgetEnv|None
+        
+        Wrapper around the 'aupdate' method of the parent which only 
+        updates if ``self.paused`` is False, in which case the AutoWidgetEnv
+        is returned.
+        
+        See ``WidgetEnv.aupdate`` for more infomation.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments passed to ``super().aupdate``.
+            **kwargs: Key word arguments passed to ``super().aupdate``.
+        '''
+        if not self.paused:
+            return await super().aupdate(*args, **kwargs)
+        
+    def tick(self) -> None:
+        '''
+        self.tick() -> None
+        
+        Called by the 'scheduler' attribute.  Updates using the arguments 
+        given to ``self.start`` and waits for the update to finish, so the
+        scheduler measures its cost.
+        
+        See ``self.update`` for more infomation.
+        '''
+        args, kwargs = self.update_args
+        future = self.update(*args, **kwargs)
+        future.result() if future is not None else None
         
     def start(self, *args, **kwargs) -> None:
         '''
         self.start(*args, **kwargs) -> None:
         
-        Commences automatic updating.
+        Commences automatic updating, as determined by the 'refresh'
+        attribute.
         
-        See See ``WidgetEnv.update`` and ``utils.runperiodic`` for more
-        infomation.
+        See See ``WidgetEnv.update``, ``utils.PeriodicScheduler`` and 
+        ``self.postruncell`` for more infomation.
         
         Parameters:
         -----------
             *args: Positional arguments passed to ``super().update``.
             **kwargs: Key word arguments passed to ``super().update``.
         '''
-        utils.runperiodic(
-            func=self.update,
-            interval=self.interval
-        )(*args, **kwargs)
+        self.update_args = (args, kwargs)
+        
+        if self.refresh in ('poll', 'both'):
+            self.scheduler.start() if self.hub is None else self.hub.subscribe(self)
+        
+        if self.refresh in ('event', 'both') and get_ipython() is not None:
+            self.unregister()
+            self.register()
 
-    def stop(self):
-        self.update_process.terminate()
-        self.setupdateprocess()
+    async def astart(self, *args, **kwargs) -> asyncio.Task:
+        '''
+        await self.astart(*args, **kwargs) -> asyncio.Task
+        
+        Asynchronous version of ``self.start`` which, instead of using the
+        'scheduler' attribute, commences automatic updating as a task on 
+        the running event loop, e.g. the IPython kernel's, and returns the
+        task (the 'task' attribute).  Polling is done by ``self.aupdate``
+        every ``self.scheduler.interval`` seconds, which is adapted as by 
+        the scheduler, until ``self.stop`` is called.
+        
+        See ``self.aupdate`` and ``utils.PeriodicScheduler`` for more 
+        infomation.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments passed to ``self.aupdate``.
+            **kwargs: Key word arguments passed to ``self.aupdate``.
+        '''
+        self.stop()
+        self.task = asyncio.get_running_loop().create_task(self.arun(*args, **kwargs))
+        
+        return self.task
+    
+    async def arun(self, *args, **kwargs) -> None:
+        '''
+        await self.arun(*args, **kwargs) -> None
+        
+        Coroutine of the task started by ``self.astart``.  Whilst paused,
+        it waits on the 'resumed' attribute, an ``asyncio.Event`` set by 
+        resuming, rather than waking every interval.  As with the 
+        'scheduler' attribute, exceptions raised by updates do not stop it,
+        and are stored in ``self.scheduler.error`` and counted by 
+        ``self.scheduler.errors``.
+        
+        Parameters:
+        -----------
+            *args: Positional arguments passed to ``self.aupdate``.
+            **kwargs: Key word arguments passed to ``self.aupdate``.
+        '''
+        scheduler = self.scheduler
+        
+        while True:
+            while self.paused:
+                self.resumed.clear()
+                await self.resumed.wait()
+                
+            started = time.perf_counter()
+            
+            try:
+                await self.aupdate(*args, **kwargs)
+                scheduler.error = None
+            except Exception as exc:
+                scheduler.error = exc
+                scheduler.errors += 1
+                
+            scheduler.cost = time.perf_counter() - started
+            scheduler.adapt()
+            await asyncio.sleep(scheduler.interval)
+    
+    def stop(self) -> None:
+        '''
+        self.stop() -> None
+        
+        Stops automatic updating, whether started by ``self.start`` or 
+        ``self.astart``.  Either can be used to commence it again.
+        '''
+        self.task.cancel() if self.task is not None else None
+        self.task = None
+        self.scheduler.stop()
+        self.debouncer.cancel()
+        self.hub.unsubscribe(self) if self.hub is not None else None
+        self.unregister()
+        
+    def register(self) -> None:
+        '''
+        self.register() -> None
+        
+        Inplace method for registering a callback of ``self.postruncell`` 
+        with IPython's 'post_run_cell' event, as the 'callback' attribute.
+        The callback only holds the AutoWidgetEnv through a weak reference
+        and unregisters itself once the AutoWidgetEnv has been garbage 
+        collected.
+        '''
+        events = get_ipython().events
+        method = weakref.WeakMethod(self.postruncell)
+        
+        def callback(result: 'Any'=None) -> None:
+            postruncell = method()
+            
+            if postruncell is None:
+                events.unregister('post_run_cell', callback)
+            else:
+                postruncell(result)
+                
+        self.callback = callback
+        events.register('post_run_cell', callback)
+        
+    def unregister(self) -> None:
+        '''
+        self.unregister() -> None
+        
+        Inplace method for unregistering the 'callback' attribute from 
+        IPython's 'post_run_cell' event, if it is registered.
+        '''
+        if self.registered_:
+            get_ipython().events.unregister('post_run_cell', self.callback)
+            
+        self.callback = None
+            
+    @property
+    def registered_(self) -> bool:
+        '''
+        Weather the 'callback' attribute is registered with IPython's 
+        'post_run_cell' event.
+        '''
+        ipython = get_ipython()
+        
+        if ipython is None or self.callback is None:
+            return False
+        
+        return self.callback in ipython.events.callbacks['post_run_cell']
+    
+    def postruncell(self, result: 'Any'=None) -> None:
+        '''
+        self.postruncell(result: Any=None) -> None
+        
+        Callback of IPython's 'post_run_cell' event.  Updates in the 
+        background, after the debounce delay if there is one, unless
+        paused.
+        
+        See ``self.tick`` and ``utils.Debouncer`` for more infomation.
+        
+        Parameters:
+        -----------
+            result (Any): Result of the cell, passed by IPython.
+        '''
+        if self.paused:
+            return
+        
+        if self.debouncer.delay:
+            self.debouncer()
+        else:
+            args, kwargs = self.update_args
+            self.update(*args, **kwargs)
+        
+    def close(self) -> None:
+        '''
+        self.close() -> None
+        
+        Wrapper around the 'close' method of the parent which first stops
+        automatic updating.
+        '''
+        self.stop() if hasattr(self, 'task') else None
+        super().close()
     
     def getpausebutton(self, **kwargs) -> utils.PausePlayButton:
         pause_button = utils.PausePlayButton(self.paused, **kwargs)
@@ -578,4 +1875,177 @@ class AutoWidgetEnv(WidgetEnv):
     
     def setpausebutton(self, **kwargs) -> None:
         self.pause_button = self.getpausebutton(**kwargs)
-        self.button_box.children += (self.pause_button,)
\ No newline at end of file
+        self.button_box.children += (self.pause_button,)
+
+class WidgetTree(ipw.VBox):
+    '''
+    WidgetTree(tree: EnvTree, out: ipw.Output=None, **kwargs)
+    
+    Widget for exploring an EnvTree, e.g. ``EnvHandeler.gettree()``.  It 
+    inherits from ipywidgets' VBox class.  Each shown node is represented 
+    by a row with a toggle button, which expands or collapses the node, a
+    button with the name and label of its object, which shows the object,
+    and an 'open' button, which shows a full EnvHandeler of the node (see
+    ``EnvTree.gethandler``).
+    
+    Rows are only created for shown nodes and are closed when their node
+    is hidden, and the tree is released (see ``EnvTree.release``) each 
+    time a node is toggled.
+    
+    See ``ipywidgets.VBox`` and ``EnvTree`` for more infomation.
+    
+    Parameters:
+    -----------
+        tree (EnvTree): The tree to explore.
+        out (ipw.Output): Output widget in which objects are shown.  If 
+            None, a new Output widget is created, shown below the tree and
+            closed with it (default is None).
+        **kwargs: Key word arguments used to initalise the parent
+            (ipw.VBox).
+    '''
+    toggle_width = 30
+    indent = 20
+    node_layout = ipw.Layout(width='auto')
+    open_layout = ipw.Layout(width='60px')
+    
+    def __init__(self, tree: EnvTree, out: ipw.Output=None, **kwargs):
+        super().__init__(**kwargs)
+        self.tree = tree
+        self.owns_out = out is None
+        self.out = ipw.Output() if out is None else out
+        self.rows = {}
+        self.toggle_layouts = {}
+        self.setchildren()
+        
+    def gettogglelayout(self, depth: int) -> ipw.Layout:
+        '''
+        self.gettogglelayout(depth: int) -> ipw.Layout
+        
+        Returns the layout of the toggle buttons of nodes of the given 
+        depth, indented by ``depth * self.indent`` pixels and shared by 
+        all rows of that depth.
+        
+        Parameters:
+        -----------
+            depth (int): Depth of the node.
+        '''
+        if depth not in self.toggle_layouts:
+            self.toggle_layouts[depth] = ipw.Layout(
+                width=f'{self.toggle_width}px', 
+                margin=f'0 0 0 {depth * self.indent}px',
+            )
+            
+        return self.toggle_layouts[depth]
+        
+    def getrow(self, node: EnvNode) -> ipw.HBox:
+        '''
+        self.getrow(node: EnvNode) -> ipw.HBox
+        
+        Returns a new ipywidgets HBox representing the given node.
+        
+        Parameters:
+        -----------
+            node (EnvNode): Node of 'tree' attribute.
+        '''
+        head = node.path_ or node.name
+        toggle_button = ipw.Button(layout=self.gettogglelayout(node.depth))
+        toggle_button.on_click(lambda button: self.toggle(node))
+        
+        node_button = ipw.Button(
+            description=f'{node.name}: {utils.uselabel(node.obj)}', 
+            tooltip=head,
+            layout=self.__class__.node_layout,
+        )
+        node_button.on_click(
+            lambda button: utils.showcell(node.obj, head, self.out)
+        )
+        
+        open_button = ipw.Button(
+            description='open', 
+            tooltip=f'Show an EnvHandeler of {head}',
+            layout=self.__class__.open_layout,
+        )
+        open_button.on_click(
+            lambda button: utils.showcell(self.tree.gethandler(node), head, self.out)
+        )
+        
+        return ipw.HBox([toggle_button, node_button, open_button])
+    
+    def setchildren(self) -> None:
+        '''
+        self.setchildren() -> None
+        
+        Sets the children to the rows of the shown nodes, creating the 
+        missing rows and closing the rows of hidden nodes.
+        
+        See ``EnvNode.iternodes`` for more infomation.
+        '''
+        nodes = list(self.tree.root.iternodes())
+        shown = {id(node) for node in nodes}
+        rows = {}
+        
+        for node in nodes:
+            entry = self.rows.get(id(node))
+            row = entry[1] if entry is not None and entry[0] is node else self.getrow(node)
+            row.children[0].description = '▾' if node.expanded else '▸'
+            rows[id(node)] = (node, row)
+        
+        self.closerows(
+            row for key, (node, row) in self.rows.items() 
+            if key not in shown or rows[key][1] is not row
+        )
+        self.rows = rows
+        self.children = [row for node, row in rows.values()] + ([self.out] if self.owns_out else [])
+        
+    def toggle(self, node: EnvNode) -> None:
+        '''
+        self.toggle(node: EnvNode) -> None
+        
+        Toggles the given node, releases the nodes of the 'tree' attribute 
+        which have been collapsed for long enough and updates the 
+        children.
+        
+        See ``EnvNode.toggle`` and ``EnvTree.release`` for more infomation.
+        
+        Parameters:
+        -----------
+            node (EnvNode): Node of 'tree' attribute.
+        '''
+        node.toggle()
+        self.tree.release()
+        self.setchildren()
+        
+    def closerows(self, rows: 'Iterable[ipw.HBox]') -> None:
+        '''
+        self.closerows(rows: Iterable[ipw.HBox]) -> None
+        
+        Closes the given rows and their buttons.
+        
+        See ``utils.closewidgets`` for more infomation.
+        
+        Parameters:
+        -----------
+            rows (Iterable[ipw.HBox]): Rows to close.
+        '''
+        shared = [self.__class__.node_layout, self.__class__.open_layout]
+        shared += list(self.toggle_layouts.values())
+        
+        for row in rows:
+            utils.closewidgets(row.children, shared)
+            utils.closewidgets((row,))
+            
+    def close(self) -> None:
+        '''
+        self.close() -> None
+        
+        Wrapper around the 'close' method of the parent which first closes
+        the rows and the layouts they share, and the Output widget if the 
+        WidgetTree owns it.
+        '''
+        self.closerows(row for node, row in getattr(self, 'rows', {}).values())
+        self.rows = {}
+        utils.closewidgets(self.toggle_layouts.values())
+        self.toggle_layouts = {}
+        utils.closewidgets((self.out,)) if self.owns_out else None
+        self.layout.close()
+        super().close()
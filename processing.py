@@ -1,35 +1,69 @@
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from collections.abc import Iterable
 from IPython.display import display
 
+import sys
+import time
+import weakref
+from itertools import islice
+from threading import Lock
+
 try:
     from utils import backend as utils
+    from utils import frontend
 except ImportError:
     from .utils import backend as utils
+    from .utils import frontend
 
 class EnvHandeler(utils.EnvObj):
     '''
-    EnvHandeler(name:str, display_as:str='df', **kwargs[dict_args: Iterable=[], 
-        dict_kwargs: dict={}, df_args: Iterable=[], df_kwargs: dict={}, 
-        html_args: Iterable=[], html_kwargs: dict={}])
+    EnvHandeler(name:str, display_as:str='df', incremental: bool=False,
+        quarantine: utils.Quarantine=None, parent: EnvHandeler=None, 
+        path: str=None, snapshot: tuple=None, **kwargs[dict_args: Iterable=[], dict_kwargs: dict={}, 
+        df_args: Iterable=[], df_kwargs: dict={}, html_args: Iterable=[], 
+        html_kwargs: dict={}])
     
     For processing and displaying the contents objects.
     
+    The 'dicti', 'df' and 'html' attributes are views which are marked as
+    stale by each update and only recreated when next accessed, so views
+    which are never used (e.g. 'html' by widgets) are never created.
+    
     Parameters:
     -----------
         name (str): Name by which the object can be referenced in the main 
             enviroment.
         display_as (str): Name of the attribute to be displayed by the
             ``_ipython_display_`` method (default = 'df').
+        incremental (bool): Weather or not updates should patch only the
+            rows of ``self.df`` whose variables were added, removed or
+            rebound since the last update, rather than rebuilding it
+            (default = False).
+        quarantine (utils.Quarantine): Time budget used when computing the
+            extra columns of ``self.df``.  Slow cells are given the value
+            'Slow' and their (type, column) pairs are skipped by later 
+            updates until re-enabled.  If None, cells are not timed 
+            (default = None).
+        parent (EnvHandeler): EnvHandeler from whose 'env' attribute the
+            'env' attribute is resolved, rather than from the __main__
+            enviroment, using ``path`` (default = None).
+        path (str): Plain path, relative to ``parent.env``, of the object
+            (e.g. 'foo.bar').  Only used if ``parent`` is given (default =
+            None).
+        snapshot (tuple): Prefetched (env, dicti, df) snapshot, used in 
+            place of the first extraction if env is the resolved 'env' 
+            attribute (default = None).  See ``EnvPrefetcher``.
         **kwargs: Key word defaluts used by ``self.updatefromenv``
             and other methods to update ``self.dicti``, ``self.df`` and
             ``self.html``.
                 - dict_args (Iterable): Positional arguments for 
                     ``self.setdict`` (default = []).
                 - dict_kwargs (dict): Key word arguments for ``self.setdict`` 
-                    (default = {}).
+                    (default = {}).  E.g. ``{'lazy': True}`` stops properties
+                    and other descriptors from being evaluated.
                 - df_args (Iterable): Positional arguments for ``self.setdf`` 
                     (default = []).
                 - df_kwargs (dict): Key word arguments for ``self.setdf`` 
@@ -40,16 +74,78 @@ class EnvHandeler(utils.EnvObj):
                     (default = {}).        
     '''
     
+    view_setters = {'dicti': 'setdict', 'df': 'setdf', 'html': 'sethtml'}
+    
     def __init__(self,
                  name: str,
                  display_as: str='df',
+                 incremental: bool=False,
+                 quarantine: utils.Quarantine=None,
+                 parent: 'EnvHandeler'=None,
+                 path: str=None,
+                 snapshot: tuple=None,
                  **kwargs):
         super().__init__()
         self.setname(name)
+        self.setparent(parent, path)
         self.setenv()
         self.display_as = display_as
+        self.incremental = incremental
+        self.quarantine = quarantine
+        self.df_source = None
+        self.html_source = None
+        self.views = {}
+        self.view_params = {}
+        self.stale = set()
+        self.shared = set()
         self.update_params = kwargs
+        self.prefetcher = None
+        self.subenvs = SubenvCache()
         self.updatefromenv(**self.update_params)
+        
+        if snapshot is not None and snapshot[0] is self.env:
+            EnvHandeler.updatefromsnapshot(self, *snapshot)
+    
+    @property
+    def dicti(self) -> utils.EnvDict:
+        '''
+        Dictionary of the attributes of ``self.env``, created on first access
+        after each update.
+        
+        See ``self.getview`` and ``self.setdict`` for more infomation.
+        '''
+        return self.getview('dicti')
+    
+    @dicti.setter
+    def dicti(self, dicti: utils.EnvDict) -> None:
+        self.setview('dicti', dicti)
+        
+    @property
+    def df(self) -> utils.EnvDf:
+        '''
+        DataFrame of ``self.dicti``, created on first access after each 
+        update.
+        
+        See ``self.getview`` and ``self.setdf`` for more infomation.
+        '''
+        return self.getview('df')
+    
+    @df.setter
+    def df(self, df: utils.EnvDf) -> None:
+        self.setview('df', df)
+        
+    @property
+    def html(self) -> utils.HTMLCode:
+        '''
+        HTML table of ``self.df``, created on first access after each update.
+        
+        See ``self.getview`` and ``self.sethtml`` for more infomation.
+        '''
+        return self.getview('html')
+    
+    @html.setter
+    def html(self, html: utils.HTMLCode) -> None:
+        self.setview('html', html)
     
     @property
     def displayer_(self) -> 'Any':
@@ -82,14 +178,94 @@ class EnvHandeler(utils.EnvObj):
         for i in self.df.index:
             yield i
         
+    def getview(self, view: str) -> 'Any':
+        '''
+        self.getview(view: str) -> Any
+        
+        Returns the value of the given view ('dicti', 'df' or 'html'), first
+        recreating it, using the arguments given to the last update, if it
+        is stale.
+        
+        See ``self.invalidate`` and ``self.updatefromenv`` for more 
+        infomation.
+        
+        Parameters:
+        -----------
+            view (str): One of 'dicti', 'df' and 'html'.
+        '''
+        if view in self.stale:
+            args, kwargs = self.view_params.get(view, ([], {}))
+            getattr(self, self.view_setters[view])(*args, **kwargs)
+            
+        try:
+            return self.views[view]
+        except KeyError:
+            raise AttributeError(view) from None
+        
+    def setview(self, view: str, value: 'Any', shared: bool=False) -> None:
+        '''
+        self.setview(view: str, value: Any, shared: bool=False) -> None
+        
+        Inplace method for setting the value of the given view and marking
+        it as up to date.
+        
+        Parameters:
+        -----------
+            view (str): One of 'dicti', 'df' and 'html'.
+            value (Any): New value of the view.
+            shared (bool): Weather or not the value is shared with other 
+                objects (e.g. a snapshot passed to every subscriber of a 
+                ``SnapshotHub``), in which case ``self.updatenames`` 
+                patches a copy of it rather than the value itself 
+                (default is False).  A value which is already the view 
+                stays shared.
+        '''
+        shared = shared or (view in self.shared and self.views.get(view) is value)
+        self.views[view] = value
+        self.stale.discard(view)
+        self.shared.add(view) if shared else self.shared.discard(view)
+        
+    def invalidate(self, *views) -> None:
+        '''
+        self.invalidate(*views) -> None
+        
+        Inplace method for marking the given views as stale, so they are
+        recreated when next accessed.  If no views are given, all three are
+        marked.
+        
+        Parameters:
+        -----------
+            *views (str): Any of 'dicti', 'df' and 'html'.
+        '''
+        self.stale.update(views or self.view_setters)
+        
+    def isstale(self, view: str) -> bool:
+        '''
+        self.isstale(view: str) -> bool
+        
+        Returns weather the given view is stale.
+        
+        Parameters:
+        -----------
+            view (str): One of 'dicti', 'df' and 'html'.
+        '''
+        return view in self.stale
+    
     def getenv(self) -> 'Any':
         '''
         self.getenv() -> 'Any'
         
-        Evaluates ``self.name`` in the __main__ enviroment and returns
-        the result.
+        Resolves ``self.name`` in the __main__ enviroment and returns
+        the result.  If the EnvHandeler has a parent, the relative path is
+        instead resolved from the parent's (already resolved) 'env' 
+        attribute.
+        
+        See ``utils.EnvPath`` and ``self.setparent`` for more infomation.
         '''
-        return utils.maineval(self.name)
+        if self.parent is not None:
+            return self.relpath.resolve(self.parent.env)
+        
+        return self.path.resolve()
     
     def getdict(self, *args, **kwargs) -> utils.EnvDict:
         '''
@@ -97,6 +273,15 @@ class EnvHandeler(utils.EnvObj):
         
         Uses ``utils.envtodict`` to return a dictionary of all required
         attributes of ``self.env``
+        
+        See ``utils.envtodict`` for more infomation.
+        
+        Parameters:
+        -----------
+            *args: Positional argumentents passed to ``utils.envtodict``
+                (after the first 'env' argument as this is fixed at 
+                ``self.env``).
+            **kwargs: Key word arguments passed to ``utils.envtodict``.
         '''
         return utils.envtodict(self.env, *args, **kwargs)
     
@@ -118,7 +303,21 @@ class EnvHandeler(utils.EnvObj):
                 ``self.dicti``).
             **kwargs: Key word arguments passed to ``utils.envtopandas``.
         '''
-        return utils.envtopandas(self.dicti, *args, **kwargs)
+        return utils.envtopandas(self.dicti, *args, **self.getdfkwargs(kwargs))
+    
+    def getdfkwargs(self, kwargs: dict) -> dict:
+        '''
+        self.getdfkwargs(kwargs: dict) -> dict
+        
+        Returns the given key word arguments for ``utils.envtopandas`` with
+        'quarantine' defaulting to ``self.quarantine`` and 'types' to the
+        shared ``utils.typecache``.
+        
+        Parameters:
+        -----------
+            kwargs (dict): Key word arguments for ``utils.envtopandas``.
+        '''
+        return {'quarantine': self.quarantine, 'types': utils.typecache, **kwargs}
     
     def gethtml(self, *args, **kwargs) -> str:
         '''
@@ -142,7 +341,8 @@ class EnvHandeler(utils.EnvObj):
         '''
         self.setname(name: str) -> None
         
-        Inplace method for setting the name attribute.
+        Inplace method for setting the name attribute and the 'path'
+        attribute, the ``utils.EnvPath`` used to resolve it.
         
         Parameters:
         -----------
@@ -150,16 +350,56 @@ class EnvHandeler(utils.EnvObj):
                 enviroment.
         '''
         self.name = str(name)
+        self.path = utils.EnvPath(self.name)
+        
+    def setparent(self, parent: 'EnvHandeler'=None, path: str=None) -> None:
+        '''
+        self.setparent(parent: EnvHandeler=None, path: str=None) -> None
+        
+        Inplace method for setting the 'parent' and 'relpath' attributes.
+        If either argument is None, or ``path`` is not a plain path, the 
+        EnvHandeler has no parent and is resolved from its name.
+        
+        See ``utils.EnvPath`` for more infomation.
+        
+        Parameters:
+        -----------
+            parent (EnvHandeler): EnvHandeler to resolve from (default is
+                None).
+            path (str): Plain path relative to ``parent.env`` (default is
+                None).
+        '''
+        try:
+            relpath = None if parent is None or path is None else utils.EnvPath(path, relative=True)
+        except (ValueError, SyntaxError):
+            relpath = None
+        
+        self.parent = None if relpath is None else parent
+        self.relpath = relpath
     
     def setenv(self) -> None:
         '''
         self.setenv() -> None
         
-        Inplace method for setting the env attribute.
+        Inplace method for setting the env attribute, and evicting the 
+        cached subenvs which no longer belong to it.
         
-        See ``self.getenv`` for more infomation.
+        See ``self.getenv`` and ``SubenvCache.prune`` for more infomation.
         '''
         self.env = self.getenv()
+        self.prunesubenvs()
+        
+    def prunesubenvs(self) -> None:
+        '''
+        self.prunesubenvs() -> None
+        
+        Evicts the subenvs cached by the 'subenvs' attribute whose path no 
+        longer resolves to their object from the 'env' attribute.
+        
+        See ``SubenvCache.prune`` for more infomation.
+        '''
+        subenvs = getattr(self, 'subenvs', None)
+        subenvs.prune(self.env) if subenvs is not None else None
         
     def setdict(self, *args, **kwargs) -> None:
         '''
@@ -177,14 +417,26 @@ class EnvHandeler(utils.EnvObj):
         
         Inplace method for setting the df attribute.
         
-        See ``self.getdf`` for more infomation.
+        If ``self.incremental`` is True and ``self.df`` was created with the
+        same arguments, ``utils.envpatch`` is used to only recompute the rows
+        which changed since ``self.df`` was created.
+        
+        See ``self.getdf`` and ``utils.envpatch`` for more infomation.
         
         Parameters:
         -----------
             *args: Positional argumentents passed to ``self.getdf``.
             **kwargs: Key word arguments passed to ``self.getdf``.
         '''
-        self.df = self.getdf(*args, **kwargs)
+        source = (self.dicti, args, kwargs)
+        
+        if self.incremental and self.df_source is not None and self.df_source[1:] == source[1:]:
+            self.df = utils.envpatch(self.views['df'], self.df_source[0], self.dicti, 
+                                     *args, **self.getdfkwargs(kwargs))
+        else:
+            self.df = self.getdf(*args, **kwargs)
+        
+        self.df_source = source
         
     def sethtml(self, *args, **kwargs) -> None:
         '''
@@ -194,6 +446,10 @@ class EnvHandeler(utils.EnvObj):
         as an instance of the ``utils.HTMLCode`` class, initialised with the 
         string generated by ``self.gethtml``.
         
+        If ``self.incremental`` is True and neither ``self.df`` nor the
+        arguments have changed since ``self.html`` was created, ``self.html``
+        is left as is.
+        
         See ``self.gethtml`` and ``utils.HTMLCode`` for more infomation.
         
         Parameters:
@@ -201,7 +457,15 @@ class EnvHandeler(utils.EnvObj):
             *args: Positional argumentents passed to ``self.gethtml``.
             **kwargs: Key word arguments passed to ``self.gethtmls``.
         '''
-        self.html = utils.HTMLCode(self.gethtml(*args, **kwargs))
+        source = (self.df, args, kwargs)
+        
+        if (self.incremental and self.html_source is not None and 
+            self.html_source[0] is self.df and self.html_source[1:] == source[1:]):
+            self.html = self.views['html']
+        else:
+            self.html = utils.HTMLCode(self.gethtml(*args, **kwargs))
+        
+        self.html_source = source
     
     def updatefromname(self, name: str=None) -> 'EnvHandeler':
         '''
@@ -217,6 +481,7 @@ class EnvHandeler(utils.EnvObj):
             name (str): String passed to ``self.setname``.  If None,
                 ``self.setname`` will not be called. (default is None).
         '''
+        self.setparent() if name is not None else None
         self.setname(name) if name is not None else None
         self.setenv()
         
@@ -234,15 +499,16 @@ class EnvHandeler(utils.EnvObj):
                df_args: Iterable=[], df_kwargs: dict={}, html_args: Iterable=[],
                html_kwargs: dict={}) -> 'EnvHandeler'
         
-        Updates the 'dict', 'df' and 'html' attributes. And returns the EnvHandeler
-        in its resultant state.
+        Marks the 'dict', 'df' and 'html' attributes as stale, storing the 
+        arguments with which they will be recreated on first access. And 
+        returns the EnvHandeler in its resultant state.
         
         Note, ``self.updatefromname`` should generally be called as a prerequisit
         to this method as this method updates based of the current 'env' 
         attribute.
         
-        See ``self.setdict``, ``self.setdf`` and ``self.sethtml`` for more
-        infomation.
+        See ``self.getview``, ``self.setdict``, ``self.setdf`` and 
+        ``self.sethtml`` for more infomation.
         
         Parameters:
         -----------
@@ -259,42 +525,310 @@ class EnvHandeler(utils.EnvObj):
             html_kwargs (dict): Key word arguments passed to 
                 ``self.sethtml``.
         '''
-        self.setdict(*dict_args, **dict_kwargs)
-        self.setdf(*df_args, **df_kwargs)
-        self.sethtml(*html_args, **html_kwargs)
+        self.view_params = {
+            'dicti': (dict_args, dict_kwargs),
+            'df': (df_args, df_kwargs),
+            'html': (html_args, html_kwargs),
+        }
+        self.invalidate()
+        
+        return self
+        
+    def updatefromsnapshot(self, 
+                           env: 'Any', 
+                           dicti: utils.EnvDict, 
+                           df: utils.EnvDf=None) -> 'EnvHandeler':
+        '''
+        self.updatefromsnapshot(env: Any, dicti: utils.EnvDict, 
+            df: utils.EnvDf=None) -> EnvHandeler
+        
+        Updates the EnvHandeler from an already taken snapshot, i.e. the
+        'env' and 'dicti' attributes are set to the given objects and the 
+        'df' and 'html' attributes are marked as stale, to be recreated 
+        using the 'update_params' attribute.  Returns the EnvHandeler in 
+        its resultant state.
+        
+        See ``SnapshotHub`` and ``EnvPrefetcher`` for more infomation.
+        
+        Parameters:
+        -----------
+            env (Any): The object ``self.name`` refers to.
+            dicti (utils.EnvDict): Snapshot of env, as created by 
+                ``self.getdict``.
+            df (utils.EnvDf): If given, used as the 'df' attribute rather 
+                than recreating it.  It must have been created from dicti
+                using the 'update_params' attribute (default is None).
+        '''
+        self.updatefromenv(**self.update_params)
+        self.env = env
+        self.setview('dicti', dicti, shared=True)
+        self.prunesubenvs()
+        
+        if df is not None:
+            (df_args, df_kwargs) = self.view_params['df']
+            self.setview('df', df, shared=True)
+            self.df_source = (dicti, tuple(df_args), df_kwargs)
         
         return self
+    
+    def getsnapshotkey(self) -> tuple:
+        '''
+        self.getsnapshotkey() -> tuple
+        
+        Returns a tuple identifying the snapshots this EnvHandeler can be
+        updated from, i.e. its name and the arguments it passes to 
+        ``self.getdict``.  EnvHandelers with equal keys can share a 
+        snapshot.
+        '''
+        params = self.update_params
         
-    def update(self, name: str=None, **kwargs) -> 'EnvHandeler':
+        return self.name, repr(params.get('dict_args', [])), repr(params.get('dict_kwargs', {}))
+    
+    def getdfkey(self) -> tuple:
+        '''
+        self.getdfkey() -> tuple
+        
+        Returns a tuple identifying the 'df' attributes this EnvHandeler 
+        creates from a given snapshot, i.e. the arguments it passes to 
+        ``self.getdf`` and the identity of its quarantine.  EnvHandelers 
+        with equal snapshot keys (see ``self.getsnapshotkey``) and df keys
+        can share a 'df' attribute.
         '''
-        self.update(name: str=None, **kwargs) -> 'EnvHandeler'
+        params = self.update_params
+        
+        return repr(params.get('df_args', [])), repr(params.get('df_kwargs', {})), id(self.quarantine)
+    
+    def update(self, 
+               name: str=None, 
+               names: 'Iterable[str]'=None, 
+               **kwargs) -> 'EnvHandeler':
+        '''
+        self.update(name: str=None, names: Iterable[str]=None, **kwargs) 
+            -> 'EnvHandeler'
         
         Updates the EnvHandeler from the name passed and returns it in its 
         resultant state.
         
-        See ``self.updatefromname`` and ``self.updatefromenv`` for more
-        infomation.
+        See ``self.updatefromname``, ``self.updatefromenv`` and 
+        ``self.updatenames`` for more infomation.
         
         Parameters:
         -----------
             name (str): 'name' argument passed to ``self.updatefromname``
                 (default is None).
+            names (Iterable[str]): If given, only the rows of these 
+                variables are updated, using ``self.updatenames`` (default
+                is None).
             **kwargs: Key word arguments passed to ``self.updatefromenv``.
                 If no key word arguments (other then 'name') are passed,
                 the value of the 'update_params' attribute is used instead.
         '''
         self.updatefromname(name)
+        
+        if names is not None:
+            return self.updatenames(names)
+        
         kwargs = self.update_params if kwargs == {} else kwargs
         self.updatefromenv(**kwargs)
         
         return self
     
+    def updatenames(self, names: 'Iterable[str]') -> 'EnvHandeler':
+        '''
+        self.updatenames(names: Iterable[str]) -> EnvHandeler
+        
+        Updates only the given variables of the 'dicti' and 'df' attributes,
+        from the current 'env' attribute, and returns the EnvHandeler in its
+        resultant state.  Every other row is left untouched, so the cost 
+        depends on the number of names given rather than the number of 
+        variables.  The 'html' attribute is marked as stale.
+        
+        'dicti' and 'df' are patched inplace, unless they are shared (see 
+        ``self.setview``), in which case copies of them are patched and 
+        kept, or names are added or removed, in which case a new 'df' is 
+        created (see ``utils.envpatch``).  References to them held 
+        elsewhere therefore see the update.
+        
+        If 'dicti' or 'df' is already stale, there is nothing to patch and
+        they will be recreated in full when next accessed.
+        
+        See ``utils.envrefresh`` and ``utils.envpatch`` for more infomation.
+        
+        Parameters:
+        -----------
+            names (Iterable[str]): Names of the variables to be updated.
+        '''
+        names = [names] if isinstance(names, str) else list(names)
+        
+        if self.isstale('dicti') or self.isstale('df'):
+            return self
+        
+        (dict_args, dict_kwargs) = self.view_params.get('dicti', ([], {}))
+        (df_args, df_kwargs) = self.view_params.get('df', ([], {}))
+        old = self.dicti
+        before = utils.EnvDict((name, old[name]) for name in names if name in old)
+        new = utils.envrefresh(old, self.env, names, *dict_args, 
+                               inplace='dicti' not in self.shared, **dict_kwargs)
+        self.dicti = new
+        self.df = utils.envpatch(self.df, before, new, *df_args, names=names, 
+                                 inplace='df' not in self.shared, 
+                                 **self.getdfkwargs(df_kwargs))
+        self.df_source = (new, tuple(df_args), df_kwargs)
+        self.invalidate('html')
+        
+        if new is old and self.prefetcher is not None:
+            self.prefetcher.clear()
+        
+        return self
+    
+    def iterupdate(self, 
+                   name: str=None, 
+                   chunk_size: int=1000, 
+                   time_slice: float=None) -> 'Iterator[EnvHandeler]':
+        '''
+        self.iterupdate(name: str=None, chunk_size: int=1000, 
+            time_slice: float=None) -> Iterator[EnvHandeler]
+        
+        Chunked version of ``self.update``, meant for loading a new target.
+        The 'dicti' and 'df' attributes are extracted in chunks, using the 
+        'update_params' attribute, and set to everything extracted so far
+        after the first chunk, then each time the number of variables has 
+        doubled, and after the last chunk, so the total cost of building 
+        them stays linear in the number of variables.  The EnvHandeler is 
+        yielded each time they are set.  The 'html' attribute is marked as
+        stale.  Variables deleted whilst extracting are left out.
+        
+        Nothing is extracted until the iterator is advanced, so the caller
+        decides what happens between chunks, e.g. publish the partial 
+        results and let the kernel handle other messages.
+        
+        See ``utils.envchunks`` for more infomation.
+        
+        Parameters:
+        -----------
+            name (str): 'name' argument passed to ``self.updatefromname``
+                (default is None).
+            chunk_size (int): Maximum number of variables per chunk 
+                (default is 1000).
+            time_slice (float): Maximum number of seconds per chunk.  If 
+                None, chunks are only limited by ``chunk_size`` (default is
+                None).
+        '''
+        self.updatefromname(name)
+        self.updatefromenv(**self.update_params)
+        
+        (dict_args, dict_kwargs) = self.view_params['dicti']
+        (df_args, df_kwargs) = self.view_params['df']
+        chunks = utils.envchunks(
+            utils.envitems(self.env, *dict_args, skip_missing=True, **dict_kwargs),
+            *df_args,
+            chunk_size=chunk_size,
+            time_slice=time_slice,
+            **self.getdfkwargs(df_kwargs),
+        )
+        dicti = utils.EnvDict()
+        frames = []
+        published = -1
+        
+        for chunk, frame in chunks:
+            dicti.update(chunk)
+            frames.append(frame)
+            
+            if len(dicti) >= 2 * published:
+                yield self.setchunks(dicti, frames)
+                published = len(dicti)
+                
+        if len(dicti) != published:
+            yield self.setchunks(dicti, frames)
+            
+        self.df_source = (self.dicti, tuple(df_args), df_kwargs)
+        
+    def setchunks(self, dicti: utils.EnvDict, frames: list) -> 'EnvHandeler':
+        '''
+        self.setchunks(dicti: utils.EnvDict, frames: list) -> EnvHandeler
+        
+        Sets the 'dicti' attribute to a copy of the given EnvDict and the 
+        'df' attribute to the concatenation of the given EnvDfs (see 
+        ``utils.envconcat``), which are replaced inplace by the result, and
+        returns the EnvHandeler.  Used by ``self.iterupdate``.
+        
+        Parameters:
+        -----------
+            dicti (utils.EnvDict): Variables extracted so far.
+            frames (list): EnvDfs of the chunks extracted so far.
+        '''
+        if len(frames) > 1:
+            frames[:] = [utils.envconcat(frames)]
+            
+        df = frames[0]
+        self.dicti = utils.EnvDict(dicti)
+        self.df = df
+        
+        return self
+    
+    def gettree(self, **kwargs) -> 'EnvTree':
+        '''
+        self.gettree(**kwargs) -> EnvTree
+        
+        Returns a lazily expanded tree of the attributes of the 'env' 
+        attribute, whose nodes only read their direct attributes once 
+        expanded.
+        
+        See ``EnvTree`` for more infomation.
+        
+        Parameters:
+        -----------
+            **kwargs: Key word arguments passed to ``EnvTree``.
+        '''
+        return EnvTree(self, **kwargs)
+    
+    def getsubparams(self) -> dict:
+        '''
+        self.getsubparams() -> dict
+        
+        Returns the key word arguments, other than 'name' and the update
+        parameters, with which ``self.subenv`` initialises new EnvHandelers
+        so that they share the settings of self ('display_as', 
+        'incremental' and 'quarantine').
+        '''
+        return {
+            'display_as': self.display_as,
+            'incremental': self.incremental,
+            'quarantine': self.quarantine,
+        }
+    
+    def getsubenvkey(self, var: str) -> 'tuple|None':
+        '''
+        self.getsubenvkey(var: str) -> tuple|None
+        
+        Returns the key of the given attribute, or chain of attributes, of 
+        the 'env' attribute in the 'subenvs' attribute, i.e. the path and 
+        the identity of the object it resolves to.  Returns None if the 
+        path cannot be resolved.
+        
+        See ``SubenvCache`` for more infomation.
+        
+        Parameters:
+        -----------
+            var (str): Plain path relative to the 'env' attribute.
+        '''
+        try:
+            obj = utils.EnvPath(var, relative=True).resolve(self.env)
+        except Exception:
+            return None
+        
+        return var, id(obj), obj
+    
     def subenv(self, var: 'str|Iterable[str]', **kwargs) -> 'EnvHandeler':
         '''
         self.subenv(var: str|Iterable[str], **kwargs) -> EnvHandeler
         
         Creates and returns an EnvHandeler for a given attribute or
-        chain of attributes of the 'env' attribute.
+        chain of attributes of the 'env' attribute.  The new EnvHandeler
+        resolves its 'env' attribute from the 'env' attribute of self, 
+        rather than from the __main__ enviroment.
+        
+        See ``self.getsubparams`` and ``self.setparent`` for more infomation.
         
         See ``EnvHandeler`` for more information.
         
@@ -310,16 +844,40 @@ class EnvHandeler(utils.EnvObj):
             **kwargs: Key word arguments passed to ``EnvHandeler.__init__``.
                 If no key word arguments are passed (except for 'name' and 
                 'display_as'), the value of the 'update_params' attribute is 
-                used instead.
+                used instead, along with any snapshot of var taken by the 
+                'prefetcher' attribute (see ``EnvPrefetcher``), and the
+                EnvHandeler is cached by the 'subenvs' attribute (see 
+                ``SubenvCache``).  Cached EnvHandelers are updated (see 
+                ``self.update``) each time they are reused.
+                
+                Note, cached EnvHandelers are shared by every caller and 
+                owned by the cache: once evicted, those with a 'close' 
+                method are closed unless they have been displayed.  To keep
+                one which is not displayed, remove it from the cache using
+                ``self.subenvs.discard``, after which closing it is up to 
+                the caller.
         '''
         kwargs = self.update_params if kwargs == {} else kwargs
         
         if isinstance(var, str):
+            key = self.getsubenvkey(var) if kwargs is self.update_params else None
+            env = self.subenvs.get(key) if key is not None and self.subenvs is not None else None
+            
+            if env is not None:
+                env.update()
+                return env
+            
+            prefetched = self.prefetcher is not None and kwargs is self.update_params
             env = self.__class__(
                 name=f'{self.name}.{var}', 
-                display_as=self.display_as,
-                **kwargs,
+                parent=self,
+                path=var,
+                snapshot=self.prefetcher.pop(var) if prefetched else None,
+                **{**self.getsubparams(), **kwargs},
             )
+            
+            if key is not None and self.subenvs is not None:
+                self.subenvs.put(key, env)
         else:
             env = self
             name = '.'.join(var)
@@ -329,4 +887,861 @@ class EnvHandeler(utils.EnvObj):
                 
         return env
 
+class SubenvCache(utils.EnvObj):
+    '''
+    SubenvCache(maxsize: int=32, max_bytes: int=64 * 2**20)
+    
+    Least recently used cache of the EnvHandelers created by 
+    ``EnvHandeler.subenv``, keyed by their path and the identity of the 
+    object it resolves to, so going back and forth between the same 
+    attributes reuses their EnvHandelers (and widgets) rather than creating
+    new ones.  ``EnvHandeler.subenv`` updates them each time they are 
+    reused.
+    
+    The cache holds no reference to the objects themselves, only to the 
+    EnvHandelers, whose 'env' attribute is used to check their identity.
+    EnvHandelers whose path no longer resolves to their object are evicted
+    by ``self.prune``, which the parent calls each time it resolves its 
+    own 'env' attribute, so the objects are freed once the parent has 
+    been updated.
+    
+    The least recently used EnvHandelers are evicted once there are more 
+    than 'maxsize' of them or their estimated size exceeds 'max_bytes' 
+    (see ``self.getsize``).
+    
+    Evicted EnvHandelers with a 'close' method, i.e. widgets, are closed 
+    unless they have been displayed (i.e. have a true 'displayed' 
+    attribute), in which case they are only removed from the cache and 
+    are left for the caller to close.
+    
+    Parameters:
+    -----------
+        maxsize (int): Maximum number of cached EnvHandelers (default is 
+            32).
+        max_bytes (int): Maximum total estimated size, in bytes, of the 
+            cached EnvHandelers (default is 64 MiB).
+            
+    Attributes:
+    -----------
+        hits (int): Number of EnvHandelers reused.
+        misses (int): Number of EnvHandelers not found.
+        evictions (int): Number of EnvHandelers evicted.
+    '''
+    
+    def __init__(self, maxsize: int=32, max_bytes: int=64 * 2**20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def __len__(self):
+        return len(self.entries)
+    
+    @property
+    def hitrate_(self) -> float:
+        '''
+        Fraction of lookups which found an EnvHandeler, or 0 if there have
+        been none.
+        '''
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def getsize(self, handler: EnvHandeler) -> int:
+        '''
+        self.getsize(handler: EnvHandeler) -> int
+        
+        Returns the shallow estimated size, in bytes, of the views held by
+        the given EnvHandeler (stale or not), i.e. the shallow memory usage
+        of its 'df' attribute plus ``sys.getsizeof`` of its 'dicti' and 
+        'html' attributes.  The values themselves are not measured, as they
+        are kept alive by the parent's object anyway, so the cost does not
+        depend on them.
+        
+        Parameters:
+        -----------
+            handler (EnvHandeler): A cached EnvHandeler.
+        '''
+        size = 0
+        
+        try:
+            for view, obj in handler.views.items():
+                if view == 'df':
+                    size += int(obj.memory_usage(index=True, deep=False).sum())
+                else:
+                    size += sys.getsizeof(obj)
+        except Exception:
+            return 0
+        
+        return size
+    
+    def get(self, key: tuple) -> 'EnvHandeler|None':
+        '''
+        self.get(key: tuple) -> EnvHandeler|None
+        
+        Returns the EnvHandeler cached under the given key, marking it as
+        the most recently used and estimating its size again (its views 
+        may have been created since it was cached), or None if there is 
+        none.  The cache is then shrunk to within its limits (see 
+        ``self.shrink``).
+        
+        Parameters:
+        -----------
+            key (tuple): A (path, id, obj) key given by 
+                ``EnvHandeler.getsubenvkey``.
+        '''
+        entry = self.entries.get(key[:2])
+        
+        if entry is None or entry[0].env is not key[2]:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        size = self.getsize(entry[0])
+        self.entries[key[:2]] = (entry[0], size)
+        self.bytes += size - entry[1]
+        self.entries.move_to_end(key[:2])
+        self.shrink()
+        
+        return entry[0]
+    
+    def put(self, key: tuple, handler: EnvHandeler) -> None:
+        '''
+        self.put(key: tuple, handler: EnvHandeler) -> None
+        
+        Caches the given EnvHandeler under the given key, as the most 
+        recently used, and evicts EnvHandelers until the cache is within 
+        its limits.
+        
+        Parameters:
+        -----------
+            key (tuple): A (path, id, obj) key given by 
+                ``EnvHandeler.getsubenvkey``.
+            handler (EnvHandeler): EnvHandeler to cache.
+        '''
+        self.remove(key[:2])
+        size = self.getsize(handler)
+        self.entries[key[:2]] = (handler, size)
+        self.bytes += size
+        self.shrink()
+        
+    def shrink(self) -> None:
+        '''
+        self.shrink() -> None
+        
+        Evicts the least recently used EnvHandelers until the cache is 
+        within the 'maxsize' and 'max_bytes' attributes, always keeping the
+        most recently used one.
+        
+        See ``self.evict`` for more infomation.
+        '''
+        while len(self.entries) > 1 and (len(self.entries) > self.maxsize or self.bytes > self.max_bytes):
+            self.evict(next(iter(self.entries)))
+            
+    def prune(self, env: 'Any') -> None:
+        '''
+        self.prune(env: Any) -> None
+        
+        Evicts the EnvHandelers whose path no longer resolves, from the 
+        given (parent) object, to the object they were cached for.
+        
+        Parameters:
+        -----------
+            env (Any): The 'env' attribute of the parent.
+        '''
+        for key in list(self.entries):
+            try:
+                obj = utils.EnvPath(key[0], relative=True).resolve(env)
+            except Exception:
+                obj = None
+                
+            self.evict(key) if obj is None or id(obj) != key[1] else None
+            
+    def remove(self, key: tuple) -> 'EnvHandeler|None':
+        '''
+        self.remove(key: tuple) -> EnvHandeler|None
+        
+        Removes and returns the EnvHandeler cached under the given (path, 
+        id) key, without closing it, or None if there is none.
+        
+        Parameters:
+        -----------
+            key (tuple): A (path, id) key.
+        '''
+        entry = self.entries.pop(key, None)
+        
+        if entry is None:
+            return None
+        
+        self.bytes -= entry[1]
+        
+        return entry[0]
+    
+    def evict(self, key: tuple) -> None:
+        '''
+        self.evict(key: tuple) -> None
+        
+        Removes the EnvHandeler cached under the given (path, id) key, and
+        closes it if it has a 'close' method and has not been displayed.
+        
+        Parameters:
+        -----------
+            key (tuple): A (path, id) key.
+        '''
+        handler = self.remove(key)
+        
+        if handler is not None:
+            self.evictions += 1
+            close = getattr(handler, 'close', None)
+            close() if callable(close) and not getattr(handler, 'displayed', False) else None
+            
+    def discard(self, handler: EnvHandeler) -> None:
+        '''
+        self.discard(handler: EnvHandeler) -> None
+        
+        Removes the given EnvHandeler, without closing it, if it is cached.
+        
+        Parameters:
+        -----------
+            handler (EnvHandeler): Any EnvHandeler.
+        '''
+        for key, entry in list(self.entries.items()):
+            self.remove(key) if entry[0] is handler else None
+            
+    def clear(self) -> None:
+        '''
+        self.clear() -> None
+        
+        Evicts every cached EnvHandeler.
+        
+        See ``self.evict`` for more infomation.
+        '''
+        for key in list(self.entries):
+            self.evict(key)
+
+class EnvPrefetcher(utils.EnvObj):
+    '''
+    EnvPrefetcher(handler: EnvHandeler, max_rows: int=10000, 
+        time_slice: float=0.02, label_rows: int=100)
+    
+    Speculatively takes snapshots of the given attributes of 
+    ``handler.env``, i.e. the 'dicti' and 'df' attributes that 
+    ``handler.subenv`` would create for them, so that drilling down into
+    them does not need to extract anything.  The labels of the first rows
+    of each snapshot are also created, warming ``frontend.labelcache``.
+    
+    Work is done a time slice at a time, by ``self.step``, which is meant
+    to be run in a worker thread whilst the kernel is idle (see 
+    ``WidgetEnv``), so extracting attributes never holds the event loop.
+    Snapshots are taken whilst their total number of rows is within 
+    'max_rows', which is enforced whilst extracting each attribute, and 
+    are all discarded when ``handler.dicti`` changes, i.e. on each update 
+    of the handler.  Attributes given as ``utils.LazyAttr`` placeholders 
+    are never evaluated, and snapshots are always taken lazily, i.e. 
+    properties and other descriptors of prefetched attributes are never 
+    evaluated speculatively.  If the handler is not lazy (see the 
+    'dict_kwargs' of ``EnvHandeler``), they are evaluated by ``self.pop``,
+    when the snapshot is used.
+    
+    The prefetcher is used by ``handler.subenv`` once assigned to 
+    ``handler.prefetcher``.
+    
+    Parameters:
+    -----------
+        handler (EnvHandeler): EnvHandeler whose attributes are prefetched.
+        max_rows (int): Maximum total number of rows of the held snapshots
+            (default is 10000).
+        time_slice (float): Number of seconds after which ``self.step``
+            returns (default is 0.02).
+        label_rows (int): Number of rows of each snapshot whose labels are
+            created (default is 100).
+            
+    Attributes:
+    -----------
+        hits (int): Number of snapshots used by ``handler.subenv``.
+        misses (int): Number of drill downs without a snapshot.
+        discarded (int): Number of snapshots discarded unused.
+        types (utils.TypeCache): Cache used when taking snapshots, which 
+            is only used by the prefetcher (see ``self.getdfkwargs``).
+    '''
+    
+    def __init__(self, 
+                 handler: EnvHandeler, 
+                 max_rows: int=10000, 
+                 time_slice: float=0.02, 
+                 label_rows: int=100):
+        self.handler = handler
+        self.max_rows = max_rows
+        self.time_slice = time_slice
+        self.label_rows = label_rows
+        self.snapshots = {}
+        self.pending = []
+        self.skipped = set()
+        self.source = None
+        self.lock = Lock()
+        self.types = utils.TypeCache()
+        self.rows = 0
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        
+    def __len__(self):
+        return len(self.snapshots)
+    
+    def check(self) -> None:
+        '''
+        self.check() -> None
+        
+        Discards every snapshot (see ``self.clear``) if ``handler.dicti``
+        changed since they were taken.
+        '''
+        dicti = self.handler.dicti
+        
+        with self.lock:
+            if dicti is not self.source:
+                self.clearsnapshots()
+                self.source = dicti
+            
+    def clear(self) -> None:
+        '''
+        self.clear() -> None
+        
+        Discards every snapshot and pending name.
+        '''
+        with self.lock:
+            self.clearsnapshots()
+            
+    def clearsnapshots(self) -> None:
+        '''
+        self.clearsnapshots() -> None
+        
+        Discards every snapshot and pending name, without taking the 'lock'
+        attribute.
+        '''
+        self.discarded += len(self.snapshots)
+        self.snapshots = {}
+        self.pending = []
+        self.skipped = set()
+        self.rows = 0
+        
+    def setnames(self, names: 'Iterable[str]') -> None:
+        '''
+        self.setnames(names: Iterable[str]) -> None
+        
+        Sets the names to prefetch, in order, by following calls of 
+        ``self.step``.  Names already prefetched or skipped are left out.
+        
+        Parameters:
+        -----------
+            names (Iterable[str]): Names of attributes of ``handler.env``,
+                e.g. the visible rows of a WidgetEnv.
+        '''
+        self.check()
+        
+        with self.lock:
+            self.pending = [
+                name for name in names 
+                if name not in self.snapshots and name not in self.skipped
+            ]
+        
+    def step(self) -> bool:
+        '''
+        self.step() -> bool
+        
+        Takes snapshots of pending names until the 'time_slice' attribute
+        has elapsed, and returns weather names are still pending.  Names 
+        whose snapshot fails or does not fit within the 'max_rows' 
+        attribute are skipped.  Safe to run in a worker thread, as it does
+        not read ``handler.dicti`` (which could extract it), i.e. snapshots 
+        are taken from the 'dicti' read by the last ``self.check`` (e.g. by
+        ``self.setnames``), and are discarded by the next one if it changed.
+        '''
+        end = time.perf_counter() + self.time_slice
+        (df_args, df_kwargs) = self.handler.view_params.get('df', ([], {}))
+        df_kwargs = self.getdfkwargs(df_kwargs)
+        
+        while True:
+            with self.lock:
+                if not self.pending or time.perf_counter() >= end:
+                    return bool(self.pending)
+                
+                name = self.pending.pop(0)
+                source = self.source
+                budget = self.max_rows - self.rows
+                self.skipped.add(name)
+                
+            env = source.get(name)
+            
+            if name not in source or isinstance(env, utils.LazyAttr):
+                continue
+            
+            try:
+                dicti = utils.EnvDict(islice(utils.envitems(env, lazy=True), budget + 1))
+                
+                if len(dicti) > budget:
+                    continue
+                
+                df = utils.envtopandas(dicti, *df_args, **df_kwargs)
+                
+                for value in df.iloc[:self.label_rows].to_numpy().ravel():
+                    frontend.uselabel(value)
+            except Exception:
+                continue
+            
+            with self.lock:
+                if source is self.source and self.rows + len(dicti) <= self.max_rows:
+                    self.skipped.discard(name)
+                    self.snapshots[name] = (env, dicti, df)
+                    self.rows += len(dicti)
+                    
+    def getdfkwargs(self, kwargs: dict) -> dict:
+        '''
+        self.getdfkwargs(kwargs: dict) -> dict
+        
+        Returns ``handler.getdfkwargs(kwargs)`` with the 'quarantine' and 
+        'types' replaced by ones owned by the prefetcher, so taking 
+        snapshots in a worker thread never changes the state of the 
+        handler's quarantine or of the shared ``utils.typecache``.  The
+        quarantine is a new ``utils.Quarantine`` with the budgets and the
+        quarantined pairs of the handler's one, and the types are the 
+        'types' attribute.
+        
+        Parameters:
+        -----------
+            kwargs (dict): Key word arguments for ``utils.envtopandas``.
+        '''
+        kwargs = self.handler.getdfkwargs(kwargs)
+        quarantine = kwargs['quarantine']
+        
+        if quarantine is not None:
+            kwargs['quarantine'] = utils.Quarantine(quarantine.cell_budget, quarantine.update_budget)
+            kwargs['quarantine'].slow = dict(quarantine.slow)
+        
+        if kwargs['types'] is not None:
+            kwargs['types'] = self.types
+        
+        return kwargs
+        
+    def islazy(self) -> bool:
+        '''
+        self.islazy() -> bool
+        
+        Returns weather the handler creates its 'dicti' attribute lazily, 
+        i.e. weather snapshots can be used as they are.
+        '''
+        (dict_args, dict_kwargs) = self.handler.view_params.get('dicti', ([], {}))
+        
+        return bool(dict_kwargs.get('lazy', dict_args[0] if dict_args else False))
+    
+    def pop(self, name: str) -> 'tuple|None':
+        '''
+        self.pop(name: str) -> tuple|None
+        
+        Removes and returns the (env, dicti, df) snapshot of the given name,
+        or None if it has not been prefetched.  If the handler is not lazy
+        (see ``self.islazy``), the ``utils.LazyAttr`` placeholders of the 
+        snapshot are evaluated first, in which case df is None (i.e. it is
+        recreated), and None is returned if any of them fail.
+        
+        Parameters:
+        -----------
+            name (str): Name of an attribute of ``handler.env``.
+        '''
+        self.check()
+        
+        with self.lock:
+            snapshot = self.snapshots.pop(name, None)
+            
+            if snapshot is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self.rows -= len(snapshot[1])
+            
+        (env, dicti, df) = snapshot
+        
+        if self.islazy() or not any(isinstance(value, utils.LazyAttr) for value in dicti.values()):
+            return snapshot
+        
+        try:
+            values = {
+                attr: value.resolve() if isinstance(value, utils.LazyAttr) else value 
+                for attr, value in dicti.items()
+            }
+        except Exception:
+            return None
+        
+        return env, utils.EnvDict(
+            (attr, value) for attr, value in values.items() 
+            if not isinstance(value, utils.EnvObj)
+        ), None
+
+class EnvNode(utils.EnvObj):
+    '''
+    EnvNode(obj: Any, name: str, tree: EnvTree, parent: EnvNode=None)
+    
+    Node of an ``EnvTree``, representing an object reached from the root of
+    the tree through a chain of attributes.  The children of a node, one 
+    per attribute of its object, are only created when it is first 
+    expanded and are kept whilst it is collapsed, until released by 
+    ``EnvTree.release``.
+    
+    Parameters:
+    -----------
+        obj (Any): Object represented by the node.
+        name (str): Name of the attribute of the parent's object (or the
+            name of the root).
+        tree (EnvTree): Tree the node belongs to.
+        parent (EnvNode): Parent node, or None for the root (default is 
+            None).
+    '''
+    
+    def __init__(self, obj: 'Any', name: str, tree: 'EnvTree', parent: 'EnvNode'=None):
+        self.obj = obj
+        self.name = name
+        self.tree = tree
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.children = None
+        self.expanded = False
+        self.collapsed = None
+        
+    def __repr__(self):
+        return f'EnvNode({self.path_ or self.name!r})'
+    
+    @property
+    def path_(self) -> str:
+        '''
+        Plain path of the node relative to the root, e.g. 'foo.bar'.  The
+        path of the root is ''.
+        '''
+        names = []
+        node = self
+        
+        while node.parent is not None:
+            names.append(node.name)
+            node = node.parent
+            
+        return '.'.join(reversed(names))
+    
+    @property
+    def value_(self) -> 'Any':
+        '''
+        The 'obj' attribute, resolved first if it is a ``utils.LazyAttr``.
+        '''
+        return self.obj.resolve() if isinstance(self.obj, utils.LazyAttr) else self.obj
+    
+    def getchildren(self) -> list:
+        '''
+        self.getchildren() -> list
+        
+        Returns the child nodes, creating them from ``self.tree.getdict`` if
+        they do not exist.
+        
+        See ``EnvTree.getdict`` for more infomation.
+        '''
+        if self.children is None:
+            self.children = [
+                EnvNode(value, name, self.tree, self) 
+                for name, value in self.tree.getdict(self.value_).items()
+            ]
+            
+        return self.children
+        
+    def expand(self) -> list:
+        '''
+        self.expand() -> list
+        
+        Marks the node as expanded and returns its child nodes.
+        
+        See ``self.getchildren`` for more infomation.
+        '''
+        self.expanded = True
+        self.collapsed = None
+        
+        return self.getchildren()
+    
+    def collapse(self) -> None:
+        '''
+        self.collapse() -> None
+        
+        Marks the node as collapsed, as of now.  Its children are kept until
+        released by ``EnvTree.release``.
+        '''
+        self.expanded = False
+        self.collapsed = time.monotonic()
+        
+    def toggle(self) -> None:
+        '''
+        self.toggle() -> None
+        
+        Collapses the node if it is expanded and expands it otherwise.
+        '''
+        self.collapse() if self.expanded else self.expand()
+        
+    def iternodes(self) -> 'Iterator[EnvNode]':
+        '''
+        self.iternodes() -> Iterator[EnvNode]
+        
+        Yields the node and, depth first, every node shown below it, i.e.
+        the descendants reached only through expanded nodes.
+        '''
+        yield self
+        
+        if self.expanded:
+            for child in self.children:
+                yield from child.iternodes()
+                
+    def iterloaded(self) -> 'Iterator[EnvNode]':
+        '''
+        self.iterloaded() -> Iterator[EnvNode]
+        
+        Yields the node and, depth first, every descendant which has been 
+        created, whether shown or not.
+        '''
+        yield self
+        
+        for child in self.children or ():
+            yield from child.iterloaded()
+
+class EnvTree(utils.EnvObj):
+    '''
+    EnvTree(handler: EnvHandeler, lazy: bool=True, max_age: float=60)
+    
+    Lazily expanded tree of the attributes of ``handler.env``, for walking
+    large object graphs (e.g. a model with hundreds of submodules) at the
+    cost of only what is expanded.  Expanding a node only reads the direct
+    attributes of its object, using ``utils.envtodict``, and reads are 
+    cached by object identity, so objects reached through several paths 
+    are only read once.  Subtrees collapsed for longer than ``max_age`` 
+    seconds are released by ``self.release``.
+    
+    The root node (the 'root' attribute) is expanded on creation.  A full
+    EnvHandeler of any node can be created using ``self.gethandler``.
+    
+    See ``EnvNode`` for more infomation.
+    
+    Parameters:
+    -----------
+        handler (EnvHandeler): EnvHandeler of the root object.
+        lazy (bool): Weather properties and other descriptors are given as
+            ``utils.LazyAttr`` placeholders, which are only evaluated when 
+            their node is expanded (default is True).
+        max_age (float): Number of seconds after which collapsed subtrees
+            are released (default is 60).
+            
+    Attributes:
+    -----------
+        reads (int): Number of objects read.
+        hits (int): Number of reads avoided by the cache.
+    '''
+    
+    def __init__(self, handler: EnvHandeler, lazy: bool=True, max_age: float=60):
+        self.handler = handler
+        self.lazy = lazy
+        self.max_age = max_age
+        self.cache = {}
+        self.reads = 0
+        self.hits = 0
+        self.root = EnvNode(handler.env, handler.name, self)
+        self.root.expand()
+        
+    def __len__(self):
+        return sum(1 for _ in self.root.iterloaded())
+    
+    def getdict(self, obj: 'Any') -> utils.EnvDict:
+        '''
+        self.getdict(obj: Any) -> utils.EnvDict
+        
+        Returns the direct attributes of the given object, as given by
+        ``utils.envtodict``, from the cache if the same object has already
+        been read.
+        
+        Parameters:
+        -----------
+            obj (Any): Any python object.
+        '''
+        entry = self.cache.get(id(obj))
+        
+        if entry is not None and entry[0] is obj:
+            self.hits += 1
+            return entry[1]
+        
+        self.reads += 1
+        dicti = utils.envtodict(obj, lazy=self.lazy)
+        self.cache[id(obj)] = (obj, dicti)
+        
+        return dicti
+    
+    def release(self, max_age: float=None) -> int:
+        '''
+        self.release(max_age: float=None) -> int
+        
+        Releases the children of every node which has been collapsed for 
+        longer than ``max_age`` seconds, along with the cached reads no
+        longer used by any node, and returns the number of nodes released.
+        
+        Parameters:
+        -----------
+            max_age (float): If None, the 'max_age' attribute is used 
+                (default is None).
+        '''
+        max_age = self.max_age if max_age is None else max_age
+        now = time.monotonic()
+        released = 0
+        
+        for node in list(self.root.iterloaded()):
+            if (node.children is not None and not node.expanded and 
+                node.collapsed is not None and now - node.collapsed > max_age):
+                released += sum(1 for _ in node.iterloaded()) - 1
+                node.children = None
+                
+        if released:
+            used = {id(node.value_) for node in self.root.iterloaded() if node.children is not None}
+            self.cache = {key: entry for key, entry in self.cache.items() if key in used}
+            
+        return released
+    
+    def gethandler(self, node: EnvNode, **kwargs) -> EnvHandeler:
+        '''
+        self.gethandler(node: EnvNode, **kwargs) -> EnvHandeler
+        
+        Returns a full EnvHandeler of the given node, using 
+        ``self.handler.subenv``, or ``self.handler`` for the root.
+        
+        See ``EnvHandeler.subenv`` for more infomation.
+        
+        Parameters:
+        -----------
+            node (EnvNode): Node of the tree.
+            **kwargs: Key word arguments passed to ``self.handler.subenv``.
+        '''
+        return self.handler if node.parent is None else self.handler.subenv(node.path_, **kwargs)
+
+class SnapshotHub(utils.EnvObj):
+    '''
+    SnapshotHub(interval: float=5, **kwargs)
+    
+    Takes one snapshot per tick of each distinct target of its subscribed
+    EnvHandelers and passes it to every subscriber of that target, along 
+    with a 'df' attribute created once for each distinct set of df 
+    parameters, so the cost of a tick grows with the number of distinct 
+    targets and parameters rather than the number of subscribers.  Ticks are run by a 
+    ``frontend.PeriodicScheduler`` (the 'scheduler' attribute).
+    
+    Subscribers are only held through weak references.  Subscribers with
+    a true 'paused' attribute are skipped.
+    
+    See ``EnvHandeler.getsnapshotkey``, ``EnvHandeler.getdfkey`` and 
+    ``EnvHandeler.updatefromsnapshot`` for more infomation.
+    
+    Parameters:
+    -----------
+        interval (float): Number of seconds between ticks (default is 5).
+        **kwargs: Key word arguments passed to 
+            ``frontend.PeriodicScheduler``.
+    '''
+    
+    def __init__(self, interval: float=5, **kwargs):
+        self.subscribers = weakref.WeakSet()
+        self.scheduler = frontend.PeriodicScheduler(self.tick, interval=interval, **kwargs)
+        self.errors = {}
+        
+    def __len__(self):
+        return len(self.subscribers)
+    
+    def subscribe(self, handler: EnvHandeler) -> None:
+        '''
+        self.subscribe(handler: EnvHandeler) -> None
+        
+        Adds the given EnvHandeler to the subscribers and starts the 
+        scheduler if it is not running.
+        
+        Parameters:
+        -----------
+            handler (EnvHandeler): EnvHandeler to be updated on each tick.
+        '''
+        self.subscribers.add(handler)
+        self.scheduler.start()
+        
+    def unsubscribe(self, handler: EnvHandeler) -> None:
+        '''
+        self.unsubscribe(handler: EnvHandeler) -> None
+        
+        Removes the given EnvHandeler from the subscribers and stops the 
+        scheduler if none are left.
+        
+        Parameters:
+        -----------
+            handler (EnvHandeler): A subscribed EnvHandeler.
+        '''
+        self.subscribers.discard(handler)
+        self.scheduler.stop() if len(self.subscribers) == 0 else None
+        
+    def getgroups(self) -> dict:
+        '''
+        self.getgroups() -> dict
+        
+        Returns a dictionary mapping each distinct snapshot key to the list
+        of active subscribers with that key.
+        
+        See ``EnvHandeler.getsnapshotkey`` for more infomation.
+        '''
+        groups = {}
+        
+        for handler in list(self.subscribers):
+            if not getattr(handler, 'paused', False):
+                groups.setdefault(handler.getsnapshotkey(), []).append(handler)
+                
+        return groups
+    
+    def tick(self) -> None:
+        '''
+        self.tick() -> None
+        
+        Takes a snapshot of each distinct target, creates its 'df' 
+        attribute once for each distinct df key of its subscribers (see 
+        ``EnvHandeler.getdfkey``) and passes both to the subscribers of 
+        that target.  Exceptions raised whilst taking a snapshot or 
+        creating a 'df' attribute are stored in the 'errors' attribute by 
+        snapshot key rather than stopping the hub.
+        '''
+        self.errors = {}
+        
+        for key, handlers in self.getgroups().items():
+            params = handlers[0].update_params
+            
+            try:
+                env = handlers[0].getenv()
+                dicti = utils.envtodict(
+                    env, *params.get('dict_args', []), **params.get('dict_kwargs', {})
+                )
+            except Exception as exc:
+                self.errors[key] = exc
+                continue
+            
+            dfs = {}
+            
+            for handler in handlers:
+                dfs.setdefault(handler.getdfkey(), []).append(handler)
+                
+            for dfhandlers in dfs.values():
+                params = dfhandlers[0].update_params
+                
+                try:
+                    df = utils.envtopandas(
+                        dicti, 
+                        *params.get('df_args', []), 
+                        **dfhandlers[0].getdfkwargs(params.get('df_kwargs', {})),
+                    )
+                except Exception as exc:
+                    self.errors[key] = exc
+                    continue
+                    
+                for handler in dfhandlers:
+                    handler.updatefromsnapshot(env, dicti, df)
+
 EnvHandler = EnvHandeler
\ No newline at end of file
@@ -0,0 +1,13 @@
+import sys
+import pathlib
+import importlib.util
+
+root = pathlib.Path(__file__).resolve().parents[1]
+
+if 'env_explore' not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        'env_explore', root / '__init__.py', submodule_search_locations=[str(root)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['env_explore'] = module
+    spec.loader.exec_module(module)
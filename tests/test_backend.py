@@ -0,0 +1,52 @@
+import time
+
+import pandas as pd
+
+import env_explore as ee
+
+
+class Slow:
+    pass
+
+
+def check(x):
+    if isinstance(x, Slow):
+        time.sleep(0.005)
+    
+    return 'ok'
+
+
+def assert_same(patched, full):
+    assert patched.equals(full)
+    assert patched.dtypes.astype(str).tolist() == full.dtypes.astype(str).tolist()
+    assert patched.index.dtype == full.index.dtype
+
+
+def test_envpatch_matches_envtopandas():
+    old = ee.EnvDict(a=1, b=None, c='x', d=[1])
+    cases = [
+        ee.EnvDict(a=1, b=None, c='x', d=[1], e='y'),
+        ee.EnvDict(a=1, b='z', c='x', d=[1]),
+        ee.EnvDict(a='w', b='z', c='x', d='v'),
+        ee.EnvDict(c='x'),
+        ee.EnvDict(),
+    ]
+    
+    for new in cases:
+        assert_same(ee.envpatch(ee.envtopandas(old), old, new), ee.envtopandas(new))
+
+
+def test_envpatch_tracks_slow_rows():
+    funcs = {'Type': type, 'Check': check}
+    old = ee.EnvDict(a=1, b=Slow(), c=Slow())
+    quarantine = ee.Quarantine(cell_budget=0.001)
+    envdf = ee.envtopandas(old, funcs, quarantine=quarantine)
+    
+    assert envdf.attrs['slow'] == ('b', 'c')
+    
+    quarantine.reenable()
+    new = ee.EnvDict(a=Slow(), c=Slow())
+    envdf = ee.envpatch(envdf, old, new, funcs, quarantine=quarantine)
+    
+    assert sorted(ee.envslow(envdf)) == ['a', 'c']
+    assert envdf['Check'].eq('Slow').sum() == 2
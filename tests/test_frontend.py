@@ -0,0 +1,10 @@
+import time
+
+import env_explore as ee
+
+
+def test_scheduler_accepts_builtins():
+    calls = []
+    
+    for func in (time.sleep, calls.append, print):
+        assert ee.PeriodicScheduler(func, interval=60).func() is func
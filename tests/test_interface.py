@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import types
+import __main__
+
+import env_explore as ee
+
+
+def getcell(widget, name):
+    return next(cell for cell in widget.itercells() if cell.index == name and cell.column == 'Value')
+
+
+def test_cell_shows_inplace_mutation():
+    __main__._test_ns = types.SimpleNamespace(lst=[1, 2, 3])
+    widget = ee.WidgetEnv('_test_ns')
+    
+    try:
+        assert getcell(widget, 'lst').description == '[1, 2, 3]'
+        __main__._test_ns.lst.append(4)
+        widget.update().result()
+        assert getcell(widget, 'lst').description == '[1, 2, 3, 4]'
+    finally:
+        widget.close()
+        del __main__._test_ns
+
+
+def test_aupdate_applies_extracted_df():
+    __main__._test_ns = types.SimpleNamespace(x=1)
+    widget = ee.WidgetEnv('_test_ns')
+    built = []
+    extract = widget.extractupdate
+    
+    def extractupdate(*args, **kwargs):
+        built.append(extract(*args, **kwargs))
+        widget.invalidate('df')
+        return built[-1]
+    
+    try:
+        widget.extractupdate = extractupdate
+        __main__._test_ns.y = 2
+        asyncio.run(widget.aupdate())
+        
+        assert widget.data is built[0]
+        assert widget.isstale('df')
+    finally:
+        widget.close()
+        del __main__._test_ns
+
+
+def test_partial_update_refreshes_cells():
+    __main__._test_ns = types.SimpleNamespace(x=1, y=2)
+    widget = ee.WidgetEnv('_test_ns')
+    
+    try:
+        df = widget.data
+        __main__._test_ns.x = 3
+        widget.update(names=['x']).result()
+        
+        assert widget.data is df
+        assert getcell(widget, 'x').description == '3'
+    finally:
+        widget.close()
+        del __main__._test_ns
+
+
+def test_close_cancels_pending_updates():
+    __main__._test_ns = types.SimpleNamespace(x=1)
+    widget = ee.WidgetEnv('_test_ns')
+    started, release = threading.Event(), threading.Event()
+    
+    def block():
+        started.set()
+        release.wait(5)
+    
+    try:
+        running = widget.update_executor.submit(block)
+        started.wait(5)
+        data = widget.data
+        __main__._test_ns.y = 2
+        pending = widget.update()
+        widget.close()
+        release.set()
+        running.result(5)
+        
+        assert pending.cancelled() and widget.update().cancelled()
+        
+        widget.setdata()
+        assert widget.data is data
+    finally:
+        release.set()
+        del __main__._test_ns
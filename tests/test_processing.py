@@ -0,0 +1,90 @@
+import types
+import __main__
+
+import env_explore as ee
+
+
+def test_prefetch_leaves_handler_state():
+    __main__._test_ns = types.SimpleNamespace(a=types.SimpleNamespace(x=1, y='y'))
+    quarantine = ee.Quarantine()
+    handler = ee.EnvHandler('_test_ns', quarantine=quarantine)
+    
+    try:
+        handler.df
+        quarantine.last = last = {'marker': 0.0}
+        quarantine.skipped = 7
+        hits = ee.typecache.hits
+        prefetcher = ee.EnvPrefetcher(handler, time_slice=1.0)
+        prefetcher.setnames(['a'])
+        prefetcher.step()
+        
+        assert 'a' in prefetcher.snapshots
+        assert quarantine.last is last and quarantine.skipped == 7
+        assert ee.typecache.hits == hits and prefetcher.types.misses
+    finally:
+        del __main__._test_ns
+
+
+def test_subenv_overrides_and_refreshes():
+    __main__._test_ns = types.SimpleNamespace(a=types.SimpleNamespace(x=1))
+    handler = ee.EnvHandler('_test_ns')
+    
+    try:
+        assert handler.subenv('a', display_as='html', incremental=True).display_as == 'html'
+        
+        sub = handler.subenv('a')
+        assert list(sub.df.index) == ['x']
+        __main__._test_ns.a.y = 2
+        
+        assert handler.subenv('a') is sub
+        assert list(sub.df.index) == ['x', 'y']
+    finally:
+        del __main__._test_ns
+
+
+def test_hub_shares_df():
+    __main__._test_ns = types.SimpleNamespace(x=1)
+    hub = ee.SnapshotHub(interval=60)
+    handlers = [ee.EnvHandler('_test_ns') for _ in range(3)]
+    handlers.append(ee.EnvHandler('_test_ns', df_kwargs={'attrs': {}}))
+    
+    try:
+        for handler in handlers:
+            hub.subscribe(handler)
+        
+        __main__._test_ns.y = 2
+        hub.tick()
+        
+        assert handlers[0].df is handlers[1].df is handlers[2].df
+        assert handlers[3].df is not handlers[0].df
+        assert list(handlers[3].df.columns) == ['Value', 'Type']
+        assert all(list(handler.df.index) == ['x', 'y'] for handler in handlers)
+    finally:
+        for handler in handlers:
+            hub.unsubscribe(handler)
+        
+        del __main__._test_ns
+
+
+def test_updatenames_patches_inplace():
+    __main__._test_ns = types.SimpleNamespace(x=1, y=2)
+    handler = ee.EnvHandler('_test_ns')
+    
+    try:
+        (dicti, df) = (handler.dicti, handler.df)
+        __main__._test_ns.x = 'a'
+        handler.updatenames(['x'])
+        
+        assert handler.dicti is dicti and handler.df is df
+        assert handler.dicti['x'] == 'a' and df.loc['x', 'Value'] == 'a'
+        assert handler.df.equals(handler.getdf())
+        
+        handler.updatefromsnapshot(handler.env, dicti, df)
+        __main__._test_ns.y = 'b'
+        handler.updatenames(['y'])
+        
+        assert handler.dicti is not dicti and handler.df is not df
+        assert dicti['y'] == 2 and df.loc['y', 'Value'] == 2
+        assert handler.df.loc['y', 'Value'] == 'b'
+    finally:
+        del __main__._test_ns
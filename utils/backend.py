@@ -2,8 +2,20 @@
 import pandas as pd
 import numpy as np
 from IPython import get_ipython
+import ast
+import builtins
+import inspect
+import sys
+import time
+import weakref
+from types import ModuleType, FunctionType, BuiltinFunctionType, MethodType
 
-from .frontend import Printed, HTMLCode
+# Only in the types module from python 3.7
+WrapperDescriptorType = type(object.__init__)
+MethodDescriptorType = type(str.join)
+ClassMethodDescriptorType = type(dict.__dict__['fromkeys'])
+
+from .frontend import Printed, HTMLCode, showobj
 
 def getmain() -> 'module':
     '''
@@ -35,6 +47,131 @@ class EnvObj:
     '''
     __envdontuse__ = True
     
+class EnvPath(EnvObj):
+    '''
+    EnvPath(code: str, relative: bool=False)
+    
+    Resolution plan for an expression, parsed once so that it can be
+    resolved repeatedly without ``eval`` re-parsing and re-compiling it.
+    
+    Plain paths, i.e. a name followed by any chain of attribute access, 
+    item access with a constant key and calls without arguments (e.g. 
+    ``'getmain().foo.bar'``), become a tuple of steps which are walked by
+    ``self.resolve``.  Any other expression is compiled once and evaluated
+    in the __main__ enviroment, as by ``maineval``.
+    
+    Parameters:
+    -----------
+        code (str): Expression to be resolved.
+        relative (bool): If True, the leading name of the path is an
+            attribute of the object passed to ``self.resolve`` rather than
+            a name in the __main__ enviroment.  Relative expressions must be
+            plain paths (default is False).
+            
+    Attributes:
+    -----------
+        steps (tuple|None): Tuple of (kind, arg) steps, where kind is one of
+            'name', 'attr', 'item' and 'call', or None if the expression is
+            not a plain path.
+        compiled (code|None): Compiled expression if it is not a plain path.
+    '''
+    
+    def __init__(self, code: str, relative: bool=False):
+        self.code = code
+        self.relative = relative
+        self.steps = self.parse(code)
+        self.compiled = None
+        
+        if self.steps is None:
+            if relative:
+                raise ValueError(f'{code!r} is not a plain path')
+            
+            self.compiled = compile(code, '<env_explore>', 'eval')
+        elif relative:
+            self.steps = (('attr', self.steps[0][1]), *self.steps[1:])
+            
+    def __repr__(self):
+        return f'EnvPath({self.code!r})'
+        
+    @property
+    def plain_(self) -> bool:
+        '''
+        Weather the expression is a plain path.
+        '''
+        return self.steps is not None
+    
+    @staticmethod
+    def parse(code: str) -> 'tuple|None':
+        '''
+        EnvPath.parse(code: str) -> tuple|None
+        
+        Returns the steps of the given expression, or None if it is not a
+        plain path (or not valid python).
+        
+        Parameters:
+        -----------
+            code (str): Any str.
+        '''
+        try:
+            node = ast.parse(code.strip(), mode='eval').body
+        except SyntaxError:
+            return None
+        
+        steps = []
+        
+        while not isinstance(node, ast.Name):
+            if isinstance(node, ast.Attribute):
+                steps.append(('attr', node.attr))
+            elif isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Constant):
+                steps.append(('item', node.slice.value))
+            elif isinstance(node, ast.Call) and not (node.args or node.keywords):
+                steps.append(('call', None))
+                node = node.func
+                continue
+            else:
+                return None
+            
+            node = node.value
+            
+        steps.append(('name', node.id))
+        
+        return tuple(reversed(steps))
+    
+    def resolve(self, root: 'Any'=None) -> 'Any':
+        '''
+        self.resolve(root: Any=None) -> Any
+        
+        Resolves the expression and returns the result.
+        
+        Parameters:
+        -----------
+            root (Any): Object the path is relative to.  Only used if
+                ``self.relative`` is True (default is None).
+        '''
+        if self.compiled is not None:
+            return eval(self.compiled, getmain().__dict__)
+        
+        obj = root
+        
+        for kind, arg in self.steps:
+            if kind == 'attr':
+                obj = getattr(obj, arg)
+            elif kind == 'item':
+                obj = obj[arg]
+            elif kind == 'call':
+                obj = obj()
+            else:
+                namespace = getmain().__dict__
+                
+                if arg in namespace:
+                    obj = namespace[arg]
+                elif hasattr(builtins, arg):
+                    obj = getattr(builtins, arg)
+                else:
+                    raise NameError(f'name {arg!r} is not defined')
+                
+        return obj
+    
 class EnvDict(dict, EnvObj):
     '''
     EnvDict(a: dict)
@@ -59,9 +196,188 @@ class EnvDf(pd.DataFrame, EnvObj):
     '''
     pass
 
-def envtodict(env: 'Any') -> EnvDict:
+class LazyAttr:
+    '''
+    LazyAttr(obj: Any, name: str, kind: str, static: Any=None)
+    
+    Placeholder for an attribute which is only evaluated when 
+    ``self.resolve`` is called or the placeholder is displayed.  Used by
+    ``envtodict`` in its lazy mode for properties and other descriptors,
+    whose evaluation may be arbitrarily expensive.
+    
+    Parameters:
+    -----------
+        obj (Any): Object the attribute belongs to.
+        name (str): Name of the attribute.
+        kind (str): Kind of the attribute, as given by ``attrkind``.
+        static (Any): The attribute as found by static lookup, used for
+            its documentation (default is None).
+    '''
+    
+    def __init__(self, obj: 'Any', name: str, kind: str, static: 'Any'=None):
+        self.obj = obj
+        self.name = name
+        self.kind = kind
+        self.__doc__ = getattrsafe(static, '__doc__')
+        self.resolved = False
+        self.value = None
+        
+    def __repr__(self):
+        return f'<lazy {self.kind} {self.name!r}>'
+    
+    def _ipython_display_(self):
+        showobj(self.resolve())
+        
+    def resolve(self) -> 'Any':
+        '''
+        self.resolve() -> Any
+        
+        Evaluates the attribute, caches and returns the result.
+        '''
+        if not self.resolved:
+            self.value = getattr(self.obj, self.name)
+            self.resolved = True
+            
+        return self.value
+
+def attrkind(env: 'Any', attr: str) -> tuple:
+    '''
+    attrkind(env: Any, attr: str) -> tuple
+    
+    Returns a tuple, (kind, static), classifying an attribute using static
+    lookup (``inspect.getattr_static``), i.e. without evaluating it.  
+    ``static`` is the object found by the lookup and ``kind`` is one of:
+    
+        - 'value': A plain value, ``static`` is the attribute itself.
+        - 'method': A function, method or classmethod/staticmethod.
+        - 'property': A property.
+        - 'descriptor': Any other descriptor (e.g. a C level getset).
+        - 'dynamic': The attribute can not be found statically, e.g. it is
+          provided by ``__getattr__``.
+    
+    Note, slot members and properties accessed on a class are considered 
+    plain values as evaluating them is cheap.
+    
+    Parameters:
+    -----------
+        env (Any): Any python object.
+        attr (str): Name of the attribute.
+    '''
+    try:
+        static = inspect.getattr_static(env, attr)
+    except AttributeError:
+        return 'dynamic', None
+    
+    if isinstance(static, (FunctionType, BuiltinFunctionType, MethodType,
+                           MethodDescriptorType, WrapperDescriptorType, 
+                           ClassMethodDescriptorType, classmethod, 
+                           staticmethod)):
+        return 'method', static
+    
+    if isinstance(static, property):
+        return ('value' if isinstance(env, type) else 'property'), static
+    
+    if inspect.ismemberdescriptor(static) or not hasattr(type(static), '__get__'):
+        return 'value', static
+    
+    return 'descriptor', static
+
+def envnamespace(env: 'Any') -> tuple:
+    '''
+    envnamespace(env: Any) -> tuple
+    
+    Returns a tuple, (names, direct), of the sorted attribute names of the
+    given object and a mapping from which the values of some or all of 
+    these names can be read directly, without ``getattr``.
+    
+    The namespace is read straight from ``__dict__`` for modules and for 
+    plain instances (objects whose type does not customise ``__dir__``,
+    ``__getattribute__`` or ``__getattr__``).  For plain instances, names
+    also defined on the type are left out of ``direct`` so descriptors are
+    still resolved by ``getattr``.  Plain instances without a ``__dict__``
+    (e.g. dicts, lists and other mappings and containers of builtin or 
+    slotted types) only have the names of their type, which are read from
+    the namespaces of its MRO rather than by ``dir``, and ``direct`` is 
+    empty.  For any other object, ``dir`` is used and ``direct`` is empty.
+    
+    Parameters:
+    -----------
+        env (Any): Any python object.
+    '''
+    cls = type(env)
+    
+    if cls is ModuleType and '__dir__' not in env.__dict__:
+        return sorted(env.__dict__), env.__dict__
+    
+    if (cls.__dir__ is object.__dir__ and 
+        cls.__getattribute__ is object.__getattribute__ and 
+        not hasattr(cls, '__getattr__')):
+        clsnames = set().union(*(vars(base) for base in cls.__mro__))
+        namespace = getattrsafe(env, '__dict__', default=None)
+        
+        if namespace is None and '__dict__' not in clsnames:
+            return sorted(clsnames), {}
+        
+        if isinstance(namespace, dict):
+            direct = {attr: val for attr, val in namespace.items() if attr not in clsnames}
+            
+            return sorted(clsnames.union(namespace)), direct
+    
+    return dir(env), {}
+
+def envitems(env: 'Any', 
+             lazy: bool=False, 
+             skip_missing: bool=False) -> 'Iterator[tuple]':
+    '''
+    envitems(env: Any, lazy: bool=False, skip_missing: bool=False) 
+        -> Iterator[tuple]
+    
+    Yields the (name, value) pairs of the attributes of the given object
+    which ``envtodict`` includes, in sorted order, one at a time.
+    
+    See ``envtodict`` for more infomation.
+    
+    Parameters:
+    -----------
+        env (Any): Any python object.
+        lazy (bool): See ``envtodict`` (default is False).
+        skip_missing (bool): Weather names which can no longer be read 
+            (i.e. raise AttributeError or KeyError, e.g. because they were
+            deleted whilst iterating) are left out rather than raising 
+            (default is False).
+    '''
+    names, direct = envnamespace(env)
+    
+    for attr in names:
+        if attr in ('In', 'Out') or attr.startswith('_'):
+            continue
+        
+        try:
+            if attr in direct:
+                val = direct[attr]
+            elif lazy:
+                kind, static = attrkind(env, attr)
+                
+                if kind in ('property', 'descriptor'):
+                    yield attr, LazyAttr(env, attr, kind, static)
+                    continue
+                    
+                bound = kind != 'value' or hasattr(type(static), '__get__')
+                val = getattr(env, attr) if bound else static
+            else:
+                val = getattr(env, attr)
+        except (AttributeError, KeyError):
+            if skip_missing:
+                continue
+            
+            raise
+        
+        if not isinstance(val, EnvObj):
+            yield attr, val
+
+def envtodict(env: 'Any', lazy: bool=False) -> EnvDict:
     '''
-    envtodict(env: Any) -> EnvDict
+    envtodict(env: Any, lazy: bool=False) -> EnvDict
     
     Returns an ``EnvDict`` instance of the attribute names (keys)
     and corresponding values (values) from the given object.
@@ -73,20 +389,59 @@ def envtodict(env: 'Any') -> EnvDict:
         - Attribute is named 'Out'.
         - Name of the attribute starts with '_'.
         - Attribute is an instance of the EnvObj class.
+    
+    Where possible, values are read directly from the object's namespace
+    rather than through ``dir`` and ``getattr``.
+    
+    See ``envitems``, ``envnamespace``, ``attrkind`` and ``LazyAttr`` for
+    more infomation.
         
     Parameters:
     -----------
         env (Any): Any python object.
+        lazy (bool): If True, attributes are classified using ``attrkind``
+            and properties and other descriptors are given as ``LazyAttr``
+            placeholders instead of being evaluated (default is False).
+            
+            Note, placeholders are not checked for being EnvObj instances.
         
     '''
-    attrs = dir(env)
-    attrs = [attr for attr in attrs if (attr not in ('In', 'Out')) and (not attr.startswith('_'))]
-    envdict = {attr: getattr(env, attr) for attr in attrs}
-    envdict = {attr: val for attr, val in zip(envdict.keys(), envdict.values()) if not isinstance(val, EnvObj)}
-    envdict = envdict.copy()
-    envdict = EnvDict(envdict)
+    return EnvDict(envitems(env, lazy))
+
+def estimatesize(obj: 'Any', sample: int=100) -> int:
+    '''
+    estimatesize(obj: Any, sample: int=100) -> int
     
-    return envdict
+    Returns a cheap estimate, in bytes, of the memory kept alive by the 
+    given object, i.e. ``sys.getsizeof`` of the object plus, for lists,
+    tuples, sets and dicts, the size of their items, extrapolated from the
+    first ``sample`` items.  Objects which define ``__sizeof__`` in terms
+    of their data (e.g. numpy arrays and pandas objects) are measured by 
+    ``sys.getsizeof`` alone.
+    
+    Parameters:
+    -----------
+        obj (Any): Any python object.
+        sample (int): Maximum number of items measured per container 
+            (default is 100).
+    '''
+    try:
+        size = sys.getsizeof(obj)
+    except Exception:
+        return 0
+    
+    if isinstance(obj, dict):
+        items = [item for pair in zip(obj, obj.values()) for item in pair]
+        count = 2 * len(obj)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        count = len(obj)
+        items = obj
+    else:
+        return size
+    
+    measured = [sys.getsizeof(item) for item, _ in zip(items, range(sample))]
+    
+    return size + (sum(measured) * count // len(measured) if measured else 0)
 
 def getattrsafe(*args, default: 'Any'=None, **kwargs):
     '''
@@ -109,13 +464,439 @@ def getattrsafe(*args, default: 'Any'=None, **kwargs):
     except AttributeError:
         return default
     
+class Quarantine(EnvObj):
+    '''
+    Quarantine(cell_budget: float=0.1, update_budget: float=None)
+    
+    Time budget for the cells computed by ``envtopandas`` and record of
+    the (type, column) pairs which exceeded it.  Cells of quarantined 
+    pairs are skipped by later calls until they are re-enabled using
+    ``self.reenable``.
+    
+    Parameters:
+    -----------
+        cell_budget (float): Number of seconds a single cell may take
+            before its (type, column) pair is quarantined (default is 0.1).
+        update_budget (float): Number of seconds a single call of
+            ``envtopandas`` may spend computing cells, after which the
+            remaining cells are skipped. If None, there is no limit
+            (default is None).
+            
+    Attributes:
+    -----------
+        slow (dict): Mapping of quarantined (type, column) pairs to the
+            number of seconds the offending cell took.
+        last (dict): Same as ``slow`` but only for the pairs quarantined
+            during the last call of ``envtopandas``.
+        skipped (int): Number of cells skipped during the last call of 
+            ``envtopandas`` because the update budget was exhausted.
+        cells (int): Number of cells given the value 'Slow' during the last
+            call of ``envtopandas``.
+    '''
+    
+    def __init__(self, cell_budget: float=0.1, update_budget: float=None):
+        self.cell_budget = cell_budget
+        self.update_budget = update_budget
+        self.slow = {}
+        self.last = {}
+        self.skipped = 0
+        self.cells = 0
+        self.deadline = None
+        
+    def __repr__(self):
+        return f'Quarantine({self.slow!r})'
+    
+    def start(self) -> None:
+        '''
+        self.start() -> None
+        
+        Inplace method for starting the update budget and resetting the
+        'last', 'skipped' and 'cells' attributes.  Called by 
+        ``envtopandas``.
+        '''
+        self.last = {}
+        self.skipped = 0
+        self.cells = 0
+        self.deadline = (None if self.update_budget is None else 
+                         time.perf_counter() + self.update_budget)
+    
+    def isquarantined(self, typ: type, column: 'Any') -> bool:
+        '''
+        self.isquarantined(typ: type, column: Any) -> bool
+        
+        Returns weather the given (type, column) pair is quarantined.
+        
+        Parameters:
+        -----------
+            typ (type): Type of the value of the cell.
+            column (Any): Column of the cell.
+        '''
+        return (typ, column) in self.slow
+    
+    def add(self, typ: type, column: 'Any', seconds: float) -> None:
+        '''
+        self.add(typ: type, column: Any, seconds: float) -> None
+        
+        Inplace method for quarantining a (type, column) pair.
+        
+        Parameters:
+        -----------
+            typ (type): Type of the value of the cell.
+            column (Any): Column of the cell.
+            seconds (float): Number of seconds the cell took.
+        '''
+        self.slow[typ, column] = self.last[typ, column] = seconds
+        
+    def reenable(self, typ: type=None, column: 'Any'=None) -> None:
+        '''
+        self.reenable(typ: type=None, column: Any=None) -> None
+        
+        Inplace method for removing (type, column) pairs from quarantine.
+        If both arguments are None, every pair is re-enabled.
+        
+        Parameters:
+        -----------
+            typ (type): Only re-enable pairs of this type. If None, pairs
+                of any type are re-enabled (default is None).
+            column (Any): Only re-enable pairs of this column. If None, 
+                pairs of any column are re-enabled (default is None).
+        '''
+        self.slow = {
+            (t, c): sec for (t, c), sec in self.slow.items()
+            if not ((typ is None or t is typ) and (column is None or c == column))
+        }
+        
+    def getreport(self) -> pd.DataFrame:
+        '''
+        self.getreport() -> pd.DataFrame
+        
+        Returns a DataFrame of the quarantined pairs and the number of 
+        seconds they took.
+        '''
+        return pd.DataFrame(
+            [(t, c, sec) for (t, c), sec in self.slow.items()],
+            columns=['Type', 'Column', 'Seconds'],
+        )
+    
+    def run(self, func: callable, value: 'Any', column: 'Any') -> 'Any':
+        '''
+        self.run(func: callable, value: Any, column: Any) -> Any
+        
+        Returns ``func(value)`` unless the (type, column) pair of the cell 
+        is quarantined, the update budget is exhausted or the call exceeds
+        the cell budget, in which case 'Slow' is returned.
+        
+        Parameters:
+        -----------
+            func (callable): Function computing the cell from its value.
+            value (Any): Value of the row.
+            column (Any): Column of the cell.
+        '''
+        typ = type(value)
+        
+        if self.isquarantined(typ, column):
+            self.cells += 1
+            return 'Slow'
+        
+        started = time.perf_counter()
+        
+        if self.deadline is not None and started > self.deadline:
+            self.skipped += 1
+            self.cells += 1
+            return 'Slow'
+        
+        result = func(value)
+        seconds = time.perf_counter() - started
+        
+        if seconds > self.cell_budget:
+            self.add(typ, column, seconds)
+            self.cells += 1
+            return 'Slow'
+        
+        return result
+
+def safecall(func: callable) -> 'function':
+    '''
+    safecall(func: callable) -> function
+    
+    Returns a function of one argument which returns ``func(x)``, or 'Err'
+    if this raises an exception.
+    
+    Parameters:
+    -----------
+        func (callable): Function to be wrapped.
+    '''
+    def wrapper(x):
+        try:
+            return func(x)
+        except Exception:
+            return 'Err'
+    return wrapper
+
+def safeattr(attr: str, types: 'TypeCache'=None) -> 'function':
+    '''
+    safeattr(attr: str, types: TypeCache=None) -> function
+    
+    Returns a function of one argument which returns 
+    ``getattrsafe(x, attr, default='')``, or ``types.getattr(x, attr,
+    default='')`` if ``types`` is given.
+    
+    See ``getattrsafe`` and ``TypeCache`` for more infomation.
+    
+    Parameters:
+    -----------
+        attr (str): Name of the attribute.
+        types (TypeCache): Cache used to look up the attribute (default is
+            None).
+    '''
+    if types is not None:
+        return lambda x: types.getattr(x, attr, default='')
+    
+    def wrapper(x):
+        return getattrsafe(x, attr, default='')
+    return wrapper
+
+class TypeInfo:
+    '''
+    TypeInfo(typ: type)
+    
+    Facts derived from a type which are shared by all of its instances.
+    Used by ``TypeCache``.
+    
+    Parameters:
+    -----------
+        typ (type): Any type.
+        
+    Attributes:
+    -----------
+        plain (bool): Weather the type uses the default attribute lookup,
+            i.e. neither it nor its bases define ``__getattribute__`` in
+            python (builtin types are assumed not to customise it, except
+            for weak reference proxies) or ``__getattr__``.
+        owned (bool): Weather instances of the type can have attributes of
+            their own, i.e. they have a ``__dict__``.
+        callable (bool): Weather instances of the type are callable.
+        qualname (str): Qualified name of the type.
+        statics (dict): Mapping of attribute names to the position, in the
+            type's ``__mro__``, of the class defining them as plain class 
+            attributes, or None (see ``self.getstatic``).
+            
+    Note, neither the type itself nor the values of its attributes are 
+    held by the TypeInfo (the type only through a weak reference), so that
+    a ``TypeCache`` does not keep the type alive.
+    '''
+    
+    def __init__(self, typ: type):
+        namespaces = [vars(base) for base in typ.__mro__]
+        getattribute = next(ns['__getattribute__'] for ns in namespaces if '__getattribute__' in ns)
+        self.plain = (isinstance(getattribute, WrapperDescriptorType) and 
+                      not hasattr(typ, '__getattr__') and 
+                      typ not in (weakref.ProxyType, weakref.CallableProxyType))
+        self.owned = any('__dict__' in namespace for namespace in namespaces)
+        self.callable = any('__call__' in namespace for namespace in namespaces)
+        self.qualname = getattr(typ, '__qualname__', typ.__name__)
+        self.type = weakref.ref(typ)
+        self.statics = {}
+        
+    @property
+    def doc_(self) -> 'str|None':
+        '''
+        Docstring shared by the instances of the type without one of their 
+        own, or None if it is not shared (see ``self.getstatic``).
+        '''
+        return self.getstatic('__doc__')[1]
+    
+    def getstatic(self, attr: str) -> tuple:
+        '''
+        self.getstatic(attr: str) -> tuple
+        
+        Returns a tuple, (found, value), where found is True if every
+        instance of the type without an attribute named ``attr`` of its
+        own shares ``value`` as that attribute, i.e. the type uses the 
+        default attribute lookup and the attribute is a plain, 
+        non-descriptor, class attribute.  Only the position of the class
+        defining the attribute is cached, and the value is read from it on
+        each call.
+        
+        Parameters:
+        -----------
+            attr (str): Name of the attribute.
+        '''
+        typ = self.type()
+        mro = () if typ is None else typ.__mro__
+        
+        if attr not in self.statics:
+            position = None
+            
+            for i, base in enumerate(mro if self.plain else ()):
+                if attr in vars(base):
+                    position = None if hasattr(type(vars(base)[attr]), '__get__') else i
+                    break
+                    
+            self.statics[attr] = position
+            
+        position = self.statics[attr]
+        namespace = vars(mro[position]) if position is not None else {}
+        value = namespace.get(attr, namespace)
+        
+        if value is namespace or hasattr(type(value), '__get__'):
+            return False, None
+        
+        return True, value
+
+class TypeCache(EnvObj):
+    '''
+    TypeCache()
+    
+    Cache of ``TypeInfo`` objects keyed by type.  Types are held through
+    weak references so they can still be garbage collected.
+    
+    Attributes:
+    -----------
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups which created a new TypeInfo.
+    '''
+    
+    def __init__(self):
+        self.infos = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        
+    def __repr__(self):
+        return f'TypeCache(types={len(self.infos)}, hits={self.hits}, misses={self.misses})'
+    
+    def __len__(self):
+        return len(self.infos)
+        
+    def getinfo(self, typ: type) -> TypeInfo:
+        '''
+        self.getinfo(typ: type) -> TypeInfo
+        
+        Returns the TypeInfo of the given type, creating it if it is not
+        cached.
+        
+        Parameters:
+        -----------
+            typ (type): Any type.
+        '''
+        try:
+            info = self.infos[typ]
+            self.hits += 1
+        except KeyError:
+            info = self.infos[typ] = TypeInfo(typ)
+            self.misses += 1
+        except TypeError:
+            info = TypeInfo(typ)
+            self.misses += 1
+            
+        return info
+    
+    def getcells(self, typ: type, funcs: dict, attrs: dict) -> list:
+        '''
+        self.getcells(typ: type, funcs: dict, attrs: dict) -> list
+        
+        Returns a list, with an item per column of ``funcs`` and then of 
+        ``attrs`` (as given to ``envtopandas``), of (shared, cell) tuples,
+        where shared is:
+        
+            - True if every instance of the type has the same cell, 
+              i.e. the 'Type' column (``type``), callable columns 
+              (``callable``) and plain class attributes of types whose 
+              instances have no attributes of their own.
+            - The name of the attribute if every instance has the same 
+              cell unless it has an attribute of its own of that name.
+            - False if the cell must be computed for each instance.
+            
+        Parameters:
+        -----------
+            typ (type): Any type.
+            funcs (dict): See ``envtopandas``.
+            attrs (dict): See ``envtopandas``.
+        '''
+        info = self.getinfo(typ)
+        cells = []
+        
+        for func in funcs.values():
+            if func is type:
+                cells.append((True, typ))
+            elif func is callable:
+                cells.append((True, info.callable))
+            else:
+                cells.append((False, None))
+                
+        for attr in attrs.values():
+            found, value = info.getstatic(attr)
+            cells.append(((attr if info.owned else True) if found else False, value))
+            
+        return cells
+        
+    def getattr(self, obj: 'Any', attr: str, default: 'Any'=None) -> 'Any':
+        '''
+        self.getattr(obj: Any, attr: str, default: Any=None) -> Any
+        
+        Equivalent to ``getattrsafe(obj, attr, default=default)``, except
+        that attributes shared by all instances of the type of ``obj`` 
+        are looked up in the cache.
+        
+        See ``TypeInfo.getstatic`` for more infomation.
+        
+        Parameters:
+        -----------
+            obj (Any): Object from which to retrive the attribute.
+            attr (str): Name of the attribute to retrive.
+            default (Any): Value to be returned in the event that
+                ``obj`` has not attribute named ``attr`` (default is 
+                None).
+        '''
+        found, value = self.getinfo(type(obj)).getstatic(attr)
+        
+        if found and attr not in getattrsafe(obj, '__dict__', default=()):
+            return value
+        
+        return getattrsafe(obj, attr, default=default)
+    
+    def clear(self) -> None:
+        '''
+        self.clear() -> None
+        
+        Inplace method for emptying the cache and resetting the counters.
+        '''
+        self.infos.clear()
+        self.hits = self.misses = 0
+        
+typecache = TypeCache()
+
+def envgetters(funcs: dict, attrs: dict, types: 'TypeCache'=None) -> list:
+    '''
+    envgetters(funcs: dict, attrs: dict, types: TypeCache=None) -> list
+    
+    Returns a list of (column, function) pairs, one for each of the extra
+    columns of ``envtopandas``, where each function computes the cell of
+    its column from the value of a row.
+    
+    See ``envtopandas``, ``safecall`` and ``safeattr`` for more infomation.
+    
+    Parameters:
+    -----------
+        funcs (dict): See ``envtopandas``.
+        attrs (dict): See ``envtopandas``.
+        types (TypeCache): See ``envtopandas`` (default is None).
+    '''
+    getters = [(col, safecall(func)) for col, func in funcs.items()]
+    getters += [(col, safeattr(attr, types)) for col, attr in attrs.items()]
+    
+    return getters
+
 def envtopandas(env: 'Any', 
                 funcs: dict={'Type': type},
-                attrs: dict={'Documentation': '__doc__'}
+                attrs: dict={'Documentation': '__doc__'},
+                quarantine: Quarantine=None,
+                types: TypeCache=None
                ) -> EnvDf:
     '''
     envtopandas(env: Any, funcs: dict={'Type': type}, 
-        attrs: dict={'Documentation': '__doc__'}) -> EnvDf
+        attrs: dict={'Documentation': '__doc__'}, 
+        quarantine: Quarantine=None, types: TypeCache=None) -> EnvDf
         
     Creates a pandas DataFrame (EnvDf) from a given object and adds
     columns extra infomation about the objects determined by the 
@@ -125,6 +906,10 @@ def envtopandas(env: 'Any',
     be used to create and EnvDict from the given object which is then
     used to create the EnvDf.
     
+    All columns are filled in a single pass over the values, into
+    preallocated object arrays, and the EnvDf is created with a single
+    constructor call.
+    
     Parameters
     ----------
         env (Any): Object used as/to create the EnvDict.
@@ -142,26 +927,461 @@ def envtopandas(env: 'Any',
             
             Note, ``getattrsafe(..., default='Err')`` is used to get 
             the attributes.
+            
+        quarantine (Quarantine): If given, each cell of the ``funcs`` and
+            ``attrs`` columns is timed and cells which are quarantined or
+            over budget are given the value 'Slow' (default is None).  The
+            names of the rows given a 'Slow' cell are kept in 
+            ``envdf.attrs['slow']`` (see ``envslow``).
+            
+            See ``Quarantine`` for more infomation.
+            
+        types (TypeCache): If given, the cells shared by all instances of 
+            a type (e.g. their type, weather they are callable and the 
+            docstrings of most instances) are filled by one lookup per type
+            rather than computed for each value (default is None).
+            
+            See ``envcolumns`` and ``TypeCache`` for more infomation.
     '''
     envdict = env if isinstance(env, EnvDict) else envtodict(env)
-    envtups = list(zip(envdict.keys(), envdict.values()))
-    envtups = None if envtups == [] else envtups 
-    envdf = pd.DataFrame(envtups, columns=['Variable', 'Value'])
-    envdf.set_index('Variable', inplace=True)
+    values = np.empty(len(envdict), dtype=object)
+    
+    for i, value in enumerate(envdict.values()):
+        values[i] = value
+    
+    quarantine.start() if quarantine is not None else None
+    slow = set()
+    columns = envcolumns(values, funcs, attrs, quarantine, types, slow)
+    keys = list(envdict.keys())
+    envdf = EnvDf(pd.DataFrame(columns, index=pd.Index(keys, dtype=object, name='Variable')))
+    envdf.attrs['slow'] = tuple(keys[i] for i in sorted(slow))
+    
+    return envdf
+
+def envcolumns(values: np.ndarray,
+               funcs: dict={'Type': type},
+               attrs: dict={'Documentation': '__doc__'},
+               quarantine: Quarantine=None,
+               types: TypeCache=None,
+               slow: set=None) -> dict:
+    '''
+    envcolumns(values: np.ndarray, funcs: dict={'Type': type}, 
+        attrs: dict={'Documentation': '__doc__'}, quarantine: Quarantine=None,
+        types: TypeCache=None, slow: set=None) -> dict
+        
+    Returns a dictionary of the columns of ``envtopandas`` (object arrays)
+    for the given values, starting with the 'Value' column (``values`` 
+    itself).
+    
+    If ``types`` is given, the rows are grouped by type and the cells 
+    shared by every instance of a type (see ``TypeCache.getcells``) are 
+    filled with one assignment per type and column, so only the cells 
+    which are not shared are computed for each value.  Note, the 
+    quarantine's budget does not apply to shared cells, which are not 
+    computed.
+    
+    See ``envtopandas`` for more infomation.
+    
+    Parameters:
+    -----------
+        values (np.ndarray): Object array of the values of the rows.
+        funcs (dict): See ``envtopandas``.
+        attrs (dict): See ``envtopandas``.
+        quarantine (Quarantine): See ``envtopandas``.  Its budget must 
+            already be started (default is None).
+        types (TypeCache): See ``envtopandas`` (default is None).
+        slow (set): If given, the positions of the rows given a 'Slow' 
+            cell by the quarantine are added to it (default is None).
+    '''
+    getters = envgetters(funcs, attrs)
+    columns = {'Value': values, **{col: np.empty(len(values), dtype=object) for col, _ in getters}}
+    
+    def getcell(get: callable, value: 'Any', col: 'Any', i: int) -> 'Any':
+        if quarantine is None:
+            return get(value)
+        
+        cells = quarantine.cells
+        cell = quarantine.run(get, value, col)
+        
+        if slow is not None and quarantine.cells != cells:
+            slow.add(i)
+        
+        return cell
+    
+    if types is None:
+        for i, value in enumerate(values):
+            for col, get in getters:
+                columns[col][i] = getcell(get, value, col, i)
+                
+        return columns
+    
+    codes = {}
+    typecodes = np.array([codes.setdefault(typ, len(codes)) for typ in map(type, values)], dtype=np.intp)
+    order = np.argsort(typecodes, kind='stable')
+    bounds = np.searchsorted(typecodes[order], np.arange(len(codes) + 1))
+        
+    for k, typ in enumerate(codes):
+        index = order[bounds[k]:bounds[k + 1]]
+        
+        for (col, get), (shared, cell) in zip(getters, types.getcells(typ, funcs, attrs)):
+            column = columns[col]
+            
+            if shared is True:
+                filler = np.empty(1, dtype=object)
+                filler[0] = cell
+                column[index] = filler
+                continue
+            
+            for i in index.tolist():
+                value = values[i]
+                
+                if shared is False or shared in getattr(value, '__dict__', ()):
+                    column[i] = getcell(get, value, col, i)
+                else:
+                    column[i] = cell
+                    
+    return columns
+
+def envchunks(items: 'Iterable[tuple]',
+              funcs: dict={'Type': type},
+              attrs: dict={'Documentation': '__doc__'},
+              quarantine: Quarantine=None,
+              types: TypeCache=None,
+              chunk_size: int=1000,
+              time_slice: float=None
+             ) -> 'Iterator[tuple]':
+    '''
+    envchunks(items: Iterable[tuple], funcs: dict={'Type': type},
+        attrs: dict={'Documentation': '__doc__'}, quarantine: Quarantine=None,
+        types: TypeCache=None, chunk_size: int=1000, time_slice: float=None)
+        -> Iterator[tuple]
+    
+    Chunked version of ``envtopandas(envtodict(...))``.  Reads (name, value)
+    pairs from ``items`` in chunks of at most ``chunk_size`` pairs (or 
+    fewer, if ``time_slice`` seconds pass whilst reading them) and, after 
+    computing the cells of each chunk (see ``envcolumns``), 
+    yields a tuple, (envdict, envdf), of the chunk.  The caller decides 
+    what happens between chunks, e.g. publish the results so far and let
+    other threads or tasks run, so a huge namespace does not hold the 
+    interpreter for the whole extraction.
+    
+    Concatenating the EnvDfs with ``envconcat`` (and merging the EnvDicts)
+    of every chunk gives the equivalent of ``envtopandas`` of all the 
+    items, with the 
+    quarantine's update budget covering the whole extraction.  At least 
+    one tuple is yielded, even if there are no items.
+    
+    See ``envitems`` and ``envtopandas`` for more infomation.
+    
+    Parameters:
+    -----------
+        items (Iterable[tuple]): (name, value) pairs, e.g. 
+            ``envitems(env)``.
+        funcs (dict): See ``envtopandas``.
+        attrs (dict): See ``envtopandas``.
+        quarantine (Quarantine): See ``envtopandas`` (default is None).
+        types (TypeCache): See ``envtopandas`` (default is None).
+        chunk_size (int): Maximum number of items per chunk (default is
+            1000).
+        time_slice (float): Maximum number of seconds per chunk. If None,
+            chunks are only limited by ``chunk_size`` (default is None).
+    '''
+    items = iter(items)
+    done = False
+    yielded = False
     
-    for col in funcs.keys():
-        def func(*args, **kwargs):
-            try:
-                return funcs[col](*args, **kwargs)
-            except:
-                return 'Err'
+    quarantine.start() if quarantine is not None else None
+    
+    while not done:
+        deadline = None if time_slice is None else time.perf_counter() + time_slice
+        envdict = EnvDict()
+        
+        for attr, value in items:
+            envdict[attr] = value
+                
+            if len(envdict) >= chunk_size or (deadline is not None and time.perf_counter() > deadline):
+                break
+        else:
+            done = True
+            
+        if not envdict and yielded:
+            break
+        
+        values = np.empty(len(envdict), dtype=object)
+        
+        for i, value in enumerate(envdict.values()):
+            values[i] = value
+        
+        slow = set()
+        columns = envcolumns(values, funcs, attrs, quarantine, types, slow)
+        keys = list(envdict.keys())
+        envdf = EnvDf(pd.DataFrame(columns, index=pd.Index(keys, dtype=object, name='Variable')))
+        envdf.attrs['slow'] = tuple(keys[i] for i in sorted(slow))
+        yielded = True
+        
+        yield envdict, envdf
+
+def envdiff(old: EnvDict, new: EnvDict, names: 'Iterable[str]'=None) -> tuple:
+    '''
+    envdiff(old: EnvDict, new: EnvDict, names: Iterable[str]=None) -> tuple
+    
+    Returns a tuple of three lists, (added, removed, changed), of the names
+    which differ between two EnvDicts.  A name is considered changed if it
+    has been rebound to a different object, i.e. the object identity is
+    used as the version stamp.
+    
+    Note, objects mutated inplace keep their identity and are therefore not
+    reported as changed.
+    
+    Parameters:
+    -----------
+        old (EnvDict): Previous snapshot.
+        new (EnvDict): Current snapshot.
+        names (Iterable[str]): If given, only these names are compared 
+            (default is None).
+    '''
+    if names is not None:
+        names = list(dict.fromkeys(names))
+        added = [key for key in names if key in new and key not in old]
+        removed = [key for key in names if key in old and key not in new]
+        changed = [key for key in names if key in old and key in new and new[key] is not old[key]]
+        
+        return added, removed, changed
+    
+    added = [key for key in new if key not in old]
+    removed = [key for key in old if key not in new]
+    changed = [key for key in new if key in old and new[key] is not old[key]]
+    
+    return added, removed, changed
+
+def envslow(envdf: EnvDf, names: 'Iterable[str]'=None) -> list:
+    '''
+    envslow(envdf: EnvDf, names: Iterable[str]=None) -> list
+    
+    Returns the names of the rows of ``envdf`` with a cell (other than in
+    the 'Value' column) given the value 'Slow' by a ``Quarantine``.
+    
+    The names recorded in ``envdf.attrs['slow']`` by ``envtopandas`` (and
+    kept by ``envpatch`` and ``envconcat``) are used, so the cost grows 
+    with the number of slow rows rather than the number of rows.  Only 
+    EnvDfs without this record are scanned.
+    
+    Parameters:
+    -----------
+        envdf (EnvDf): EnvDf created by ``envtopandas``.
+        names (Iterable[str]): If given, only these rows are checked 
+            (default is None).
+    '''
+    if 'slow' in envdf.attrs:
+        slow = [key for key in envdf.attrs['slow'] if key in envdf.index]
+        
+        if names is None:
+            return slow
+        
+        names = set(names)
+        
+        return [key for key in slow if key in names]
+    
+    if names is not None:
+        envdf = envdf.loc[[name for name in names if name in envdf.index]]
+        
+    mask = np.zeros(len(envdf), dtype=bool)
+    
+    for col in envdf.columns.drop('Value', errors='ignore'):
+        column = envdf[col]
+        
+        try:
+            mask |= column.eq('Slow').to_numpy(dtype=bool, na_value=False)
+        except (TypeError, ValueError):
+            mask |= np.fromiter((isinstance(x, str) and x == 'Slow' for x in column), bool, len(column))
+            
+    return envdf.index[mask].tolist()
+
+def envinfer(column: pd.Series) -> pd.Series:
+    '''
+    envinfer(column: pd.Series) -> pd.Series
+    
+    Returns the given column with the dtype ``envtopandas`` would give it,
+    i.e. the dtype inferred by pandas from an object array of its values
+    (e.g. the string dtype of pandas 3 if they are all strings).
+    
+    Parameters:
+    -----------
+        column (pd.Series): Column of an EnvDf.
+    '''
+    return pd.Series(column.to_numpy(dtype=object), index=column.index, name=column.name)
+
+def envconcat(frames: list, keys: 'Iterable[str]'=None) -> EnvDf:
+    '''
+    envconcat(frames: list, keys: Iterable[str]=None) -> EnvDf
+    
+    Returns the concatenation of the given EnvDfs, with the dtypes (see 
+    ``envinfer``) and recorded 'Slow' rows (see ``envslow``) of 
+    ``envtopandas`` of all their rows, rather than the dtypes given by 
+    ``pd.concat``.
+    
+    Parameters:
+    -----------
+        frames (list): EnvDfs created with the same arguments, e.g. by 
+            ``envchunks``.
+        keys (Iterable[str]): If given, the names of the rows of the
+            result, in order, every one of which must be in one of the
+            EnvDfs (default is None).
+    '''
+    nonempty = [frame for frame in frames if not frame.empty] or frames[:1]
+    envdf = pd.concat(nonempty) if len(nonempty) > 1 else nonempty[0]
+    index = pd.Index(envdf.index if keys is None else list(keys), dtype=object, name='Variable')
+    envdf = envdf.reindex(index) if keys is not None else envdf.set_axis(index)
+    envdf = EnvDf(pd.DataFrame(
+        {col: envdf[col].to_numpy(dtype=object) for col in envdf.columns}, index=index,
+    ))
+    
+    if all('slow' in frame.attrs for frame in frames):
+        envdf.attrs['slow'] = tuple(key for frame in frames for key in frame.attrs['slow'])
+        
+    return envdf
+
+def envpatch(envdf: EnvDf, 
+             old: EnvDict, 
+             new: EnvDict, 
+             *args, 
+             names: 'Iterable[str]'=None, 
+             inplace: bool=False,
+             **kwargs) -> EnvDf:
+    '''
+    envpatch(envdf: EnvDf, old: EnvDict, new: EnvDict, *args, 
+        names: Iterable[str]=None, inplace: bool=False, **kwargs) -> EnvDf
+    
+    Returns an EnvDf equal to ``envtopandas(new, *args, **kwargs)``, 
+    dtypes included, by patching ``envdf``, which must have been created 
+    from ``old`` with the same arguments.  Only the rows of added and 
+    rebound names are computed, so the cost grows with the number of 
+    changes rather than the number of names.  If a quarantine is given, 
+    rows with cells it gave the value 'Slow' are computed again too (see
+    ``envslow``), so they are not kept forever.  If nothing has changed, 
+    ``envdf`` itself is returned.
+    
+    If no names were added or removed, the cells of the rows are assigned
+    to a copy of ``envdf`` (or ``envdf`` itself, if ``inplace`` is True)
+    rather than rebuilding it (see ``envconcat``), and only the columns 
+    whose dtype may change are inferred again (see ``envinfer``).
+    
+    See ``envdiff`` and ``envtopandas`` for more infomation.
+    
+    Parameters:
+    -----------
+        envdf (EnvDf): EnvDf created from ``old``.
+        old (EnvDict): Snapshot from which ``envdf`` was created.
+        new (EnvDict): Current snapshot.
+        *args: Positional arguments passed to ``envtopandas``.
+        names (Iterable[str]): If given, only these names are compared, 
+            i.e. ``old`` and ``new`` must not differ in any other name 
+            (default is None).  ``old`` then only needs to hold these 
+            names, e.g. if ``new`` is ``old`` updated inplace.
+        inplace (bool): Weather or not ``envdf`` itself is patched and 
+            returned when no names were added or removed, so the cost does
+            not depend on the number of rows (default is False).
+        **kwargs: Key word arguments passed to ``envtopandas``.
+    '''
+    names = None if names is None else list(names)
+    added, removed, changed = envdiff(old, new, names)
+    quarantine = kwargs.get('quarantine', args[2] if len(args) > 2 else None)
+    retried = [] if quarantine is None else [
+        key for key in envslow(envdf, names) if key in new and key not in changed
+    ]
+    
+    if not (added or removed or changed or retried):
+        return envdf
+    
+    fresh = envtopandas(EnvDict({key: new[key] for key in added + changed + retried}), *args, **kwargs)
+    dropped = set(removed + changed + retried)
+    slow = None if 'slow' not in envdf.attrs else tuple(
+        key for key in envdf.attrs['slow'] if key not in dropped
+    )
+    assignable = all(
+        envdf[col].dtype == object or envdf[col].dtype == fresh[col].dtype 
+        for col in fresh.columns
+    )
+    
+    if not (added or removed) and assignable:
+        envdf = envdf if inplace else EnvDf(envdf.copy())
+        positions = envdf.index.get_indexer(fresh.index).tolist()
+        
+        for col in fresh.columns:
+            j = envdf.columns.get_loc(col)
             
-        envdf[col] = envdf.Value.apply(func)
+            for i, value in zip(positions, fresh[col].tolist()):
+                envdf.iat[i, j] = value
+            
+            if (envdf[col].dtype == object and 
+                pd.api.types.infer_dtype(fresh[col]) in ('string', 'empty') and 
+                pd.api.types.infer_dtype(envdf[col]) == 'string'):
+                envdf[col] = envinfer(envdf[col])
+    else:
+        envdf = envconcat([envdf.drop(index=list(dropped)), fresh], new.keys())
+    
+    if slow is not None:
+        envdf.attrs['slow'] = slow + fresh.attrs['slow']
     
-    for col in attrs.keys():
-        envdf[col] = envdf.Value.apply(lambda x: getattrsafe(x, attrs[col], default=''))
+    return envdf
+
+def envrefresh(envdict: EnvDict, 
+               env: 'Any', 
+               names: 'Iterable[str]', 
+               lazy: bool=False,
+               inplace: bool=False) -> EnvDict:
+    '''
+    envrefresh(envdict: EnvDict, env: Any, names: Iterable[str], 
+        lazy: bool=False, inplace: bool=False) -> EnvDict
+    
+    Returns a copy of an EnvDict of ``env`` in which only the given names
+    have been read from ``env`` again, following the same rules as
+    ``envtodict``.  Names which ``env`` no longer has are removed.  If a 
+    name is added, the keys are sorted as by ``envtodict``.
+    
+    Parameters:
+    -----------
+        envdict (EnvDict): EnvDict previously created from env.
+        env (Any): Any python object.
+        names (Iterable[str]): Names to be read again.
+        lazy (bool): See ``envtodict`` (default is False).
+        inplace (bool): Weather or not ``envdict`` itself is updated and 
+            returned rather than a copy, so the cost only depends on the 
+            number of names, unless a name is added (default is False).
+    '''
+    envdict = envdict if inplace else EnvDict(envdict)
+    added = False
     
-    return EnvDf(envdf)
+    for attr in names:
+        if attr in ('In', 'Out') or attr.startswith('_'):
+            continue
+        
+        kind, static = attrkind(env, attr) if lazy else ('dynamic', None)
+        
+        try:
+            if kind in ('property', 'descriptor'):
+                val = LazyAttr(env, attr, kind, static)
+            else:
+                val = getattr(env, attr)
+        except AttributeError:
+            envdict.pop(attr, None)
+            continue
+        
+        if isinstance(val, EnvObj):
+            envdict.pop(attr, None)
+            continue
+            
+        added = added or attr not in envdict
+        envdict[attr] = val
+        
+    if added and inplace:
+        items = sorted(envdict.items())
+        envdict.clear()
+        envdict.update(items)
+    elif added:
+        envdict = EnvDict(sorted(envdict.items()))
+        
+    return envdict
 
 def envtohtmltable(env: 'Any', 
                    envtopandas_kwargs: dict={}, 
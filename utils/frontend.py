@@ -5,9 +5,14 @@ import pandas as pd
 import numpy as np
 import re
 import time
+import inspect
+import reprlib
+import weakref
 from IPython import get_ipython, display
-from threading import Thread
-from collections.abc import Iterable
+from threading import Thread, Lock, Event, Condition, Timer
+from concurrent.futures import Future
+from collections import OrderedDict, Counter
+from collections.abc import Iterable, Sized
 
 def usename(obj: 'Any') -> str:
     '''
@@ -24,6 +29,258 @@ def usename(obj: 'Any') -> str:
     '''
     return obj.__name__ if hasattr(obj, '__name__') else str(obj)
 
+class LabelRepr(reprlib.Repr):
+    '''
+    LabelRepr(length: int=60, maxsized: int=1000)
+    
+    Child of ``reprlib.Repr`` for creating short labels of objects. 
+    Containers are truncated as by ``reprlib``, and pandas and numpy 
+    objects (and other objects with a tuple 'shape' attribute) are 
+    summarised by their type and shape, and other sized objects with more
+    than ``maxsized`` items by their type and length, so that their full
+    representation is never computed.  Results are cut to at most 
+    ``length`` characters.
+    
+    Parameters:
+    -----------
+        length (int): Maximum number of characters of a label (default 
+            is 60).
+        maxsized (int): Maximum length of a sized object (other than the
+            builtin containers, which are truncated) whose full 
+            representation is computed (default is 1000).
+    '''
+    
+    def __init__(self, length: int=60, maxsized: int=1000):
+        super().__init__()
+        self.length = length
+        self.maxsized = maxsized
+        self.maxstring = self.maxother = length
+        self.maxlevel = 2
+        self.summarised = ('DataFrame', 'Series', 'Index', 'ndarray')
+        
+    def repr(self, obj: 'Any') -> str:
+        label = obj if isinstance(obj, str) else super().repr(obj)
+        return label if len(label) <= self.length else label[:self.length - 3] + '...'
+    
+    def getshape(self, obj: 'Any') -> 'tuple|None':
+        '''
+        self.getshape(obj: Any) -> tuple|None
+        
+        Returns the 'shape' attribute of the given object if it is a tuple,
+        otherwise None.
+        
+        Parameters:
+        -----------
+            obj (Any): Any object.
+        '''
+        try:
+            shape = getattr(obj, 'shape', None)
+        except Exception:
+            return None
+        
+        return shape if isinstance(shape, tuple) else None
+    
+    def getlength(self, obj: 'Any') -> 'int|None':
+        '''
+        self.getlength(obj: Any) -> int|None
+        
+        Returns the length of the given object if it is sized, otherwise 
+        None.
+        
+        Parameters:
+        -----------
+            obj (Any): Any object.
+        '''
+        try:
+            return len(obj) if isinstance(obj, Sized) else None
+        except Exception:
+            return None
+    
+    def summarise(self, obj: 'Any') -> str:
+        shape = 'x'.join(str(n) for n in self.getshape(obj) or ())
+        return f'<{type(obj).__name__} {shape}>'
+    
+    def issummarised(self, obj: 'Any') -> bool:
+        '''
+        self.issummarised(obj: Any) -> bool
+        
+        Returns weather the given object (which is not handled by one of the
+        'repr_...' methods of ``reprlib.Repr``) is labelled by its type and
+        shape, i.e. it is a pandas or numpy object or has a tuple 'shape'
+        attribute.
+        
+        Parameters:
+        -----------
+            obj (Any): Any object.
+        '''
+        if any(base.__name__ in self.summarised for base in type(obj).__mro__):
+            return True
+        
+        return self.getshape(obj) is not None
+    
+    def isstable(self, obj: 'Any') -> bool:
+        '''
+        self.isstable(obj: Any) -> bool
+        
+        Returns weather the label of the given object only depends on its 
+        identity, type and shape or length (see ``LabelCache.getstamp``), 
+        i.e. it cannot change whilst these stay the same:
+        
+            - numpy arrays of more than one item and other summarised 
+              objects (see ``self.issummarised``).
+            - sized objects summarised by their length.
+            - objects using the default ``object.__repr__``.
+            
+        Parameters:
+        -----------
+            obj (Any): Any object.
+        '''
+        typ = type(obj)
+        
+        if hasattr(self, 'repr_' + '_'.join(typ.__name__.split())):
+            return typ.__name__ == 'ndarray' and obj.size > 1
+        
+        if isinstance(obj, np.generic):
+            return False
+        
+        if self.issummarised(obj) or typ.__repr__ is object.__repr__:
+            return True
+        
+        length = self.getlength(obj)
+        
+        return length is not None and length > self.maxsized
+    
+    def repr_ndarray(self, obj: 'Any', level: int) -> str:
+        return self.summarise(obj) if obj.size > 1 else repr(obj)
+    
+    def repr_instance(self, obj: 'Any', level: int) -> str:
+        if isinstance(obj, np.generic):
+            return str(obj)
+        
+        if self.issummarised(obj):
+            return self.summarise(obj)
+        
+        length = self.getlength(obj)
+        
+        if length is not None and length > self.maxsized:
+            return f'<{type(obj).__name__} len={length}>'
+        
+        return super().repr_instance(obj, level)
+    
+class LabelCache:
+    '''
+    LabelCache(length: int=60, maxsize: int=4096)
+    
+    Least recently used cache of labels created by ``LabelRepr``, keyed by
+    object identity and a cheap version stamp (the type and the shape or,
+    for sized objects, the length of the object).
+    
+    Only labels which cannot change whilst the stamp stays the same are 
+    cached (see ``LabelRepr.isstable``), so objects mutated inplace never
+    show stale labels, and objects are only held through weak references,
+    so objects which cannot be weakly referenced are never cached.
+    
+    Labels may be created from any thread (e.g. by ``EnvPrefetcher``).
+    
+    Parameters:
+    -----------
+        length (int): Maximum number of characters of a label (default 
+            is 60).
+        maxsize (int): Maximum number of cached labels (default is 4096).
+    '''
+    
+    def __init__(self, length: int=60, maxsize: int=4096):
+        self.repr = LabelRepr(length)
+        self.maxsize = maxsize
+        self.labels = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        
+    def getstamp(self, obj: 'Any') -> tuple:
+        '''
+        self.getstamp(obj: Any) -> tuple
+        
+        Returns the version stamp of the given object.
+        
+        Parameters:
+        -----------
+            obj (Any): Any object.
+        '''
+        shape = self.repr.getshape(obj)
+        
+        return type(obj), self.repr.getlength(obj) if shape is None else shape
+        
+    def getlabel(self, obj: 'Any') -> str:
+        '''
+        self.getlabel(obj: Any) -> str
+        
+        Returns the label of the given object, from the cache if possible.
+        
+        Parameters:
+        -----------
+            obj (Any): Any object.
+        '''
+        key = id(obj)
+        entry = self.labels.get(key)
+        stamp = None if entry is None else self.getstamp(obj)
+        
+        if entry is not None:
+            ref, oldstamp, label = entry
+            
+            if ref() is obj and oldstamp == stamp:
+                with self.lock:
+                    self.hits += 1
+                    self.labels.move_to_end(key) if key in self.labels else None
+                    
+                return label
+            
+            with self.lock:
+                self.labels.pop(key, None)
+        
+        label = self.repr.repr(obj)
+        
+        with self.lock:
+            self.misses += 1
+        
+        try:
+            ref = weakref.ref(obj)
+        except TypeError:
+            return label
+        
+        if not self.repr.isstable(obj):
+            return label
+        
+        stamp = self.getstamp(obj) if stamp is None else stamp
+        
+        with self.lock:
+            self.labels[key] = (ref, stamp, label)
+            self.labels.move_to_end(key)
+        
+            while len(self.labels) > self.maxsize:
+                self.labels.popitem(last=False)
+            
+        return label
+    
+labelcache = LabelCache()
+
+def uselabel(obj: 'Any') -> str:
+    '''
+    uselabel(obj: Any) -> str
+    
+    Bounded alternative to ``usename``.  Returns obj.__name__ if obj has 
+    a str attribute '__name__', otherwise a label of limited length from
+    ``labelcache`` is returned.
+    
+    See ``LabelCache`` for more infomation.
+    
+    Parameters:
+    -----------
+        obj (Any): Any object.
+    '''
+    name = getattr(obj, '__name__', None)
+    return name if isinstance(name, str) else labelcache.getlabel(obj)
+
 def hboxes(widgets: 'Iterable[[ipw.Widget]]') -> 'tuple[HBox]':
     '''
     hboxes(widgets: Iterable[[ipw.Widgets]]) -> tuple(HBox)
@@ -74,6 +331,241 @@ def arrange(widgets: 'Iterable[Iterable[ipw.Widget]]',
         children=[inner_cls(inner) for inner in widgets]
     )
 
+class MessageCounter:
+    '''
+    MessageCounter()
+    
+    Context manager which counts the messages ipywidgets sends to the 
+    front-end whilst it is active, by method (e.g. 'open', 'update' and
+    'close'), in the 'counts' attribute (a ``collections.Counter``).
+    
+    The counting wrappers are installed on ``ipw.Widget`` when the first 
+    counter is entered and the original methods are restored when the 
+    last active counter exits, so nothing is patched whilst no counter is
+    active.  Note, messages sent by any widget, from any thread, whilst a
+    counter is active are counted.
+    '''
+    
+    active = set()
+    lock = Lock()
+    originals = None
+    wrappers = None
+    
+    def __init__(self):
+        self.counts = Counter()
+        
+    def __repr__(self):
+        return f'MessageCounter({dict(self.counts)!r})'
+        
+    def __enter__(self) -> 'MessageCounter':
+        with self.lock:
+            self.install() if not self.active else None
+            self.active.add(self)
+            
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        with self.lock:
+            self.active.discard(self)
+            self.uninstall() if not self.active else None
+    
+    @property
+    def total_(self) -> int:
+        '''
+        Total number of messages counted.
+        '''
+        return sum(self.counts.values())
+    
+    @classmethod
+    def count(cls, method: str) -> None:
+        '''
+        cls.count(method: str) -> None
+        
+        Adds a message of the given method to every active counter.
+        
+        Parameters:
+        -----------
+            method (str): Method of the message.
+        '''
+        for counter in tuple(cls.active):
+            counter.counts[method] += 1
+    
+    @classmethod
+    def install(cls) -> None:
+        '''
+        cls.install() -> None
+        
+        Wraps the 'open', '_send' and 'close' methods of ``ipw.Widget`` so
+        the messages they send are counted.  Does nothing if already 
+        installed.  Must be called whilst holding the 'lock' attribute.
+        '''
+        if cls.originals is not None:
+            return
+        
+        opener, sender, closer = (ipw.Widget.open, ipw.Widget._send, ipw.Widget.close)
+        
+        def open(widget):
+            cls.count('open') if widget.comm is None else None
+            opener(widget)
+            
+        def send(widget, msg, buffers=None):
+            cls.count(msg.get('method', 'custom'))
+            sender(widget, msg, buffers)
+            
+        def close(widget):
+            cls.count('close') if widget.comm is not None else None
+            closer(widget)
+            
+        cls.originals = (opener, sender, closer)
+        cls.wrappers = (open, send, close)
+        ipw.Widget.open, ipw.Widget._send, ipw.Widget.close = cls.wrappers
+        
+    @classmethod
+    def uninstall(cls) -> None:
+        '''
+        cls.uninstall() -> None
+        
+        Restores the methods wrapped by ``cls.install``, unless they have 
+        since been replaced by someone else.  Does nothing if not 
+        installed.  Must be called whilst holding the 'lock' attribute.
+        '''
+        if cls.originals is None:
+            return
+        
+        for name, original, wrapper in zip(('open', '_send', 'close'), cls.originals, cls.wrappers):
+            setattr(ipw.Widget, name, original) if ipw.Widget.__dict__.get(name) is wrapper else None
+            
+        cls.originals = cls.wrappers = None
+
+class WidgetPool:
+    '''
+    WidgetPool(maxsize: int=2000)
+    
+    Pool of detached widgets, kept by kind, to be rebound and reused 
+    instead of creating new widgets.  Widgets released once the pool 
+    already holds ``maxsize`` widgets of their kind are closed instead, so
+    the number of open widgets stays bounded.
+    
+    Parameters:
+    -----------
+        maxsize (int): Maximum number of widgets kept per kind (default
+            is 2000).
+            
+    Attributes:
+    -----------
+        reused (int): Number of widgets taken from the pool.
+        released (int): Number of widgets kept by the pool.
+        closed (int): Number of widgets closed by the pool.
+    '''
+    
+    def __init__(self, maxsize: int=2000):
+        self.maxsize = maxsize
+        self.widgets = {}
+        self.lock = Lock()
+        self.reused = 0
+        self.released = 0
+        self.closed = 0
+        
+    def __repr__(self):
+        return f'WidgetPool({ {kind: len(stack) for kind, stack in self.widgets.items()}!r})'
+        
+    def __len__(self):
+        return sum(len(stack) for stack in self.widgets.values())
+    
+    def acquire(self, kind: 'Hashable') -> 'ipw.Widget|None':
+        '''
+        self.acquire(kind: Hashable) -> ipw.Widget|None
+        
+        Removes and returns a widget of the given kind from the pool, or 
+        returns None if there is none.
+        
+        Parameters:
+        -----------
+            kind (Hashable): Kind of widget, as given to ``self.release``.
+        '''
+        with self.lock:
+            stack = self.widgets.get(kind)
+            
+            if not stack:
+                return None
+            
+            self.reused += 1
+            
+            return stack.pop()[0]
+        
+    def release(self, 
+                kind: 'Hashable', 
+                widget: ipw.Widget, 
+                close: callable=None) -> None:
+        '''
+        self.release(kind: Hashable, widget: ipw.Widget, 
+            close: callable=None) -> None
+        
+        Adds a detached widget to the pool, or closes it if the pool is 
+        full.
+        
+        Parameters:
+        -----------
+            kind (Hashable): Kind of widget.  Only widgets of the same kind
+                are interchangeable.
+            widget (ipw.Widget): Widget which is no longer displayed.
+            close (callable): Function closing the widget (and anything it 
+                owns).  If None, ``widget.close`` is used (default is None).
+        '''
+        closer = widget.close if close is None else lambda: close(widget)
+        
+        with self.lock:
+            stack = self.widgets.setdefault(kind, [])
+            
+            if len(stack) < self.maxsize:
+                stack.append((widget, closer))
+                self.released += 1
+                return
+            
+            self.closed += 1
+            
+        closer()
+        
+    def clear(self) -> None:
+        '''
+        self.clear() -> None
+        
+        Inplace method for closing and removing every widget in the pool.
+        '''
+        with self.lock:
+            stacks = list(self.widgets.values())
+            self.widgets = {}
+            self.closed += sum(map(len, stacks))
+            
+        for stack in stacks:
+            for widget, close in stack:
+                close()
+
+def closewidgets(widgets: 'Iterable[ipw.Widget]', 
+                 shared: 'Iterable[ipw.Widget]'=()) -> None:
+    '''
+    closewidgets(widgets: Iterable[ipw.Widget], 
+        shared: Iterable[ipw.Widget]=()) -> None
+    
+    Closes the given widgets together with their own 'layout' and 'style'
+    widgets, which ipywidgets leaves open, except for the given shared 
+    layouts and styles.
+    
+    Parameters:
+    -----------
+        widgets (Iterable[ipw.Widget]): Widgets to close.
+        shared (Iterable[ipw.Widget]): Layouts and styles used by other 
+            widgets, which are left open (default is ()).
+    '''
+    shared = {id(widget) for widget in shared}
+    
+    for widget in widgets:
+        for name in ('layout', 'style'):
+            part = getattr(widget, name, None)
+            part.close() if isinstance(part, ipw.Widget) and id(part) not in shared else None
+            
+        widget.close()
+
 def inthread(func: callable) -> 'function':
     '''
     inthread(func: callable) -> function
@@ -90,6 +582,128 @@ def inthread(func: callable) -> 'function':
         Thread(target=func, args=args, kwargs=kwargs).start()
     return wrapper
 
+class CoalescingExecutor:
+    '''
+    CoalescingExecutor(merge: callable=None)
+    
+    Runs submitted calls one at a time in a single worker thread.  A call
+    submitted whilst another is running is merged with any call still 
+    pending rather than queueing behind it, so at most one call runs and 
+    one waits no matter how often calls are submitted.  The futures of 
+    merged calls receive the result of the call they were merged into.
+    
+    The worker thread is started when needed and exits once there is
+    nothing pending.
+    
+    Parameters:
+    -----------
+        merge (callable): Function called with the pending call and the 
+            submitted call, each a (func, args, kwargs) tuple, returning 
+            the call which replaces both.  If None, the submitted call
+            replaces the pending call (default is None).
+            
+    Attributes:
+    -----------
+        closed (bool): Weather ``self.shutdown`` has been called.
+    '''
+    
+    def __init__(self, merge: callable=None):
+        self.merge = merge
+        self.lock = Lock()
+        self.pending = None
+        self.worker = None
+        self.closed = False
+        
+    @property
+    def running_(self) -> bool:
+        '''
+        Weather the worker thread is alive.
+        '''
+        return self.worker is not None
+    
+    def submit(self, func: callable, *args, **kwargs) -> Future:
+        '''
+        self.submit(func: callable, *args, **kwargs) -> Future
+        
+        Schedules ``func(*args, **kwargs)``, merging it with any pending 
+        call (see the 'merge' attribute), and returns a 
+        ``concurrent.futures.Future`` for its result.  Use 
+        ``asyncio.wrap_future`` to await it.  Once the executor is shut 
+        down, the future is returned cancelled and func is never called.
+        
+        Parameters:
+        -----------
+            func (callable): Function to be called.
+            *args: Positional arguments passed to func.
+            **kwargs: Key word arguments passed to func.
+        '''
+        future = Future()
+        
+        with self.lock:
+            if self.closed:
+                future.cancel()
+                return future
+            
+            call = (func, args, kwargs)
+            
+            if self.pending is None:
+                futures = []
+            else:
+                futures = self.pending[3]
+                call = call if self.merge is None else self.merge(self.pending[:3], call)
+                
+            futures.append(future)
+            self.pending = (*call, futures)
+            
+            if self.worker is None:
+                self.worker = Thread(target=self.run, daemon=True)
+                self.worker.start()
+                
+        return future
+    
+    def run(self) -> None:
+        '''
+        self.run() -> None
+        
+        Target of the worker thread.  Runs pending calls until there are
+        none left.
+        '''
+        while True:
+            with self.lock:
+                if self.pending is None:
+                    self.worker = None
+                    return
+                
+                func, args, kwargs, futures = self.pending
+                self.pending = None
+                
+            futures = [future for future in futures if future.set_running_or_notify_cancel()]
+            
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                for future in futures:
+                    future.set_exception(exc)
+            else:
+                for future in futures:
+                    future.set_result(result)
+                    
+    def shutdown(self) -> None:
+        '''
+        self.shutdown() -> None
+        
+        Inplace method for closing the executor: the pending call, if any,
+        is dropped and its futures are cancelled, and later calls of 
+        ``self.submit`` return cancelled futures.  A call already running
+        is left to finish in the worker thread, which then exits.
+        '''
+        with self.lock:
+            self.closed = True
+            pending, self.pending = self.pending, None
+            
+        for future in (pending[3] if pending is not None else ()):
+            future.cancel()
+
 def ishtml(string: str) -> bool:
     '''
     ishtml(string: str) -> bool
@@ -130,6 +744,26 @@ def showobj(obj: 'Any') -> None:
         
     display.display(disp)
 
+def showcell(obj: 'Any', head: str, out: ipw.Output) -> None:
+    '''
+    showcell(obj: Any, head: str, out: ipw.Output) -> None
+    
+    Prints the given heading, underlined, followed by the given object, 
+    using ``showobj``, in the given Output widget.  Used to show the value 
+    of a clicked cell.
+    
+    See ``showobj`` for more infomation.
+    
+    Parameters:
+    -----------
+        obj (Any): Any object.
+        head (str): Heading, e.g. the index and column of the cell.
+        out (ipw.Output): Output widget in which to display the object.
+    '''
+    with out:
+        print(f'\n{head}\n{"=" * len(head)}')
+        showobj(obj)
+
 def runperiodic(func: callable, interval: float=5) -> None:
     '''
     runperiodic(func: callable, interval: float=5) -> None
@@ -151,6 +785,200 @@ def runperiodic(func: callable, interval: float=5) -> None:
         Thread(target=run, args=args, kwargs=kwargs).start()
     return wrapper
 
+class PeriodicScheduler:
+    '''
+    PeriodicScheduler(func: callable, interval: float=5, adaptive: bool=False,
+        max_interval: float=None, load: float=0.5)
+    
+    Calls a function periodically in its own thread and, unlike 
+    ``runperiodic``, can be paused, resumed and stopped.  Waiting is done on
+    an event and a condition, so a paused or stopped scheduler does not keep
+    waking up.
+    
+    Bound methods are only held through a weak reference, so the scheduler
+    stops by itself once their object has been garbage collected.
+    
+    Exceptions raised by the function do not stop the scheduler.  The last
+    one is stored in the 'error' attribute (which is reset to None by the 
+    next successful call) and counted by the 'errors' attribute.
+    
+    Parameters:
+    -----------
+        func (callable): Function, called without arguments.
+        interval (float): Number of seconds waiting between calls (default
+            is 5).
+        adaptive (bool): If True, the interval is doubled (up to 
+            ``max_interval``) whenever a call takes longer than ``load`` 
+            times the interval, and halved (down to ``interval``) whenever
+            a call takes less than a quarter of that (default is False).
+        max_interval (float): Upper limit of the adaptive interval.  If 
+            None, ten times ``interval`` is used (default is None).
+        load (float): Fraction of the interval a call may take before the
+            adaptive interval is stretched (default is 0.5).
+    '''
+    
+    def __init__(self,
+                 func: callable,
+                 interval: float=5,
+                 adaptive: bool=False,
+                 max_interval: float=None,
+                 load: float=0.5):
+        self.func = weakref.WeakMethod(func) if inspect.ismethod(func) else (lambda: func)
+        self.base_interval = self.interval = interval
+        self.adaptive = adaptive
+        self.max_interval = interval * 10 if max_interval is None else max_interval
+        self.load = load
+        self.cost = None
+        self.error = None
+        self.errors = 0
+        self.thread = None
+        self.paused = False
+        self.stopped = Event()
+        self.condition = Condition()
+        
+    @property
+    def running_(self) -> bool:
+        '''
+        Weather the scheduler has been started and not stopped.
+        '''
+        return self.thread is not None and not self.stopped.is_set()
+    
+    def start(self) -> None:
+        '''
+        self.start() -> None
+        
+        Starts calling the function in a new thread, unless already running.
+        '''
+        if self.running_:
+            return
+        
+        self.stopped = Event()
+        self.thread = Thread(target=self.run, args=(self.stopped,), daemon=True)
+        self.thread.start()
+        
+    def stop(self) -> None:
+        '''
+        self.stop() -> None
+        
+        Stops the scheduler.  A call in progress is allowed to finish.
+        '''
+        self.stopped.set()
+        self.thread = None
+        
+        with self.condition:
+            self.condition.notify_all()
+        
+    def pause(self) -> None:
+        '''
+        self.pause() -> None
+        
+        Pauses the scheduler until ``self.resume`` is called.
+        '''
+        with self.condition:
+            self.paused = True
+        
+    def resume(self) -> None:
+        '''
+        self.resume() -> None
+        
+        Resumes a paused scheduler.
+        '''
+        with self.condition:
+            self.paused = False
+            self.condition.notify_all()
+        
+    def adapt(self) -> None:
+        '''
+        self.adapt() -> None
+        
+        Inplace method for adjusting the 'interval' attribute to the cost 
+        of the last call.  Does nothing if the scheduler is not adaptive.
+        '''
+        if not self.adaptive or self.cost is None:
+            return
+        
+        if self.cost > self.load * self.interval:
+            self.interval = min(self.max_interval, self.interval * 2)
+        elif self.cost < self.load * self.interval / 4:
+            self.interval = max(self.base_interval, self.interval / 2)
+        
+    def run(self, stopped: Event) -> None:
+        '''
+        self.run(stopped: Event) -> None
+        
+        Target of the scheduler's thread.
+        
+        Parameters:
+        -----------
+            stopped (Event): Event which ends the thread once set.
+        '''
+        try:
+            while not stopped.is_set():
+                with self.condition:
+                    self.condition.wait_for(lambda: stopped.is_set() or not self.paused)
+                    
+                func = self.func()
+                
+                if func is None or stopped.is_set():
+                    break
+                
+                started = time.perf_counter()
+                
+                try:
+                    func()
+                    self.error = None
+                except Exception as exc:
+                    self.error = exc
+                    self.errors += 1
+                    
+                self.cost = time.perf_counter() - started
+                del func
+                
+                self.adapt()
+                stopped.wait(self.interval)
+        finally:
+            self.thread = None if stopped is self.stopped else self.thread
+
+class Debouncer:
+    '''
+    Debouncer(func: callable, delay: float=0)
+    
+    Calls a function once a given delay has passed since it was last 
+    requested, so a burst of requests results in a single call.  If the 
+    delay is 0, the function is called immediately on each request.
+    
+    Parameters:
+    -----------
+        func (callable): Function to be called.
+        delay (float): Number of seconds without requests before the 
+            function is called (default is 0).
+    '''
+    
+    def __init__(self, func: callable, delay: float=0):
+        self.func = func
+        self.delay = delay
+        self.timer = None
+        
+    def __call__(self, *args, **kwargs) -> None:
+        self.cancel()
+        
+        if not self.delay:
+            self.func(*args, **kwargs)
+            return
+        
+        self.timer = Timer(self.delay, self.func, args=args, kwargs=kwargs)
+        self.timer.daemon = True
+        self.timer.start()
+        
+    def cancel(self) -> None:
+        '''
+        self.cancel() -> None
+        
+        Cancels a pending call, if any.
+        '''
+        self.timer.cancel() if self.timer is not None else None
+        self.timer = None
+
 def runperiodicfactory(interval: float=5) -> None:
     '''
     runperiodicfactory(interval: float=5) -> None